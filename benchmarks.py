@@ -0,0 +1,949 @@
+"""Benchmarks de desempenho do Sistema de Torneios Commander.
+
+Uso:
+    python benchmarks.py carregamento
+    python benchmarks.py emparelhamento
+    python benchmarks.py emparelhamento_paralelo
+    python benchmarks.py classificacao
+    python benchmarks.py pontuacao_lote
+    python benchmarks.py tabela_pontuacao
+    python benchmarks.py simulacao
+    python benchmarks.py reproducao
+    python benchmarks.py colusao
+    python benchmarks.py grafo_colusao
+    python benchmarks.py relatorio
+    python benchmarks.py visoes
+    python benchmarks.py memoria
+    python benchmarks.py historico
+"""
+import argparse
+import contextlib
+import gc
+import hashlib
+import io
+import itertools
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from prototipo import (
+    AnaliseGrafoColusao, CalculadorIndiceDesempenho, Classificacao, Deck, DetectorColusao, Eliminacao, GeradorRelatorio, HistoricoColunar, Inscricao, Jogador, Partida, Persistencia, PersistenciaSQLite, SistemaDesempate, SistemaEmparelhamento,
+    SistemaTorneioCommander, Torneio, VisoesRelatorio
+)
+from simulador import SimuladorTorneio, simular
+
+
+def _gerar_snapshot(num_jogadores: int, num_torneios: int, num_decks: int, jogadores_por_torneio: int = 64, semente: int = 42) -> dict:
+    """Gera um snapshot sintético no mesmo formato de dados_sistema.json"""
+    rng = random.Random(semente)
+    jogadores = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "nome": f"Jogador-{i}",
+            "email": f"jogador{i}@exemplo.com",
+            "indice_desempenho": round(rng.uniform(0, 300), 2),
+            "vitorias_isoladas": rng.randint(0, 5),
+            "senha_hash": "Senha123"
+        }
+        for i in range(num_jogadores)
+    ]
+    torneios = []
+    for i in range(num_torneios):
+        inscritos = rng.sample(jogadores, min(jogadores_por_torneio, num_jogadores))
+        torneios.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "nome": f"Torneio-{i}",
+            "data": datetime(2025, 1, 1).isoformat(),
+            "rodadas": 6,
+            "min_jogadores": 4,
+            "jogadores": [j["id"] for j in inscritos],
+            "juizes": [],
+            "rodada_atual": 6,
+            "inscricoes_abertas": False,
+            "tempo_rodada": "0:45:00",
+            "turnos_extras": 5
+        })
+    decks = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "jogador_id": jogadores[i % num_jogadores]["id"],
+            "comandante": f"Comandante-{i % 500}",
+            "validado": True,
+            "torneio_id": None,
+            "ativo": True
+        }
+        for i in range(num_decks)
+    ]
+    return {"seq_journal": 0, "torneios": torneios, "jogadores": jogadores, "juizes": [], "decks": decks, "partidas_ativas": []}
+
+
+def _medir(funcao) -> float:
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def benchmark_carregamento(escalas: Optional[List[Tuple[int, int, int]]] = None) -> List[Dict]:
+    """Mede o tempo de carregamento do estado em escalas crescentes de jogadores, torneios e decks"""
+    escalas = escalas or [(10_000, 50, 20_000), (25_000, 125, 50_000), (50_000, 250, 100_000), (100_000, 500, 200_000)]
+    resultados = []
+    print(f"{'jogadores':>10} {'torneios':>9} {'decks':>8} {'json (s)':>9} {'objetos (s)':>12} {'µs/entidade':>12}")
+    for num_jogadores, num_torneios, num_decks in escalas:
+        texto = json.dumps(_gerar_snapshot(num_jogadores, num_torneios, num_decks), ensure_ascii=False)
+        dados = {}
+        tempo_json = _medir(lambda: dados.update(json.loads(texto)))
+        sistema = SistemaTorneioCommander(modo_persistencia="json")
+        tempo_objetos = _medir(lambda: Persistencia._carregar_snapshot(sistema, dados))
+        entidades = num_jogadores + num_torneios + num_decks + sum(len(t["jogadores"]) for t in dados["torneios"])
+        por_entidade = (tempo_json + tempo_objetos) / entidades * 1e6
+        print(f"{num_jogadores:>10} {num_torneios:>9} {num_decks:>8} {tempo_json:>9.3f} {tempo_objetos:>12.3f} {por_entidade:>12.2f}")
+        resultados.append({
+            "jogadores": num_jogadores,
+            "torneios": num_torneios,
+            "decks": num_decks,
+            "tempo_json": tempo_json,
+            "tempo_objetos": tempo_objetos,
+            "us_por_entidade": por_entidade
+        })
+    return resultados
+
+
+def _gerar_torneio(num_jogadores: int, rodadas_anteriores: int, semente: int = 42) -> Tuple[Torneio, SistemaEmparelhamento]:
+    """Gera um torneio sintético com IDs aleatórios e histórico de oponentes de rodadas anteriores"""
+    rng = random.Random(semente)
+    torneio = Torneio("Benchmark", 4)
+    for i in range(num_jogadores):
+        jogador = Jogador(f"Jogador-{i}", f"jogador{i}@exemplo.com")
+        jogador.indice_desempenho = rng.uniform(18.25, 100.0) * rodadas_anteriores
+        torneio.jogadores.append(jogador)
+    emparelhamento = SistemaEmparelhamento()
+    for _ in range(rodadas_anteriores):
+        embaralhados = torneio.jogadores.copy()
+        rng.shuffle(embaralhados)
+        for inicio in range(0, num_jogadores - num_jogadores % 4, 4):
+            torneio.historico_oponentes.registrar_mesa([j.id for j in embaralhados[inicio:inicio + 4]])
+    torneio.rodada_atual = rodadas_anteriores
+    return torneio, emparelhamento
+
+
+def benchmark_emparelhamento(tamanhos: Optional[List[int]] = None, rodadas_anteriores: int = 3) -> List[Dict]:
+    """Mede o tempo e a qualidade da distribuição de mesas de 16 a 2.000 jogadores"""
+    tamanhos = tamanhos or [16, 64, 256, 512, 1000, 2000]
+    resultados = []
+    print(f"{'jogadores':>10} {'tempo (s)':>10} {'iterações':>10} {'custo':>9} {'repetições':>11} {'fora tol.':>10}")
+    for num_jogadores in tamanhos:
+        random.seed(num_jogadores)
+        torneio, emparelhamento = _gerar_torneio(num_jogadores, rodadas_anteriores)
+        tempo = _medir(lambda: emparelhamento.distribuir_jogadores(torneio))
+        r = emparelhamento.ultimo_resultado
+        print(f"{num_jogadores:>10} {tempo:>10.3f} {r['iteracoes']:>10} {r['custo']:>9.4f} {r['repeticoes']:>11} {r['mesas_fora_tolerancia']:>10}")
+        resultados.append({"jogadores": num_jogadores, "tempo": tempo, **r})
+    return resultados
+
+
+def benchmark_emparelhamento_paralelo(tamanhos: Optional[List[int]] = None, processos: Optional[List[int]] = None) -> List[Dict]:
+    """Compara a busca de processo único com a busca paralela de múltiplos inícios
+
+    A segunda rodada de cada configuração reaproveita o pool de processos da primeira.
+    """
+    tamanhos = tamanhos or [256, 1000, 2000]
+    processos = processos or [1, 2, 4]
+    resultados = []
+    print(f"{'jogadores':>10} {'processos':>10} {'tempo (s)':>10} {'2ª rodada (s)':>14} {'custo':>9} {'repetições':>11} {'semente':>11}")
+    for num_jogadores in tamanhos:
+        for num_processos in processos:
+            torneio, _ = _gerar_torneio(num_jogadores, 3)
+            emparelhamento = SistemaEmparelhamento(processos=num_processos, semente=7)
+            tempo = _medir(lambda: emparelhamento.distribuir_jogadores(torneio))
+            r = emparelhamento.ultimo_resultado
+            torneio.rodada_atual += 1
+            tempo_segunda = _medir(lambda: emparelhamento.distribuir_jogadores(torneio))
+            emparelhamento.fechar()
+            print(f"{num_jogadores:>10} {num_processos:>10} {tempo:>10.3f} {tempo_segunda:>14.3f} {r['custo']:>9.4f} {r['repeticoes']:>11} {r['semente']:>11}")
+            resultados.append({"jogadores": num_jogadores, "processos": num_processos, "tempo": tempo, "tempo_segunda_rodada": tempo_segunda, **r})
+    return resultados
+
+
+def benchmark_classificacao(tamanhos: Optional[List[int]] = None, atualizacoes: int = 2000, k: int = 8) -> List[Dict]:
+    """Compara a classificação incremental com a reordenação completa a cada consulta de top-k"""
+    tamanhos = tamanhos or [64, 512, 2000, 10_000]
+    resultados = []
+    print(f"{'jogadores':>10} {'atualizações':>13} {'incremental (s)':>16} {'reordenação (s)':>16} {'confere':>8}")
+    for num_jogadores in tamanhos:
+        rng = random.Random(num_jogadores)
+        torneio, _ = _gerar_torneio(num_jogadores, 3)
+        torneio.classificacao.reconstruir(torneio.jogadores)
+        alteracoes = [(rng.choice(torneio.jogadores), rng.uniform(0, 300)) for _ in range(atualizacoes)]
+
+        def ordenacao_completa():
+            return sorted(
+                torneio.jogadores,
+                key=lambda x: (x.indice_desempenho, SistemaDesempate.calcular_forca_oponentes(x), x.vitorias_isoladas),
+                reverse=True
+            )
+
+        def incremental():
+            for jogador, indice in alteracoes:
+                jogador.indice_desempenho = indice
+                Classificacao.atualizar_jogador(jogador)
+                torneio.classificacao.top(k)
+
+        def reordenacao():
+            for jogador, indice in alteracoes:
+                jogador.indice_desempenho = indice
+                ordenacao_completa()[:k]
+
+        tempo_incremental = _medir(incremental)
+        tempo_reordenacao = _medir(reordenacao)
+        confere = torneio.classificacao.top(num_jogadores) == ordenacao_completa()
+        print(f"{num_jogadores:>10} {atualizacoes:>13} {tempo_incremental:>16.4f} {tempo_reordenacao:>16.4f} {'sim' if confere else 'NÃO':>8}")
+        resultados.append({
+            "jogadores": num_jogadores,
+            "atualizacoes": atualizacoes,
+            "tempo_incremental": tempo_incremental,
+            "tempo_reordenacao": tempo_reordenacao,
+            "confere": confere
+        })
+    return resultados
+
+
+def benchmark_pontuacao_lote(tamanhos: Optional[List[int]] = None) -> List[Dict]:
+    """Compara o cálculo do ID jogador a jogador com o cálculo vetorizado e confere igualdade bit a bit"""
+    tamanhos = tamanhos or [1_000, 10_000, 100_000, 1_000_000]
+    resultados = []
+    print(f"{'jogadores':>10} {'individual (s)':>15} {'lote (s)':>9} {'idênticos':>10}")
+    for num_jogadores in tamanhos:
+        rng = random.Random(num_jogadores)
+        nomes = list(CalculadorIndiceDesempenho.CODIGOS_RESULTADO)
+        colunas = {
+            "resultados": [rng.choice(nomes) for _ in range(num_jogadores)],
+            "turnos": [rng.randint(1, 30) for _ in range(num_jogadores)],
+            "vidas_finais": [rng.randint(-5, 60) for _ in range(num_jogadores)],
+            "oponentes_danificados": [rng.randint(0, 3) for _ in range(num_jogadores)],
+            "jogadores_mesa": [rng.choice((3, 4)) for _ in range(num_jogadores)],
+        }
+        colunas["eliminacoes"] = [rng.randint(0, mesa - 1) for mesa in colunas["jogadores_mesa"]]
+        linhas = list(zip(colunas["resultados"], colunas["turnos"], colunas["eliminacoes"],
+                          colunas["vidas_finais"], colunas["oponentes_danificados"], colunas["jogadores_mesa"]))
+
+        individuais = []
+        tempo_individual = _medir(lambda: individuais.extend(CalculadorIndiceDesempenho.calcular_pontuacao(*linha) for linha in linhas))
+        lote = []
+        tempo_lote = _medir(lambda: lote.extend(CalculadorIndiceDesempenho.calcular_lote(
+            CalculadorIndiceDesempenho.codificar_resultados(colunas["resultados"]),
+            colunas["turnos"], colunas["eliminacoes"], colunas["vidas_finais"],
+            colunas["oponentes_danificados"], colunas["jogadores_mesa"]
+        )))
+        ids_individuais = np.array([i for i, _ in individuais], dtype=np.float64)
+        validos_individuais = np.array([v for _, v in individuais])
+        identicos = (
+            np.array_equal(ids_individuais.view(np.uint64), lote[0].view(np.uint64))
+            and np.array_equal(validos_individuais, lote[1])
+        )
+        print(f"{num_jogadores:>10} {tempo_individual:>15.3f} {tempo_lote:>9.3f} {'sim' if identicos else 'NÃO':>10}")
+        resultados.append({
+            "jogadores": num_jogadores,
+            "tempo_individual": tempo_individual,
+            "tempo_lote": tempo_lote,
+            "identicos": identicos
+        })
+    return resultados
+
+
+def benchmark_tabela_pontuacao(consultas: int = 200_000) -> Dict:
+    """Confere a tabela de pontuação exaustivamente e compara a consulta com o cálculo pela fórmula"""
+    calc = CalculadorIndiceDesempenho
+    calc._tabela_pontuacao = None
+    tempo_construcao = _medir(calc.tabela_pontuacao)
+    verificadas = calc.conferir_tabela()
+    rng = random.Random(consultas)
+    entradas = []
+    for _ in range(consultas):
+        mesa = rng.choice((3, 4))
+        entradas.append((rng.choice(list(calc.CODIGOS_RESULTADO)), rng.randint(1, 30), rng.randint(0, mesa - 1),
+                         rng.randint(0, 40), rng.randint(0, mesa - 1), mesa))
+    tempo_formula = _medir(lambda: [calc.calcular_pontuacao(*e) for e in entradas])
+    tempo_tabela = _medir(lambda: [calc.consultar_pontuacao(*e) for e in entradas])
+    ids, validos = calc.tabela_pontuacao()
+    tamanho = (ids.nbytes + validos.nbytes) / 2 ** 20
+    print(f"Tabela: {ids.size} entradas ({tamanho:.2f} MB) construídas em {tempo_construcao:.3f}s, {verificadas} conferidas contra a fórmula")
+    print(f"{consultas} consultas: fórmula {tempo_formula:.3f}s | tabela {tempo_tabela:.3f}s")
+    return {
+        "entradas": ids.size,
+        "tamanho_mb": tamanho,
+        "verificadas": verificadas,
+        "tempo_construcao": tempo_construcao,
+        "tempo_formula": tempo_formula,
+        "tempo_tabela": tempo_tabela
+    }
+
+
+def _gerar_temporada(num_jogadores: int, num_torneios: int, jogadores_por_torneio: int, semente: int = 42) -> Tuple[SistemaTorneioCommander, List[Tuple[str, dict]]]:
+    """Joga uma temporada de torneios sucessivos com um mesmo grupo de jogadores
+
+    Retorna o sistema em memória e a lista de operações, na ordem em que o
+    menu as registraria: cadastros, inscrições, rodadas, eliminações,
+    resultados, penalidades (com uma desclassificação ao fim de cada torneio)
+    e denúncias.
+    """
+    rng = random.Random(semente)
+    sistema = SistemaTorneioCommander(modo_persistencia="json")
+    cadastros = sistema.gerenciador_cadastros
+    gerenciador = sistema.gerenciador_torneio
+    gerenciador.emparelhamento = SistemaEmparelhamento(tempo_limite=float("inf"), max_iteracoes=200, semente=semente)
+    operacoes = []
+    for i in range(num_jogadores):
+        jogador = Jogador(f"Jogador-{i}", f"jogador{i}@temporada.com")
+        jogador.id = f"{semente}-{i}"
+        jogador.definir_senha("Senha123")
+        cadastros.adicionar_jogador(jogador)
+        operacoes.append(("jogador", Persistencia._serializar_jogador(jogador)))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for t in range(num_torneios):
+            torneio = gerenciador.configurar_torneio(f"Etapa {t + 1}", 4)
+            operacoes.append(("torneio", Persistencia._serializar_torneio(torneio)))
+            for jogador in rng.sample(cadastros.jogadores, jogadores_por_torneio):
+                deck = cadastros.cadastrar_deck(jogador, f"Comandante-{rng.randrange(500)}")
+                operacoes.append(("deck", Persistencia._serializar_deck(deck)))
+                cadastros.validar_deck(deck, torneio)
+                gerenciador.inscrever_jogador(torneio, jogador, deck)
+                torneio.adicionar_jogador(jogador)
+                operacoes.append(("inscricao", {"torneio_id": torneio.id, "jogador_id": jogador.id, "deck_id": deck.id}))
+            torneio.rodadas = gerenciador.calcular_rodadas(len(torneio.jogadores))
+            torneio.inscricoes_abertas = False
+            operacoes.append(("torneio", Persistencia._serializar_torneio(torneio)))
+
+            while torneio.rodada_atual < torneio.rodadas:
+                partidas = list(gerenciador.iniciar_rodada(torneio))
+                operacoes.append(("rodada", {
+                    "torneio_id": torneio.id,
+                    "rodada_atual": torneio.rodada_atual,
+                    "partidas": [Persistencia._serializar_partida(p) for p in partidas],
+                    "historico_oponentes": Persistencia._serializar_historico(torneio.historico_oponentes)
+                }))
+                for partida in partidas:
+                    eliminacoes, resultados = SimuladorTorneio.sortear_mesa(partida, torneio, rng)
+                    for e in eliminacoes:
+                        eliminacao = gerenciador.registrar_eliminacao(torneio, partida, e.jogador_eliminado, e.jogador_causador, e.turno)
+                        operacoes.append(("eliminacao", {"partida_id": partida.id, **Persistencia._serializar_eliminacao(eliminacao)}))
+                    gerenciador.registrar_resultados_mesa(torneio, partida, resultados)
+                    operacoes.append(("resultado", sistema._dados_resultado(partida)))
+
+                penalizados = rng.sample(torneio.jogadores, 2)
+                tipos = ["ADVERTENCIA", "REDUCAO_ID"]
+                if torneio.rodada_atual == torneio.rodadas:
+                    tipos[1] = "DESCLASSIFICACAO"
+                for jogador, tipo in zip(penalizados, tipos):
+                    torneio.anti_colusao.aplicar_penalidade(jogador, tipo, torneio)
+                    operacoes.append(("penalidade", {
+                        "jogador_id": jogador.id,
+                        "torneio_id": torneio.id,
+                        "tipo": tipo,
+                        "data": jogador.penalidades[-1]["data"].isoformat(),
+                        "indice_desempenho": jogador.indice_desempenho
+                    }))
+                denunciado = rng.choice(torneio.jogadores)
+                denuncia = torneio.anti_colusao.registrar_denuncia(denunciado, f"Conluio na rodada {torneio.rodada_atual}")
+                operacoes.append(("denuncia", {"torneio_id": torneio.id, "jogador_id": denunciado.id, "descricao": denuncia["descricao"], "data": denuncia["data"].isoformat()}))
+    return sistema, operacoes
+
+
+def _historico_colunar(historico: HistoricoColunar, jogador_id: str) -> list:
+    """Partidas do jogador no histórico colunar: id, ids da mesa, resultado, ID e eliminações"""
+    c = historico.colunas_jogador(jogador_id)
+    ids = [j.id for j in historico.jogadores]
+    mesas = [ids[i] for i in c["mesas"].tolist()]
+    limites = np.cumsum(c["jogadores"]).tolist()
+    eliminacoes = [
+        (posicao, ids[eliminado], ids[causador] if causador >= 0 else None, turno, desistiu)
+        for posicao, eliminado, causador, turno, desistiu in zip(*(c[nome].tolist() for nome in ("posicao", "eliminado", "causador", "turno", "desistiu")))
+    ]
+    return [
+        (historico.ids_partidas[numero], mesas[fim - tamanho:fim], resultado, pontuacao, [e for e in eliminacoes if e[0] == k])
+        for k, (numero, resultado, pontuacao, tamanho, fim) in enumerate(zip(
+            c["partida"].tolist(), c["resultado"].tolist(), c["pontuacao"].tolist(), c["jogadores"].tolist(), limites
+        ))
+    ]
+
+
+def _assinatura_estado(sistema: SistemaTorneioCommander) -> str:
+    """Resumo do estado reconstruível: agregados, histórico (também o colunar) e penalidades dos jogadores, partidas, logs, classificações e estatísticas de pares"""
+    partes = []
+    historico = sistema.gerenciador_torneio.historico
+    for j in sorted(sistema.gerenciador_cadastros.jogadores, key=lambda j: j.id):
+        partes.append(repr((
+            j.id, float(j.indice_desempenho), j.vitorias_isoladas, j.soma_ids_oponentes, j.num_oponentes,
+            [p.id for p in j.historico_partidas], [(p["tipo"], p["torneio"], p["data"].isoformat()) for p in j.penalidades],
+            _historico_colunar(historico, j.id)
+        )))
+    for t in sistema.gerenciador_torneio.torneios:
+        partes.append(repr((
+            t.id, t.rodada_atual, [j.id for j in t.classificacao.top(len(t.classificacao))],
+            [(p.id, p.rodada, sorted(p.pontuacoes.items()), sorted((k, sorted(v.items())) for k, v in p.resultados.items()),
+              [(e.jogador_eliminado.id, e.jogador_causador.id if e.jogador_causador else None, e.turno) for e in p.eliminacoes])
+             for p in t.partidas_concluidas],
+            t.anti_colusao.logs_suspeitos,
+            [(d["jogador_id"], d["descricao"], d["data"].isoformat()) for d in t.anti_colusao.denuncias],
+            sorted(t.anti_colusao.detector.pares.items())
+        )))
+    partes.append(repr(sorted(sistema.gerenciador_torneio.detector_colusao.pares.items())))
+    return hashlib.sha256("\n".join(partes).encode("utf-8")).hexdigest()[:16]
+
+
+def benchmark_reproducao(escalas: Optional[List[Tuple[int, int, int]]] = None) -> List[Dict]:
+    """Mede o tempo de inicialização de uma temporada: reaplicação do journal, snapshot compactado e SQLite
+
+    Em cada escala, o estado reconstruído por cada caminho é comparado com o
+    estado em memória ao final da temporada.
+    """
+    escalas = escalas or [(256, 12, 64), (1000, 52, 128), (2000, 52, 256)]
+    resultados = []
+    print(f"{'jogadores':>10} {'torneios':>9} {'partidas':>9} {'operações':>10} {'journal (s)':>12} {'snapshot (s)':>13} {'sqlite (s)':>11} {'confere':>8}")
+    for num_jogadores, num_torneios, jogadores_por_torneio in escalas:
+        sistema, operacoes = _gerar_temporada(num_jogadores, num_torneios, jogadores_por_torneio)
+        esperada = _assinatura_estado(sistema)
+        partidas = sum(len(t.partidas_concluidas) for t in sistema.gerenciador_torneio.torneios)
+        with tempfile.TemporaryDirectory() as diretorio, contextlib.redirect_stdout(io.StringIO()):
+            caminho = os.path.join(diretorio, "dados_sistema.json")
+            Persistencia.registrar_operacoes(sistema, operacoes, caminho)
+            banco = PersistenciaSQLite(os.path.join(diretorio, "dados_sistema.db"))
+            banco.registrar_operacoes(sistema, operacoes)
+
+            reaplicado = SistemaTorneioCommander(modo_persistencia="json")
+            tempo_journal = _medir(lambda: Persistencia.carregar_estado(reaplicado, caminho))
+            Persistencia.compactar(reaplicado, caminho)
+            do_snapshot = SistemaTorneioCommander(modo_persistencia="json")
+            tempo_snapshot = _medir(lambda: Persistencia.carregar_estado(do_snapshot, caminho))
+            do_banco = SistemaTorneioCommander(modo_persistencia="json")
+            tempo_sqlite = _medir(lambda: banco.carregar_estado(do_banco))
+            banco.fechar()
+        confere = all(_assinatura_estado(s) == esperada for s in (reaplicado, do_snapshot, do_banco))
+        print(f"{num_jogadores:>10} {num_torneios:>9} {partidas:>9} {len(operacoes):>10} {tempo_journal:>12.3f} {tempo_snapshot:>13.3f} {tempo_sqlite:>11.3f} {'ok' if confere else 'DIVERGE':>8}")
+        resultados.append({
+            "jogadores": num_jogadores,
+            "torneios": num_torneios,
+            "partidas": partidas,
+            "operacoes": len(operacoes),
+            "tempo_journal": tempo_journal,
+            "tempo_snapshot": tempo_snapshot,
+            "tempo_sqlite": tempo_sqlite,
+            "confere": confere
+        })
+    return resultados
+
+
+def _gerar_partidas_colusao(num_partidas: int, num_jogadores: int, semente: int = 42) -> List[Tuple[Partida, Dict[str, dict]]]:
+    """Gera partidas de mesas sorteadas com resultados válidos; os dois primeiros jogadores estão em conluio
+
+    O par em conluio divide uma mesa a cada 50 partidas e, nelas, o primeiro
+    jogador sempre vence eliminando o segundo.
+    """
+    rng = random.Random(semente)
+    torneio = Torneio("Colusão", 4)
+    jogadores = []
+    for i in range(num_jogadores):
+        jogador = Jogador(f"Jogador-{i}", f"jogador{i}@colusao.com")
+        jogador.id = f"c{i:06d}"
+        jogadores.append(jogador)
+    cumplice, parceiro = jogadores[0], jogadores[1]
+    partidas = []
+    for n in range(num_partidas):
+        if n % 50 == 0:
+            mesa = [cumplice, parceiro] + rng.sample(jogadores[2:], 2)
+        else:
+            mesa = rng.sample(jogadores, rng.choice((3, 4)))
+        partida = Partida(mesa, turno_inicial=rng.randint(1, 25))
+        if n % 50 == 0:
+            turno = rng.randint(2, partida.turno_atual + torneio.turnos_extras)
+            eliminacoes = [Eliminacao(parceiro, cumplice, turno)]
+            resultados = {
+                j.id: {"resultado": "DERROTA", "turno": turno, "eliminacoes": 0, "vida_final": rng.randint(1, 40), "oponentes_danificados": rng.randint(0, 3)}
+                for j in mesa[1:]
+            }
+            resultados[cumplice.id] = {"resultado": "VITORIA", "turno": turno, "eliminacoes": 1, "vida_final": rng.randint(1, 40), "oponentes_danificados": rng.randint(1, 3)}
+        else:
+            eliminacoes, resultados = SimuladorTorneio.sortear_mesa(partida, torneio, rng)
+        partida.eliminacoes = eliminacoes
+        partidas.append((partida, resultados))
+    return partidas
+
+
+def _recontar_pares(partidas: List[Tuple[Partida, Dict[str, dict]]]) -> Dict[Tuple[str, str], Tuple[int, int, int]]:
+    """Recontagem direta, partida a partida, de mesas divididas e eliminações em cada sentido por par (a < b)"""
+    contagens: Dict[Tuple[str, str], List[int]] = {}
+    for partida, _ in partidas:
+        ids = sorted(j.id for j in partida.jogadores)
+        for par in itertools.combinations(ids, 2):
+            contagens.setdefault(par, [0, 0, 0])[0] += 1
+        for e in partida.eliminacoes:
+            if e.jogador_causador and e.jogador_causador is not e.jogador_eliminado:
+                a, b = e.jogador_causador.id, e.jogador_eliminado.id
+                contagens[tuple(sorted((a, b)))][1 if a < b else 2] += 1
+    return {par: tuple(c) for par, c in contagens.items()}
+
+
+def benchmark_colusao(tamanhos: Optional[List[int]] = None, num_jogadores: int = 2000) -> List[Dict]:
+    """Mede o custo por resultado do detector de colusão à medida que o histórico cresce
+
+    O tempo por resultado no primeiro e no último décimo da sequência deve ser
+    o mesmo. As contagens de mesas e eliminações por par são conferidas contra
+    uma recontagem completa do histórico, cujo tempo também é exibido.
+    """
+    tamanhos = tamanhos or [10_000, 100_000, 300_000]
+    resultados = []
+    print(f"{'partidas':>9} {'pares':>9} {'início (µs)':>12} {'fim (µs)':>9} {'recontagem (s)':>15} {'confere':>8} {'alertas':>8} {'conluio detectado':>18}")
+    for num_partidas in tamanhos:
+        partidas = _gerar_partidas_colusao(num_partidas, num_jogadores)
+        detector = DetectorColusao()
+        decimo = max(1, num_partidas // 10)
+        tempos = []
+        for inicio in range(0, num_partidas, decimo):
+            lote = partidas[inicio:inicio + decimo]
+            comeco = time.perf_counter()
+            for partida, dados in lote:
+                detector.registrar_partida(partida, dados)
+            tempos.append((time.perf_counter() - comeco) / len(lote) * 1e6)
+
+        inicio = time.perf_counter()
+        recontagem = _recontar_pares(partidas)
+        tempo_recontagem = time.perf_counter() - inicio
+        confere = recontagem == {
+            par: (c[DetectorColusao.JUNTOS], c[DetectorColusao.ELIMINACOES_AB], c[DetectorColusao.ELIMINACOES_BA]) for par, c in detector.pares.items()
+        }
+        conluio = ("c000000", "c000001")
+        detectado = any(tuple(a["jogadores"]) == conluio for a in detector.alertas)
+        print(f"{num_partidas:>9} {len(detector.pares):>9} {tempos[0]:>12.2f} {tempos[-1]:>9.2f} {tempo_recontagem:>15.3f} {'sim' if confere else 'NÃO':>8} {len(detector.alertas):>8} {'sim' if detectado else 'não':>18}")
+        resultados.append({
+            "partidas": num_partidas,
+            "pares": len(detector.pares),
+            "tempo_inicio": tempos[0],
+            "tempo_fim": tempos[-1],
+            "tempo_recontagem": tempo_recontagem,
+            "confere": confere,
+            "alertas": len(detector.alertas),
+            "detectado": detectado
+        })
+    return resultados
+
+
+def benchmark_grafo_colusao(tamanhos: Optional[List[int]] = None, num_jogadores: int = 2000, partidas_por_torneio: int = 1000) -> List[Dict]:
+    """Mede a análise em lote das matrizes de eliminações e mesas de uma temporada
+
+    As partidas sintéticas são divididas em torneios. As matrizes esparsas são
+    conferidas contra a recontagem direta partida a partida (cujo tempo também
+    é exibido) e o par em conluio deve estar entre os três primeiros itens da
+    lista de revisão.
+    """
+    tamanhos = tamanhos or [10_000, 100_000, 300_000]
+    resultados = []
+    print(f"{'partidas':>9} {'torneios':>9} {'pares':>9} {'leitura (s)':>12} {'análise (s)':>12} {'recontagem (s)':>15} {'confere':>8} {'suspeitos':>10} {'conluio no topo':>16}")
+    for num_partidas in tamanhos:
+        partidas = _gerar_partidas_colusao(num_partidas, num_jogadores)
+        torneios = []
+        for inicio in range(0, num_partidas, partidas_por_torneio):
+            torneio = Torneio(f"Temporada {len(torneios) + 1}", 4)
+            for partida, dados in partidas[inicio:inicio + partidas_por_torneio]:
+                partida.resultados = dados
+                torneio.partidas_concluidas.append(partida)
+            torneios.append(torneio)
+        analise = AnaliseGrafoColusao(torneios)
+        relatorio = analise.analisar()
+
+        inicio = time.perf_counter()
+        recontagem = _recontar_pares(partidas)
+        tempo_recontagem = time.perf_counter() - inicio
+        ids = [j.id for j in analise.jogadores]
+        n = len(ids)
+        chaves_mesas, juntos = analise.matrizes["mesas"]
+        chaves_eliminacoes, eliminacoes = analise.matrizes["eliminacoes"]
+        por_chave = dict(zip(chaves_eliminacoes.tolist(), eliminacoes.tolist()))
+        matrizes = {}
+        for chave, contagem in zip(chaves_mesas.tolist(), juntos.tolist()):
+            a, b = divmod(chave, n)
+            ab, ba = por_chave.get(a * n + b, 0), por_chave.get(b * n + a, 0)
+            # A recontagem ordena os pares pelo id, a análise pelo índice
+            matrizes[(ids[a], ids[b]) if ids[a] < ids[b] else (ids[b], ids[a])] = (contagem, ab, ba) if ids[a] < ids[b] else (contagem, ba, ab)
+        confere = matrizes == recontagem
+        topo = relatorio["revisao"][:3]
+        no_topo = any(item["jogador_id"] in ("c000000", "c000001") for item in topo)
+        tempos = relatorio["tempos"]
+        print(f"{num_partidas:>9} {len(torneios):>9} {relatorio['pares']:>9} {tempos['extracao']:>12.3f} {tempos['analise']:>12.3f} {tempo_recontagem:>15.3f} {'sim' if confere else 'NÃO':>8} {len(relatorio['pares_suspeitos']):>10} {'sim' if no_topo else 'não':>16}")
+        resultados.append({
+            "partidas": num_partidas,
+            "torneios": len(torneios),
+            "pares": relatorio["pares"],
+            "tempo_extracao": tempos["extracao"],
+            "tempo_analise": tempos["analise"],
+            "tempo_recontagem": tempo_recontagem,
+            "confere": confere,
+            "pares_suspeitos": len(relatorio["pares_suspeitos"]),
+            "conluio_no_topo": no_topo
+        })
+    return resultados
+
+
+def benchmark_relatorio(escalas: Optional[List[Tuple[int, int, int]]] = None) -> List[Dict]:
+    """Mede a geração do relatório completo em texto, CSV e JSON para um arquivo
+
+    O pico de memória é medido com tracemalloc durante a escrita em texto, já
+    com os índices montados (que não entram na medida), com páginas de 1 e de
+    100 registros. Ele acompanha o tamanho da página, que cresce com as
+    partidas por jogador e os inscritos por torneio, e não é constante. O JSON gerado é relido e conferido: um registro por juiz,
+    torneio e jogador.
+    """
+    escalas = escalas or [(256, 12, 64), (1000, 52, 128), (2000, 52, 256)]
+    resultados = []
+    print(f"{'jogadores':>10} {'torneios':>9} {'partidas':>9} {'texto (s)':>10} {'csv (s)':>8} {'json (s)':>9} {'arquivo (MB)':>13} {'pico pág. 1 (MB)':>17} {'pico pág. 100 (MB)':>19} {'confere':>8}")
+    for num_jogadores, num_torneios, jogadores_por_torneio in escalas:
+        sistema, _ = _gerar_temporada(num_jogadores, num_torneios, jogadores_por_torneio)
+        partidas = sum(len(t.partidas_concluidas) for t in sistema.gerenciador_torneio.torneios)
+        tempos = {}
+        with tempfile.TemporaryDirectory() as diretorio:
+            for formato in GeradorRelatorio.FORMATOS:
+                caminho = os.path.join(diretorio, f"relatorio.{formato}")
+                tempos[formato] = _medir(lambda: GeradorRelatorio(sistema).exportar(caminho, formato))
+            tamanho = os.path.getsize(os.path.join(diretorio, "relatorio.texto"))
+            with open(os.path.join(diretorio, "relatorio.json"), encoding="utf-8") as f:
+                registros = json.load(f)
+            picos = {}
+            for tamanho_pagina in (1, 100):
+                gerador = GeradorRelatorio(sistema)
+                tracemalloc.start()
+                with open(os.path.join(diretorio, "relatorio.texto"), 'w', encoding='utf-8') as f:
+                    gerador.escrever(f, "texto", tamanho_pagina)
+                picos[tamanho_pagina] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        esperados = len(sistema.gerenciador_cadastros.juizes) + num_torneios + num_jogadores
+        confere = sum(1 for r in registros if r["secao"] != "colusao_temporada") == esperados
+        print(f"{num_jogadores:>10} {num_torneios:>9} {partidas:>9} {tempos['texto']:>10.3f} {tempos['csv']:>8.3f} {tempos['json']:>9.3f} {tamanho / 2**20:>13.1f} {picos[1] / 2**20:>17.2f} {picos[100] / 2**20:>19.2f} {'ok' if confere else 'DIVERGE':>8}")
+        resultados.append({
+            "jogadores": num_jogadores,
+            "torneios": num_torneios,
+            "partidas": partidas,
+            "tempos": tempos,
+            "tamanho": tamanho,
+            "pico_memoria": picos[100],
+            "pico_memoria_pagina_unica": picos[1],
+            "confere": confere
+        })
+    return resultados
+
+
+def benchmark_visoes(escalas: Optional[List[Tuple[int, int, int]]] = None, alterados: int = 10) -> List[Dict]:
+    """Mede o relatório com as visões materializadas frias, quentes e após alterações pontuais
+
+    Depois do relatório frio e do quente, `alterados` jogadores do último
+    torneio recebem uma penalidade e um torneio novo recebe oito inscrições;
+    só as visões desses jogadores e torneios devem ser recalculadas. O texto do
+    último relatório é conferido contra o gerado com visões novas, sem cache.
+    Como o relatório também escreve o histórico de partidas de cada jogador,
+    que não é materializado, o tempo só dos agregados é exibido à parte.
+    """
+    escalas = escalas or [(256, 12, 64), (1000, 52, 128), (2000, 52, 256)]
+    resultados = []
+    print(f"{'jogadores':>10} {'torneios':>9} {'fria (s)':>9} {'quente (s)':>11} {'após (s)':>9} {'agregados fria/quente (s)':>26} {'faltas fria':>12} {'faltas quente':>14} {'faltas após':>12} {'confere':>8}")
+    for num_jogadores, num_torneios, jogadores_por_torneio in escalas:
+        sistema, _ = _gerar_temporada(num_jogadores, num_torneios, jogadores_por_torneio)
+        gerenciador = sistema.gerenciador_torneio
+        gerenciador.visoes.limpar()
+
+        def relatorio() -> Tuple[float, int, str]:
+            saida = io.StringIO()
+            faltas = gerenciador.visoes.faltas
+            tempo = _medir(lambda: GeradorRelatorio(sistema).escrever(saida, "texto", 100))
+            return tempo, gerenciador.visoes.faltas - faltas, saida.getvalue()
+
+        tempo_fria, faltas_fria, _ = relatorio()
+        tempo_quente, faltas_quente, _ = relatorio()
+
+        def agregados():
+            for torneio in gerenciador.torneios:
+                gerenciador.visoes.torneio(torneio)
+            for jogador in sistema.gerenciador_cadastros.jogadores:
+                gerenciador.visoes.jogador(jogador)
+
+        gerenciador.visoes.limpar()
+        agregados_fria = _medir(agregados)
+        agregados_quente = _medir(agregados)
+        rng = random.Random(num_jogadores)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ultimo = gerenciador.torneios[-1]
+            for jogador in rng.sample(ultimo.jogadores, alterados):
+                ultimo.anti_colusao.aplicar_penalidade(jogador, "REDUCAO_ID", ultimo)
+            novo = gerenciador.configurar_torneio("Etapa Extra", 4)
+            for jogador in rng.sample(sistema.gerenciador_cadastros.jogadores, 8):
+                deck = sistema.gerenciador_cadastros.cadastrar_deck(jogador, f"Comandante-{rng.randrange(500)}")
+                sistema.gerenciador_cadastros.validar_deck(deck, novo)
+                gerenciador.inscrever_jogador(novo, jogador, deck)
+                novo.adicionar_jogador(jogador)
+        tempo_apos, faltas_apos, texto = relatorio()
+        sem_cache = io.StringIO()
+        GeradorRelatorio(sistema, visoes=VisoesRelatorio(gerenciador)).escrever(sem_cache, "texto", 100)
+        confere = texto == sem_cache.getvalue()
+        print(f"{num_jogadores:>10} {num_torneios:>9} {tempo_fria:>9.3f} {tempo_quente:>11.3f} {tempo_apos:>9.3f} {f'{agregados_fria:.4f}/{agregados_quente:.4f}':>26} {faltas_fria:>12} {faltas_quente:>14} {faltas_apos:>12} {'ok' if confere else 'DIVERGE':>8}")
+        resultados.append({
+            "jogadores": num_jogadores,
+            "torneios": num_torneios,
+            "tempo_fria": tempo_fria,
+            "tempo_quente": tempo_quente,
+            "tempo_apos": tempo_apos,
+            "agregados_fria": agregados_fria,
+            "agregados_quente": agregados_quente,
+            "faltas_fria": faltas_fria,
+            "faltas_quente": faltas_quente,
+            "faltas_apos": faltas_apos,
+            "contadores": gerenciador.visoes.contadores(),
+            "confere": confere
+        })
+    return resultados
+
+
+def _modelo_anterior(classe: type) -> type:
+    """Cópia da classe sem __slots__, com um __dict__ por instância como no modelo anterior"""
+    atributos = {nome: valor for nome, valor in vars(classe).items() if nome != "__slots__" and nome not in classe.__slots__}
+    return type(classe.__name__, (), atributos)
+
+
+def _medir_memoria(construir) -> Tuple[int, float]:
+    """Bytes mantidos pelos objetos de construir() (tracemalloc) e o tempo de uma execução sem medição de memória"""
+    tempo = _medir(construir)
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    objetos = construir()
+    gc.collect()
+    memoria = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del objetos
+    gc.collect()
+    return memoria, tempo
+
+
+def benchmark_memoria(num_jogadores: int = 10_000, num_partidas: int = 100_000, semente: int = 42) -> List[Dict]:
+    """Compara a memória do modelo compacto (__slots__ e ids internados) com a do modelo anterior
+
+    - jogadores: jogador, deck e inscrição para `num_jogadores` jogadores;
+    - partidas: `num_partidas` partidas de 4 jogadores, com duas eliminações,
+      pontuações e resultados, lidas linha a linha como na carga do banco ou
+      do journal (cada linha é um JSON decodificado separadamente).
+
+    O modelo anterior usa cópias das mesmas classes sem __slots__, com um RLock
+    por partida concluída, e a desserialização que guardava os ids e campos
+    lidos de cada linha, em vez de internados. O compacto paga a internação na
+    carga: a leitura das partidas é mais lenta, e a coluna de tempo mostra
+    quanto.
+    """
+    rng = random.Random(semente)
+    Anterior = {classe.__name__: _modelo_anterior(classe) for classe in (Jogador, Deck, Partida, Eliminacao, Inscricao)}
+    torneio = Torneio("Memória", 4)
+
+    def jogadores(compacto: bool):
+        def construir():
+            JogadorClasse, DeckClasse, InscricaoClasse = (Jogador, Deck, Inscricao) if compacto else (Anterior["Jogador"], Anterior["Deck"], Anterior["Inscricao"])
+            inscricoes = []
+            for i in range(num_jogadores):
+                jogador = JogadorClasse(f"Jogador-{i}", f"jogador{i}@memoria.com")
+                deck = DeckClasse(jogador, f"Comandante-{i % 500}")
+                jogador.decks.append(deck)
+                inscricoes.append(InscricaoClasse(torneio, jogador, deck))
+            return inscricoes
+        return construir
+
+    elenco = [Jogador(f"Jogador-{i}", f"jogador{i}@memoria.com") for i in range(num_jogadores)]
+    jogadores_por_id = {j.id: j for j in elenco}
+    linhas = []
+    for _ in range(num_partidas):
+        mesa = [j.id for j in rng.sample(elenco, 4)]
+        vencedor = mesa[0]
+        linhas.append(json.dumps({
+            "id": str(uuid.uuid4()), "torneio_id": torneio.id, "rodada": rng.randint(1, 7), "turno_atual": rng.randint(1, 12),
+            "jogadores": mesa,
+            "eliminacoes": [{"jogador_eliminado": jid, "jogador_causador": vencedor, "turno": rng.randint(1, 12), "desistiu": False} for jid in mesa[1:3]],
+            "pontuacoes": {jid: round(rng.uniform(10, 100), 4) for jid in mesa},
+            "resultados": {jid: {
+                "resultado": "VITORIA" if jid == vencedor else "DERROTA", "turno": rng.randint(1, 12), "eliminacoes": 2 if jid == vencedor else 0,
+                "vida_final": rng.randint(1, 40), "oponentes_danificados": rng.randint(0, 3)
+            } for jid in mesa}
+        }))
+
+    def partidas(compacto: bool):
+        def construir():
+            if compacto:
+                lidas = []
+                for linha in linhas:
+                    partida = Persistencia._deserializar_partida(json.loads(linha), jogadores_por_id)
+                    partida.concluir()
+                    lidas.append(partida)
+                return lidas
+            PartidaClasse, EliminacaoClasse = Anterior["Partida"], Anterior["Eliminacao"]
+            lidas = []
+            for linha in linhas:
+                dados = json.loads(linha)
+                partida = PartidaClasse([jogadores_por_id[jid] for jid in dados["jogadores"]], dados["turno_atual"], dados["torneio_id"], dados["rodada"])
+                partida.id = dados["id"]
+                partida.eliminacoes = [
+                    EliminacaoClasse(jogadores_por_id[e["jogador_eliminado"]], jogadores_por_id[e["jogador_causador"]], e["turno"], e["desistiu"])
+                    for e in dados["eliminacoes"]
+                ]
+                partida.pontuacoes = dict(dados["pontuacoes"])
+                partida.resultados = dict(dados["resultados"])
+                lidas.append(partida)
+            return lidas
+        return construir
+
+    resultados = []
+    print(f"{'conjunto':>22} {'anterior (MB)':>14} {'compacto (MB)':>14} {'anterior (B/item)':>18} {'compacto (B/item)':>18} {'redução':>8} {'tempo anterior/compacto (s)':>28}")
+    for nome, itens, construtor in ((f"{num_jogadores} jogadores", num_jogadores, jogadores), (f"{num_partidas} partidas", num_partidas, partidas)):
+        memoria_anterior, tempo_anterior = _medir_memoria(construtor(False))
+        memoria_compacta, tempo_compacto = _medir_memoria(construtor(True))
+        reducao = 1 - memoria_compacta / memoria_anterior
+        print(f"{nome:>22} {memoria_anterior / 2**20:>14.1f} {memoria_compacta / 2**20:>14.1f} {memoria_anterior / itens:>18.0f} {memoria_compacta / itens:>18.0f} {reducao:>8.0%} {f'{tempo_anterior:.2f}/{tempo_compacto:.2f}':>28}")
+        resultados.append({
+            "conjunto": nome,
+            "itens": itens,
+            "memoria_anterior": memoria_anterior,
+            "memoria_compacta": memoria_compacta,
+            "tempo_anterior": tempo_anterior,
+            "tempo_compacto": tempo_compacto,
+            "reducao": reducao
+        })
+    return resultados
+
+
+def _partidas_por_objetos(jogador: Jogador) -> List[dict]:
+    """Histórico de partidas do relatório montado percorrendo os objetos das partidas, como antes do histórico colunar"""
+    partidas = []
+    for partida in jogador.historico_partidas:
+        eliminacoes = []
+        for e in partida.eliminacoes:
+            if e.jogador_causador == jogador:
+                eliminacoes.append({"tipo": "Eliminou", "jogador": e.jogador_eliminado.nome, "turno": e.turno})
+            elif e.jogador_eliminado == jogador:
+                eliminacoes.append({
+                    "tipo": "Desistência" if e.desistiu else "Eliminação",
+                    "jogador": e.jogador_causador.nome if e.jogador_causador else "Auto-eliminação",
+                    "turno": e.turno
+                })
+        partidas.append({
+            "partida_id": partida.id,
+            "mesa": [j.nome for j in partida.jogadores],
+            "id_partida": partida.pontuacoes.get(jogador.id, 0),
+            "resultado": partida.resultados.get(jogador.id, {}).get("resultado", "Desconhecido"),
+            "eliminacoes": eliminacoes
+        })
+    return partidas
+
+
+def _forca_por_objetos(jogadores: List[Jogador], torneio_id: Optional[str] = None) -> Dict[str, float]:
+    """Força dos oponentes recalculada partida a partida, sem os agregados incrementais"""
+    forca = {}
+    for jogador in jogadores:
+        soma = num = 0
+        for p in jogador.historico_partidas:
+            if torneio_id is None or p.torneio_id == torneio_id:
+                soma += sum(p.pontuacoes.get(j.id, 0.0) for j in p.jogadores) - p.pontuacoes.get(jogador.id, 0.0)
+                num += len(p.jogadores) - 1
+        forca[jogador.id] = soma / num if num else 0.0
+    return forca
+
+
+def benchmark_historico(escalas: Optional[List[Tuple[int, int, int]]] = None) -> List[Dict]:
+    """Compara as varreduras do histórico colunar com o percurso dos objetos das partidas
+
+    - desempate: força dos oponentes de todos os jogadores em um torneio
+      (recalculada partida a partida x SistemaDesempate.forca_oponentes_em_lote);
+    - histórico: partidas de todos os jogadores como no relatório
+      (GeradorRelatorio._partidas);
+    - leitura: extração dos vetores da análise de colusão de toda a temporada.
+
+    Cada par de resultados é conferido, assim como a força da temporada
+    contra os agregados incrementais dos jogadores. Também são exibidos o
+    tempo de reconstruir o histórico (como na carga do estado) e o tamanho das
+    colunas.
+    """
+    escalas = escalas or [(256, 12, 64), (1000, 52, 128), (2000, 52, 256)]
+    resultados = []
+    print(f"{'jogadores':>10} {'partidas':>9} {'desempate obj/col (s)':>22} {'histórico obj/col (s)':>22} {'leitura obj/col (s)':>20} {'reconstrução (s)':>17} {'colunas (MB)':>13} {'confere':>8}")
+    for num_jogadores, num_torneios, jogadores_por_torneio in escalas:
+        sistema, _ = _gerar_temporada(num_jogadores, num_torneios, jogadores_por_torneio)
+        jogadores = sistema.gerenciador_cadastros.jogadores
+        torneios = sistema.gerenciador_torneio.torneios
+        historico = sistema.gerenciador_torneio.historico
+        torneio_id = torneios[-1].id
+        confere = True
+
+        forca_objetos = _forca_por_objetos(jogadores, torneio_id)
+        forca_colunas = SistemaDesempate.forca_oponentes_em_lote(historico, torneio_id)
+        confere &= all(abs(forca_colunas.get(j.id, 0.0) - forca_objetos[j.id]) < 1e-9 for j in jogadores)
+        temporada = SistemaDesempate.forca_oponentes_em_lote(historico)
+        confere &= all(abs(temporada.get(j.id, 0.0) - SistemaDesempate.calcular_forca_oponentes(j)) < 1e-9 for j in jogadores)
+        tempos_desempate = (
+            _medir(lambda: _forca_por_objetos(jogadores, torneio_id)), _medir(lambda: SistemaDesempate.forca_oponentes_em_lote(historico, torneio_id))
+        )
+
+        gerador = GeradorRelatorio(sistema)
+        confere &= all(gerador._partidas(j) == _partidas_por_objetos(j) for j in jogadores)
+        # Cada histórico é descartado logo após montado, como no relatório, que escreve um jogador por vez
+        percorrer = lambda montar: _medir(lambda: sum(1 for _ in map(montar, jogadores)))
+        tempos_historico = (percorrer(_partidas_por_objetos), percorrer(gerador._partidas))
+
+        por_objetos, por_colunas = AnaliseGrafoColusao(torneios), AnaliseGrafoColusao(torneios, historico)
+        vetores_objetos, vetores_colunas = por_objetos._extrair(), por_colunas._extrair()
+        # As partidas de cada torneio podem vir em outra ordem; as contagens por par de jogadores não mudam
+        pares = lambda analise, v: sorted(zip(
+            [analise.jogadores[i].id for i in v["causadores"]], [analise.jogadores[i].id for i in v["eliminados"]]
+        ))
+        confere &= len(vetores_objetos["tamanhos"]) == len(vetores_colunas["tamanhos"])
+        confere &= pares(por_objetos, vetores_objetos) == pares(por_colunas, vetores_colunas)
+        tempos_leitura = (_medir(AnaliseGrafoColusao(torneios)._extrair), _medir(AnaliseGrafoColusao(torneios, historico)._extrair))
+
+        tempo_reconstrucao = _medir(lambda: HistoricoColunar().reconstruir(jogadores))
+        tamanho = sum(c.nbytes for tabela in historico.colunas() for c in tabela.values())
+        print(f"{num_jogadores:>10} {len(historico):>9} {f'{tempos_desempate[0]:.4f}/{tempos_desempate[1]:.4f}':>22} "
+              f"{f'{tempos_historico[0]:.3f}/{tempos_historico[1]:.3f}':>22} {f'{tempos_leitura[0]:.3f}/{tempos_leitura[1]:.3f}':>20} "
+              f"{tempo_reconstrucao:>17.3f} {tamanho / 2**20:>13.2f} {'ok' if confere else 'DIVERGE':>8}")
+        resultados.append({
+            "jogadores": num_jogadores,
+            "partidas": len(historico),
+            "tempos_desempate": tempos_desempate,
+            "tempos_historico": tempos_historico,
+            "tempos_leitura": tempos_leitura,
+            "tempo_reconstrucao": tempo_reconstrucao,
+            "tamanho_colunas": tamanho,
+            "confere": confere
+        })
+    return resultados
+
+
+BENCHMARKS = {
+    "carregamento": benchmark_carregamento,
+    "emparelhamento": benchmark_emparelhamento,
+    "emparelhamento_paralelo": benchmark_emparelhamento_paralelo,
+    "classificacao": benchmark_classificacao,
+    "pontuacao_lote": benchmark_pontuacao_lote,
+    "tabela_pontuacao": benchmark_tabela_pontuacao,
+    "simulacao": simular,
+    "reproducao": benchmark_reproducao,
+    "colusao": benchmark_colusao,
+    "grafo_colusao": benchmark_grafo_colusao,
+    "relatorio": benchmark_relatorio,
+    "visoes": benchmark_visoes,
+    "memoria": benchmark_memoria,
+    "historico": benchmark_historico,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks do Sistema de Torneios Commander")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS), help="benchmark a executar")
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark]()
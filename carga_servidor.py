@@ -0,0 +1,245 @@
+"""Teste de carga local do serviço HTTP (servidor.py).
+
+Gera um torneio sintético com o simulador, grava-o em um diretório temporário
+e inicia o servidor em um processo separado sobre esse estado. Em cada rodada,
+o cliente inicia a rodada e distribui as mesas entre conexões keep-alive
+concorrentes, simulando um dispositivo de juiz por conexão: cada mesa recebe
+as eliminações, os resultados e uma consulta à classificação. Ao final são
+exibidas as requisições por segundo sustentadas e as latências por rota; o
+servidor é encerrado e o estado gravado por ele é recarregado e comparado com
+a classificação servida.
+
+Uso:
+    python carga_servidor.py
+    python carga_servidor.py --jogadores 4000 --conexoes 64 --rodadas 3 --persistencia sqlite
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from prototipo import Persistencia, SistemaTorneioCommander
+from simulador import SimuladorTorneio
+
+SERVIDOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "servidor.py")
+
+
+class ConexaoHTTP:
+    """Conexão HTTP/1.1 keep-alive mínima para requisições JSON"""
+
+    def __init__(self, host: str, porta: int):
+        self.host = host
+        self.porta = porta
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def abrir(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.porta)
+
+    async def fechar(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def requisitar(self, metodo: str, caminho: str, corpo: Optional[dict] = None) -> Tuple[int, dict]:
+        dados = json.dumps(corpo).encode("utf-8") if corpo is not None else b""
+        self.writer.write(
+            f"{metodo} {caminho} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\nContent-Length: {len(dados)}\r\n\r\n".encode("latin-1")
+            + dados
+        )
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        tamanho = 0
+        while True:
+            linha = await self.reader.readline()
+            if linha in (b"\r\n", b""):
+                break
+            nome, _, valor = linha.decode("latin-1").partition(":")
+            if nome.strip().lower() == "content-length":
+                tamanho = int(valor)
+        return status, json.loads(await self.reader.readexactly(tamanho))
+
+
+class TesteCarga:
+    """Mede a vazão do servidor no registro concorrente de resultados de um torneio"""
+
+    def __init__(self, num_jogadores: int = 1000, conexoes: int = 32, rodadas: Optional[int] = None, persistencia: str = "journal", semente: int = 42):
+        self.num_jogadores = num_jogadores
+        self.conexoes = conexoes
+        self.rodadas = rodadas
+        self.persistencia = persistencia
+        self.semente = semente
+        self.rng = random.Random(semente)
+        self.latencias: Dict[str, List[float]] = {}
+        self.erros: List[str] = []
+
+    def _preparar_estado(self, diretorio: str) -> Tuple[str, int]:
+        """Grava no diretório um torneio sintético com as inscrições finalizadas"""
+        simulador = SimuladorTorneio(self.num_jogadores, self.semente, medir_memoria=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            torneio = simulador._cadastrar()
+            simulador._finalizar_inscricoes(torneio)
+            Persistencia.salvar_estado(simulador.sistema, os.path.join(diretorio, "dados_sistema.json"))
+        return torneio.id, torneio.rodadas
+
+    def _iniciar_servidor(self, diretorio: str) -> Tuple[subprocess.Popen, int]:
+        """Inicia o servidor em uma porta livre e espera ele anunciar o endereço"""
+        log = open(os.path.join(diretorio, "servidor.log"), "w", encoding="utf-8")
+        processo = subprocess.Popen(
+            [sys.executable, SERVIDOR, "--porta", "0", "--persistencia", self.persistencia, "--semente", str(self.semente)],
+            cwd=diretorio, stdout=log, stderr=subprocess.STDOUT
+        )
+        log.close()
+        limite = time.monotonic() + 120
+        while time.monotonic() < limite:
+            if processo.poll() is not None:
+                break
+            with open(os.path.join(diretorio, "servidor.log"), encoding="utf-8") as f:
+                for linha in f:
+                    if linha.startswith("Servidor ouvindo em "):
+                        return processo, int(linha.rsplit(":", 1)[1])
+            time.sleep(0.05)
+        processo.kill()
+        raise RuntimeError("O servidor não iniciou; veja servidor.log.")
+
+    def _resultados_mesa(self, partida: dict) -> Tuple[List[dict], dict]:
+        """Sorteia eliminações e resultados válidos para uma mesa: o primeiro jogador vence eliminando os demais"""
+        jogadores = partida["jogadores"]
+        vencedor = jogadores[0]["email"]
+        turno_final = self.rng.randint(2, partida["turno_atual"] + 5)
+        eliminacoes = []
+        resultados = [{"email": vencedor, "resultado": "VITORIA", "turno": turno_final, "vida_final": self.rng.randint(1, 40), "oponentes_danificados": len(jogadores) - 1}]
+        for jogador in jogadores[1:]:
+            turno = self.rng.randint(1, turno_final)
+            eliminacoes.append({"eliminado": jogador["email"], "causador": vencedor, "turno": turno})
+            # Derrotas com vida 0 ficam abaixo do limite mínimo em mesas de 3
+            resultados.append({"email": jogador["email"], "resultado": "DERROTA", "turno": turno, "vida_final": self.rng.randint(1, 40), "oponentes_danificados": 0})
+        return eliminacoes, {"resultados": resultados}
+
+    async def _requisitar(self, conexao: ConexaoHTTP, rota: str, metodo: str, caminho: str, corpo: Optional[dict] = None) -> dict:
+        inicio = time.perf_counter()
+        status, resposta = await conexao.requisitar(metodo, caminho, corpo)
+        self.latencias.setdefault(rota, []).append(time.perf_counter() - inicio)
+        if status >= 400:
+            self.erros.append(f"{metodo} {caminho}: {status} {resposta.get('erro')}")
+        return resposta
+
+    async def _dispositivo(self, porta: int, torneio_id: str, fila: asyncio.Queue):
+        """Um dispositivo de juiz: registra as mesas da fila, uma de cada vez, pela mesma conexão"""
+        conexao = ConexaoHTTP("127.0.0.1", porta)
+        await conexao.abrir()
+        try:
+            while not fila.empty():
+                partida, eliminacoes, resultados = fila.get_nowait()
+                base = f"/torneios/{torneio_id}/partidas/{partida['id']}"
+                for eliminacao in eliminacoes:
+                    await self._requisitar(conexao, "eliminacoes", "POST", f"{base}/eliminacoes", eliminacao)
+                await self._requisitar(conexao, "resultados", "POST", f"{base}/resultados", resultados)
+                await self._requisitar(conexao, "classificacao", "GET", f"/torneios/{torneio_id}/classificacao?tamanho=20")
+        finally:
+            await conexao.fechar()
+
+    async def _carga(self, porta: int, torneio_id: str, rodadas: int) -> Tuple[int, float, List[dict]]:
+        controle = ConexaoHTTP("127.0.0.1", porta)
+        await controle.abrir()
+        requisicoes = 0
+        tempo = 0.0
+        for _ in range(rodadas):
+            rodada = await self._requisitar(controle, "rodadas", "POST", f"/torneios/{torneio_id}/rodadas")
+            if "partidas" not in rodada:
+                break
+            fila = asyncio.Queue()
+            for partida in rodada["partidas"]:
+                eliminacoes, resultados = self._resultados_mesa(partida)
+                fila.put_nowait((partida, eliminacoes, resultados))
+                requisicoes += len(eliminacoes) + 2
+            inicio = time.perf_counter()
+            await asyncio.gather(*(self._dispositivo(porta, torneio_id, fila) for _ in range(self.conexoes)))
+            tempo += time.perf_counter() - inicio
+        classificacao = []
+        pagina = 1
+        while len(classificacao) < self.num_jogadores:
+            resposta = await self._requisitar(controle, "classificacao", "GET", f"/torneios/{torneio_id}/classificacao?pagina={pagina}&tamanho=1000")
+            if not resposta.get("jogadores"):
+                break
+            classificacao.extend(resposta["jogadores"])
+            pagina += 1
+        # Espera a thread de gravação alcançar as operações já respondidas
+        while (await self._requisitar(controle, "saude", "GET", "/saude"))["persistencia_pendente"]:
+            await asyncio.sleep(0.05)
+        await controle.fechar()
+        return requisicoes, tempo, classificacao
+
+    def executar(self) -> Dict:
+        with tempfile.TemporaryDirectory() as diretorio:
+            torneio_id, rodadas = self._preparar_estado(diretorio)
+            rodadas = min(self.rodadas or rodadas, rodadas)
+            processo, porta = self._iniciar_servidor(diretorio)
+            try:
+                requisicoes, tempo, servida = asyncio.run(self._carga(porta, torneio_id, rodadas))
+            finally:
+                processo.send_signal(signal.SIGTERM)
+                processo.wait(60)
+
+            # A persistência usa caminhos relativos ao diretório de trabalho, como no servidor
+            diretorio_original = os.getcwd()
+            os.chdir(diretorio)
+            try:
+                recarregado = SistemaTorneioCommander(modo_persistencia=self.persistencia)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    recarregado._carregar_estado()
+                if recarregado.banco:
+                    recarregado.banco.fechar()
+            finally:
+                os.chdir(diretorio_original)
+            torneio = recarregado.gerenciador_torneio.buscar_torneio_por_id(torneio_id)
+            gravada = torneio.classificacao.top(len(torneio.classificacao))
+        return {
+            "jogadores": self.num_jogadores,
+            "rodadas": rodadas,
+            "conexoes": self.conexoes,
+            "requisicoes": requisicoes,
+            "tempo": tempo,
+            "requisicoes_por_segundo": requisicoes / tempo if tempo else 0.0,
+            "latencias": self.latencias,
+            "erros": self.erros,
+            "persistencia_confere": [j["email"] for j in servida] == [j.email for j in gravada] and torneio.rodada_atual == rodadas
+        }
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p * len(ordenados)))]
+
+
+def imprimir(r: Dict):
+    print(f"{r['jogadores']} jogadores, {r['rodadas']} rodada(s), {r['conexoes']} conexões simultâneas")
+    print(f"{r['requisicoes']} requisições de mesa em {r['tempo']:.2f} s: {r['requisicoes_por_segundo']:.0f} req/s")
+    print(f"{'rota':<15} {'qtd':>7} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10}")
+    for rota, valores in r["latencias"].items():
+        print(f"{rota:<15} {len(valores):>7} {_percentil(valores, 0.50) * 1000:>10.2f} {_percentil(valores, 0.95) * 1000:>10.2f} {_percentil(valores, 0.99) * 1000:>10.2f}")
+    print(f"Erros: {len(r['erros'])}")
+    for erro in r["erros"][:10]:
+        print(f"  {erro}")
+    print(f"Estado gravado pelo servidor confere com a classificação servida: {'sim' if r['persistencia_confere'] else 'NÃO'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Teste de carga local do serviço HTTP de resultados")
+    parser.add_argument("--jogadores", type=int, default=1000, help="jogadores do torneio sintético (padrão: 1000)")
+    parser.add_argument("--conexoes", type=int, default=32, help="dispositivos de juiz simultâneos (padrão: 32)")
+    parser.add_argument("--rodadas", type=int, help="rodadas a jogar (padrão: todas)")
+    parser.add_argument("--persistencia", choices=["journal", "sqlite"], default="journal", help="persistência do servidor (padrão: journal)")
+    parser.add_argument("--semente", type=int, default=42, help="semente dos dados sintéticos (padrão: 42)")
+    args = parser.parse_args()
+    resultado = TesteCarga(args.jogadores, args.conexoes, args.rodadas, args.persistencia, args.semente).executar()
+    imprimir(resultado)
+    sys.exit(1 if resultado["erros"] or not resultado["persistencia_confere"] else 0)
@@ -0,0 +1,234 @@
+"""Teste de estresse do núcleo do Sistema de Torneios Commander com várias threads.
+
+Monta o mesmo conjunto de torneios sintéticos (jogadores distintos em cada
+torneio) duas vezes e joga todas as rodadas:
+
+- na execução serial, mesa a mesa, em uma única thread;
+- na execução concorrente, todos os torneios ao mesmo tempo, cada um em sua
+  thread; as eliminações de cada rodada são enviadas por um pool de threads e
+  os resultados por processar_mesas_em_paralelo, com uma parte das mesas
+  enviada em duplicidade, enquanto threads de leitura consultam a
+  classificação sem parar.
+
+Os resultados de cada mesa são sorteados a partir dos jogadores e da rodada,
+então não dependem da ordem de processamento. Ao final, a classificação de
+cada torneio (posição, ID, força dos oponentes e vitórias isoladas) e as
+estatísticas de pares do detector de colusão da temporada devem ser
+idênticas nas duas execuções, todo envio duplicado deve ter sido recusado e
+nenhuma partida pode ficar ativa. Com o GIL, o ganho de tempo é pequeno: o
+objetivo é verificar a correção sob concorrência.
+
+Uso:
+    python estresse_concorrencia.py
+    python estresse_concorrencia.py --torneios 8 --jogadores 512 --threads 32
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import io
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from prototipo import Jogador, Partida, SistemaDesempate, SistemaEmparelhamento, SistemaTorneioCommander, Torneio
+from simulador import SimuladorTorneio
+
+
+class TesteEstresse:
+    """Compara uma execução concorrente de vários torneios com a execução serial equivalente"""
+
+    def __init__(self, torneios: int = 4, jogadores: int = 256, threads: int = 16, duplicatas: float = 0.25, semente: int = 42, max_iteracoes: int = 2000):
+        self.num_torneios = torneios
+        self.num_jogadores = jogadores
+        self.threads = threads
+        self.duplicatas = duplicatas
+        self.semente = semente
+        self.max_iteracoes = max_iteracoes
+
+    def _montar_sistema(self) -> SistemaTorneioCommander:
+        """Cadastra os torneios com inscrições finalizadas; nada é gravado em disco"""
+        sistema = SistemaTorneioCommander(modo_persistencia="json")
+        gerenciador = sistema.gerenciador_torneio
+        cadastros = sistema.gerenciador_cadastros
+        # Sem limite de tempo efetivo: o emparelhamento é o mesmo nas duas execuções
+        gerenciador.emparelhamento = SistemaEmparelhamento(tempo_limite=float("inf"), max_iteracoes=self.max_iteracoes, semente=self.semente)
+        for t in range(self.num_torneios):
+            torneio = gerenciador.configurar_torneio(f"Estresse {t}", 4)
+            for i in range(self.num_jogadores):
+                jogador = Jogador(f"Jogador-{t}-{i}", f"jogador{t}-{i}@estresse.com")
+                jogador.id = f"{self.semente}-{t}-{i}"
+                jogador.definir_senha("Senha123")
+                cadastros.adicionar_jogador(jogador)
+                deck = cadastros.cadastrar_deck(jogador, f"Comandante-{i}")
+                cadastros.validar_deck(deck, torneio)
+                gerenciador.inscrever_jogador(torneio, jogador, deck)
+                torneio.adicionar_jogador(jogador)
+            valido, mensagem = gerenciador.validar_distribuicao_mesas(len(torneio.jogadores))
+            if not valido:
+                raise ValueError(mensagem)
+            torneio.rodadas = gerenciador.calcular_rodadas(len(torneio.jogadores))
+            torneio.inscricoes_abertas = False
+        return sistema
+
+    def _sortear(self, partida: Partida, torneio: Torneio) -> Tuple[list, Dict[str, dict]]:
+        """Eliminações e resultados da mesa, determinados pelos jogadores e pela rodada"""
+        rng = random.Random(f"{self.semente}:{torneio.rodada_atual}:{','.join(sorted(j.id for j in partida.jogadores))}")
+        return SimuladorTorneio.sortear_mesa(partida, torneio, rng)
+
+    def _jogar_serial(self, sistema: SistemaTorneioCommander):
+        gerenciador = sistema.gerenciador_torneio
+        for torneio in gerenciador.torneios:
+            while torneio.rodada_atual < torneio.rodadas:
+                for partida in list(gerenciador.iniciar_rodada(torneio)):
+                    eliminacoes, resultados = self._sortear(partida, torneio)
+                    for e in eliminacoes:
+                        gerenciador.registrar_eliminacao(torneio, partida, e.jogador_eliminado, e.jogador_causador, e.turno)
+                    gerenciador.registrar_resultados_mesa(torneio, partida, resultados)
+
+    def _jogar_torneio(self, sistema: SistemaTorneioCommander, torneio: Torneio, pool: concurrent.futures.Executor, contagens: Dict[str, int], trava: threading.Lock):
+        """Joga as rodadas de um torneio enviando eliminações e resultados em paralelo"""
+        gerenciador = sistema.gerenciador_torneio
+        rng = random.Random(f"{self.semente}:{torneio.id}")
+        while torneio.rodada_atual < torneio.rodadas:
+            mesas = [(partida, *self._sortear(partida, torneio)) for partida in gerenciador.iniciar_rodada(torneio)]
+
+            envios = []
+            for partida, eliminacoes, _ in mesas:
+                for e in eliminacoes:
+                    envios.append((partida, e))
+                    if rng.random() < self.duplicatas:
+                        envios.append((partida, e))
+            rng.shuffle(envios)
+
+            def eliminar(envio) -> bool:
+                partida, e = envio
+                try:
+                    gerenciador.registrar_eliminacao(torneio, partida, e.jogador_eliminado, e.jogador_causador, e.turno)
+                    return True
+                except ValueError:
+                    return False
+
+            aceitas = sum(pool.map(eliminar, envios))
+
+            envios_resultados = []
+            for partida, _, resultados in mesas:
+                envios_resultados.append((partida, resultados))
+                if rng.random() < self.duplicatas:
+                    envios_resultados.append((partida, resultados))
+            rng.shuffle(envios_resultados)
+            retorno = gerenciador.processar_mesas_em_paralelo(torneio, envios_resultados, self.threads)
+            recusados = sum(1 for r in retorno if isinstance(r, ValueError))
+
+            with trava:
+                contagens["eliminacoes_duplicadas"] += len(envios) - sum(len(e) for _, e, _ in mesas)
+                contagens["eliminacoes_recusadas"] += len(envios) - aceitas
+                contagens["resultados_duplicados"] += len(envios_resultados) - len(mesas)
+                contagens["resultados_recusados"] += recusados
+
+    def _jogar_concorrente(self, sistema: SistemaTorneioCommander) -> Dict[str, int]:
+        contagens = {"eliminacoes_duplicadas": 0, "eliminacoes_recusadas": 0, "resultados_duplicados": 0, "resultados_recusados": 0, "consultas": 0, "erros_leitura": 0}
+        trava = threading.Lock()
+        parar = threading.Event()
+        torneios = sistema.gerenciador_torneio.torneios
+
+        def ler(indice: int):
+            """Consulta a classificação continuamente e confere se ela está completa"""
+            torneio = torneios[indice % len(torneios)]
+            consultas = erros = 0
+            while not parar.is_set():
+                total = len(torneio.jogadores)
+                # As duas consultas sob a mesma trava enxergam o mesmo estado da classificação
+                with torneio.classificacao.trava:
+                    jogadores = torneio.classificacao.top(total)
+                    completa = len(jogadores) == total and torneio.classificacao.posicao(jogadores[-1]) == total
+                erros += not completa
+                consultas += 1
+                # Leitores sem pausa disputariam o GIL com as threads de trabalho o tempo todo
+                time.sleep(0.001)
+            with trava:
+                contagens["consultas"] += consultas
+                contagens["erros_leitura"] += erros
+
+        leitores = [threading.Thread(target=ler, args=(i,)) for i in range(2)]
+        for leitor in leitores:
+            leitor.start()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(self.threads, thread_name_prefix="eliminacoes") as pool:
+                with concurrent.futures.ThreadPoolExecutor(len(torneios), thread_name_prefix="torneios") as executor:
+                    futuros = [executor.submit(self._jogar_torneio, sistema, t, pool, contagens, trava) for t in torneios]
+                    for futuro in futuros:
+                        futuro.result()
+        finally:
+            parar.set()
+            for leitor in leitores:
+                leitor.join()
+        return contagens
+
+    @staticmethod
+    def _classificacoes(sistema: SistemaTorneioCommander) -> List[List[Tuple[str, float, float, int]]]:
+        return [
+            [(j.email, j.indice_desempenho, SistemaDesempate.calcular_forca_oponentes(j), j.vitorias_isoladas) for j in t.classificacao.top(len(t.classificacao))]
+            for t in sistema.gerenciador_torneio.torneios
+        ]
+
+    def executar(self) -> Dict:
+        with contextlib.redirect_stdout(io.StringIO()):
+            serial = self._montar_sistema()
+            inicio = time.perf_counter()
+            self._jogar_serial(serial)
+            tempo_serial = time.perf_counter() - inicio
+
+            concorrente = self._montar_sistema()
+            inicio = time.perf_counter()
+            contagens = self._jogar_concorrente(concorrente)
+            tempo_concorrente = time.perf_counter() - inicio
+
+        torneios = concorrente.gerenciador_torneio.torneios
+        return {
+            "torneios": self.num_torneios,
+            "jogadores": self.num_jogadores,
+            "threads": self.threads,
+            "tempo_serial": tempo_serial,
+            "tempo_concorrente": tempo_concorrente,
+            "contagens": contagens,
+            "classificacao_confere": self._classificacoes(serial) == self._classificacoes(concorrente),
+            "suspeitas_conferem": [sorted(t.anti_colusao.logs_suspeitos) for t in serial.gerenciador_torneio.torneios] == [sorted(t.anti_colusao.logs_suspeitos) for t in torneios],
+            "pares_conferem": serial.gerenciador_torneio.detector_colusao.pares == concorrente.gerenciador_torneio.detector_colusao.pares,
+            "partidas_ativas": sum(len(t.partidas_ativas) + len(t.tempo.temporizadores) for t in torneios),
+        }
+
+
+def imprimir(r: Dict) -> bool:
+    """Imprime o relatório e retorna se todas as verificações passaram"""
+    c = r["contagens"]
+    print(f"{r['torneios']} torneios de {r['jogadores']} jogadores, {r['threads']} threads de trabalho")
+    print(f"Serial: {r['tempo_serial']:.2f} s; concorrente: {r['tempo_concorrente']:.2f} s")
+    print(f"Eliminações duplicadas recusadas: {c['eliminacoes_recusadas']}/{c['eliminacoes_duplicadas']}")
+    print(f"Resultados duplicados recusados: {c['resultados_recusados']}/{c['resultados_duplicados']}")
+    print(f"Consultas à classificação durante a carga: {c['consultas']} ({c['erros_leitura']} incompletas)")
+    verificacoes = {
+        "classificação idêntica à execução serial": r["classificacao_confere"],
+        "suspeitas de colusão idênticas à execução serial": r["suspeitas_conferem"],
+        "estatísticas de pares da temporada idênticas à execução serial": r["pares_conferem"],
+        "todos os envios duplicados recusados": c["eliminacoes_recusadas"] == c["eliminacoes_duplicadas"] and c["resultados_recusados"] == c["resultados_duplicados"],
+        "nenhuma partida ou temporizador ativo": r["partidas_ativas"] == 0,
+        "leituras consistentes": c["erros_leitura"] == 0,
+    }
+    for descricao, ok in verificacoes.items():
+        print(f"{descricao}: {'sim' if ok else 'NÃO'}")
+    return all(verificacoes.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estresse do núcleo com envios concorrentes, comparado a uma execução serial")
+    parser.add_argument("--torneios", type=int, default=4, help="torneios jogados ao mesmo tempo (padrão: 4)")
+    parser.add_argument("--jogadores", type=int, default=256, help="jogadores por torneio (padrão: 256)")
+    parser.add_argument("--threads", type=int, default=16, help="threads de trabalho por pool (padrão: 16)")
+    parser.add_argument("--duplicatas", type=float, default=0.25, help="fração de envios repetidos (padrão: 0.25)")
+    parser.add_argument("--semente", type=int, default=42, help="semente dos dados sintéticos (padrão: 42)")
+    parser.add_argument("--max-iteracoes", type=int, default=2000, help="iterações do emparelhamento por rodada (padrão: 2000)")
+    args = parser.parse_args()
+    resultado = TesteEstresse(args.torneios, args.jogadores, args.threads, args.duplicatas, args.semente, args.max_iteracoes).executar()
+    sys.exit(0 if imprimir(resultado) else 1)
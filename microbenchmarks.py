@@ -0,0 +1,285 @@
+"""Microbenchmarks das rotinas mais chamadas do Sistema de Torneios Commander.
+
+Cada microbenchmark mede o tempo por chamada (o menor de várias repetições) de
+uma rotina isolada: cálculo do ID individual e em lote, formação de mesas e
+distribuição de jogadores, força dos oponentes, serializadores e
+desserializadores da persistência, validação de email e senha e buscas do
+cadastro. Os tempos são comparados com a base versionada no repositório
+(microbenchmarks_base.json); uma piora acima do limite encerra a execução com
+código 1 e a falta da base, com código 2. Cada rotina é medida intercalada com
+uma carga de calibração, e a comparação usa o tempo relativo a essa carga, que
+desconta a velocidade da máquina no momento da medição. Uma rotina acima do
+limite é medida de novo, com nova calibração, e só é apontada se continuar
+acima em todas as medições.
+
+Uso:
+    python microbenchmarks.py                        # compara com a base
+    python microbenchmarks.py --salvar-base          # grava (ou atualiza) a base em microbenchmarks_base.json
+    python microbenchmarks.py --limite 0.10 --filtro persistencia
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from prototipo import (
+    CalculadorIndiceDesempenho, Eliminacao, GerenciadorCadastros, Jogador, Partida, Persistencia,
+    SistemaDesempate, SistemaEmparelhamento, Torneio, Validador
+)
+
+CAMINHO_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "microbenchmarks_base.json")
+LIMITE_REGRESSAO = 0.25
+# Rodadas de medição da rotina, cada uma seguida de uma medição da calibração
+RODADAS = 7
+# Novas medições das rotinas acima do limite; a regressão só é apontada se persistir em todas
+CONFIRMACOES = 2
+# Passadas cuja mediana é gravada com --salvar-base
+PASSADAS_BASE = 3
+
+
+def _carga_calibracao() -> int:
+    """Carga fixa em Python puro usada como referência de velocidade da máquina"""
+    total = 0
+    for i in range(2000):
+        total += i * i % 7
+    return total
+
+
+def _preparar_jogadores(quantidade: int, semente: int = 42) -> List[Jogador]:
+    rng = random.Random(semente)
+    jogadores = []
+    for i in range(quantidade):
+        jogador = Jogador(f"Jogador-{i}", f"jogador{i}@exemplo.com")
+        jogador.id = f"j{i}"
+        jogador.indice_desempenho = rng.uniform(18.25, 300.0)
+        jogador.soma_ids_oponentes = rng.uniform(0, 900)
+        jogador.num_oponentes = rng.randint(0, 9)
+        jogador.senha_hash = "Senha123"
+        jogadores.append(jogador)
+    return jogadores
+
+
+def _pontuacao() -> Dict[str, Callable[[], object]]:
+    calc = CalculadorIndiceDesempenho
+    calc.tabela_pontuacao()
+    rng = random.Random(1)
+    tamanho_lote = 10_000
+    colunas = (
+        rng.choices(range(3), k=tamanho_lote),
+        rng.choices(range(1, 30), k=tamanho_lote),
+        rng.choices(range(3), k=tamanho_lote),
+        rng.choices(range(41), k=tamanho_lote),
+        rng.choices(range(3), k=tamanho_lote),
+        rng.choices((3, 4), k=tamanho_lote),
+    )
+    colunas = tuple(np.array(coluna) for coluna in colunas)
+    return {
+        "pontuacao.formula": lambda: calc.calcular_pontuacao("VITORIA", 7, 2, 18, 2, 4),
+        "pontuacao.tabela": lambda: calc.consultar_pontuacao("VITORIA", 7, 2, 18, 2, 4),
+        "pontuacao.lote_10k": lambda: calc.calcular_lote(*colunas),
+    }
+
+
+def _emparelhamento() -> Dict[str, Callable[[], object]]:
+    jogadores = _preparar_jogadores(256)
+    torneio = Torneio("Micro", 4)
+    for jogador in jogadores[:64]:
+        torneio.adicionar_jogador(jogador)
+    emparelhamento = SistemaEmparelhamento(tempo_limite=float("inf"), max_iteracoes=2000, semente=3)
+    historico = torneio.historico_oponentes
+    fila = sorted(jogadores, key=lambda j: j.indice_desempenho, reverse=True)
+    for inicio in range(0, len(fila), 4):
+        historico.registrar_mesa([j.id for j in fila[inicio:inicio + 4]])
+
+    def distribuir():
+        torneio.rodada_atual = 1
+        torneio.historico_oponentes = historico.__class__()
+        return emparelhamento.distribuir_jogadores(torneio)
+
+    return {
+        "emparelhamento.formar_mesa": lambda: emparelhamento._formar_mesa(list(fila), 4, historico),
+        "emparelhamento.distribuir_64": distribuir,
+    }
+
+
+def _desempate() -> Dict[str, Callable[[], object]]:
+    jogador = _preparar_jogadores(1)[0]
+    return {"desempate.forca_oponentes": lambda: SistemaDesempate.calcular_forca_oponentes(jogador)}
+
+
+def _persistencia() -> Dict[str, Callable[[], object]]:
+    jogadores = _preparar_jogadores(256)
+    jogadores_por_id = {j.id: j for j in jogadores}
+    torneio = Torneio("Micro", 4)
+    for jogador in jogadores:
+        torneio.adicionar_jogador(jogador)
+    for inicio in range(0, len(jogadores), 4):
+        torneio.historico_oponentes.registrar_mesa([j.id for j in jogadores[inicio:inicio + 4]])
+    partida = Partida(jogadores[:4])
+    partida.eliminacoes.append(Eliminacao(jogadores[1], jogadores[0], 3))
+    dados_jogador = Persistencia._serializar_jogador(jogadores[0])
+    dados_torneio = Persistencia._serializar_torneio(torneio)
+    dados_partida = Persistencia._serializar_partida(partida)
+    return {
+        "persistencia.serializar_jogador": lambda: Persistencia._serializar_jogador(jogadores[0]),
+        "persistencia.deserializar_jogador": lambda: Persistencia._deserializar_jogador(dados_jogador),
+        "persistencia.serializar_torneio_256": lambda: Persistencia._serializar_torneio(torneio),
+        "persistencia.deserializar_torneio_256": lambda: Persistencia._deserializar_torneio(dados_torneio, jogadores_por_id, {}),
+        "persistencia.serializar_partida": lambda: Persistencia._serializar_partida(partida),
+        "persistencia.deserializar_partida": lambda: Persistencia._deserializar_partida(dados_partida, jogadores_por_id),
+    }
+
+
+def _validacao() -> Dict[str, Callable[[], object]]:
+    return {
+        "validador.email": lambda: Validador.validar_email("jogador.exemplo+torneio@dominio.com.br"),
+        "validador.senha": lambda: Validador.validar_senha("SenhaForte123"),
+    }
+
+
+def _cadastros() -> Dict[str, Callable[[], object]]:
+    cadastros = GerenciadorCadastros()
+    for jogador in _preparar_jogadores(10_000):
+        cadastros.adicionar_jogador(jogador)
+        cadastros.cadastrar_deck(jogador, f"Comandante-{jogador.id}")
+    jogador = cadastros.buscar_jogador("jogador5000@exemplo.com")
+    return {
+        "cadastros.buscar_jogador": lambda: cadastros.buscar_jogador("jogador5000@exemplo.com"),
+        "cadastros.buscar_decks": lambda: cadastros.buscar_decks(jogador, "DISPONIVEL"),
+        "cadastros.buscar_deck": lambda: cadastros.buscar_deck("jogador5000@exemplo.com", "Comandante-j5000"),
+    }
+
+
+GRUPOS = (_pontuacao, _emparelhamento, _desempate, _persistencia, _validacao, _cadastros)
+
+
+def _medir_intercalado(funcao: Callable[[], object]) -> Tuple[float, float]:
+    """Mede a rotina alternando com a carga de calibração e retorna (µs por chamada, tempo relativo à calibração)
+
+    Em cada rodada a rotina e a calibração são medidas uma logo após a outra,
+    sob a mesma carga da máquina; o tempo relativo é a mediana das razões das
+    rodadas, então um pico que atinge só uma das medidas não muda o resultado.
+    """
+    rotina = timeit.Timer(funcao)
+    calibracao = timeit.Timer(_carga_calibracao)
+    numero_rotina, _ = rotina.autorange()
+    numero_calibracao, _ = calibracao.autorange()
+    tempos = []
+    razoes = []
+    for _ in range(RODADAS):
+        tempo = rotina.timeit(numero_rotina) / numero_rotina
+        referencia = calibracao.timeit(numero_calibracao) / numero_calibracao
+        tempos.append(tempo)
+        razoes.append(tempo / referencia)
+    return min(tempos) * 1e6, statistics.median(razoes)
+
+
+def medir(filtro: Optional[str] = None, nomes: Optional[Set[str]] = None) -> Dict[str, Tuple[float, float]]:
+    """Mede cada microbenchmark (ou só os de `nomes`) e retorna, por nome, (µs por chamada, tempo relativo à calibração)"""
+    medidas = {}
+    for grupo in GRUPOS:
+        for nome, funcao in grupo().items():
+            if (filtro and filtro not in nome) or (nomes is not None and nome not in nomes):
+                continue
+            medidas[nome] = _medir_intercalado(funcao)
+    return medidas
+
+
+def comparar(medidas: Dict[str, Tuple[float, float]], base: Dict[str, Dict[str, float]], limite: float) -> Tuple[List[Dict], List[str]]:
+    """Compara os tempos relativos à calibração com os da base e retorna as linhas do relatório e os nomes acima do limite"""
+    linhas = []
+    regressoes = []
+    for nome, (tempo, relativo) in medidas.items():
+        anterior = base.get(nome)
+        variacao = relativo / anterior["relativo"] - 1 if anterior else None
+        if variacao is None:
+            situacao = "novo"
+        elif variacao > limite:
+            situacao = "REGRESSÃO"
+            regressoes.append(nome)
+        elif variacao < -limite:
+            situacao = "melhora"
+        else:
+            situacao = "ok"
+        linhas.append({"nome": nome, "base": anterior["tempo"] if anterior else None, "atual": tempo, "variacao": variacao, "situacao": situacao})
+    return linhas, regressoes
+
+
+def _ler_base(caminho_base: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(caminho_base):
+        return {}
+    with open(caminho_base, 'r', encoding='utf-8') as f:
+        base = json.load(f)
+    if not all(isinstance(valor, dict) and "relativo" in valor for valor in base.values()):
+        raise ValueError(f"A base {caminho_base} não tem os tempos relativos à calibração; grave-a novamente com --salvar-base.")
+    return base
+
+
+def executar(caminho_base: str = CAMINHO_BASE, salvar_base: bool = False, limite: float = LIMITE_REGRESSAO, filtro: Optional[str] = None) -> int:
+    """Executa os microbenchmarks, imprime o relatório e retorna o código de saída (1 se houver regressão, 2 sem base)"""
+    try:
+        base = {} if salvar_base else _ler_base(caminho_base)
+    except ValueError as e:
+        print(e)
+        return 2
+    if not salvar_base and not base:
+        print(f"Nenhuma base encontrada em {caminho_base}; use --salvar-base para gravar uma.")
+        return 2
+
+    medidas = medir(filtro)
+    if salvar_base:
+        # A base fica com a mediana de várias passadas, para não gravar um pico nem um vale da máquina
+        passadas = [medidas] + [medir(filtro) for _ in range(PASSADAS_BASE - 1)]
+        medidas = {nome: (statistics.median(p[nome][0] for p in passadas), statistics.median(p[nome][1] for p in passadas)) for nome in medidas}
+
+    linhas, regressoes = comparar(medidas, base, limite)
+    # Uma rotina só é apontada se continuar acima do limite em todas as novas medições, cada uma com a sua calibração
+    for _ in range(CONFIRMACOES):
+        if not regressoes:
+            break
+        novas = medir(nomes=set(regressoes))
+        _, confirmadas = comparar(novas, base, limite)
+        for linha in linhas:
+            if linha["nome"] in regressoes and linha["nome"] not in confirmadas:
+                tempo, relativo = novas[linha["nome"]]
+                linha.update(atual=tempo, variacao=relativo / base[linha["nome"]]["relativo"] - 1, situacao="ok (confirmação)")
+        regressoes = confirmadas
+
+    print(f"{'microbenchmark':<40} {'base (µs)':>12} {'atual (µs)':>12} {'variação':>10}  situação")
+    for linha in linhas:
+        base_texto = f"{linha['base']:.3f}" if linha["base"] is not None else "-"
+        variacao_texto = f"{linha['variacao']:+.1%}" if linha["variacao"] is not None else "-"
+        print(f"{linha['nome']:<40} {base_texto:>12} {linha['atual']:>12.3f} {variacao_texto:>10}  {linha['situacao']}")
+    print("A variação compara o tempo relativo à carga de calibração, medida intercalada com cada rotina.")
+
+    if salvar_base:
+        try:
+            base = _ler_base(caminho_base)
+        except ValueError:
+            base = {}
+        base.update((nome, {"tempo": tempo, "relativo": relativo}) for nome, (tempo, relativo) in medidas.items())
+        with open(caminho_base, 'w', encoding='utf-8') as f:
+            json.dump(base, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"Base gravada em {caminho_base}.")
+        return 0
+    if regressoes:
+        print(f"{len(regressoes)} regressão(ões) acima de {limite:.0%} em todas as {CONFIRMACOES + 1} medições: {', '.join(regressoes)}")
+        return 1
+    print(f"Nenhuma regressão acima de {limite:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmarks com comparação contra uma base gravada")
+    parser.add_argument("--base", default=CAMINHO_BASE, help=f"arquivo da base (padrão: {CAMINHO_BASE})")
+    parser.add_argument("--salvar-base", action="store_true", help="grava os tempos medidos como nova base")
+    parser.add_argument("--limite", type=float, default=LIMITE_REGRESSAO, help=f"piora relativa tolerada (padrão: {LIMITE_REGRESSAO})")
+    parser.add_argument("--filtro", help="executa apenas os microbenchmarks cujo nome contém o texto")
+    args = parser.parse_args()
+    sys.exit(executar(args.base, args.salvar_base, args.limite, args.filtro))
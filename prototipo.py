@@ -1,12 +1,25 @@
+import argparse
+import array
+import bisect
+import contextlib
+import concurrent.futures
+import csv
+import io
+import itertools
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Set
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Set
 import random
 import math
 import json
 import re
+import sys
+import time
 from pathlib import Path
 import os
+import sqlite3
+import threading
+import numpy as np
 from colorama import init, Fore, Style
 
 # Inicializa colorama para formatação de cores no terminal
@@ -22,6 +35,18 @@ class Utilitarios:
             return 0.0
         return sum(j.indice_desempenho for j in jogadores) / len(jogadores)
 
+    @staticmethod
+    def internar_id(valor: Optional[str]) -> Optional[str]:
+        """Retorna a cópia única de um id ou texto repetido lido do disco
+
+        Cada linha do journal ou do banco é decodificada separadamente, então o
+        mesmo id de jogador chega como uma string nova em cada partida
+        (pontuações, resultados, torneio). Internadas, todas as ocorrências
+        apontam para a mesma string do cadastro. Ids únicos, como os de
+        partidas e decks, não ganham nada com isso e não são internados.
+        """
+        return sys.intern(valor) if valor is not None else None
+
     @staticmethod
     def validar_email_unico(email: str, entidades: List) -> bool:
         """Verifica se um email é único na lista de entidades"""
@@ -47,59 +72,293 @@ class Utilitarios:
 
 class Persistencia:
     """Classe responsável pela persistência de dados do sistema"""
-    
+
+    # Número de operações no journal que dispara a compactação em um novo snapshot
+    LIMITE_COMPACTACAO = 200
+
     @staticmethod
     def salvar_estado(sistema: 'SistemaTorneioCommander', caminho: str = 'dados_sistema.json'):
         """Salva o estado atual do sistema em um arquivo JSON"""
         dados = {
+            "seq_journal": sistema.seq_journal,
             "torneios": [Persistencia._serializar_torneio(t) for t in sistema.gerenciador_torneio.torneios],
             "jogadores": [Persistencia._serializar_jogador(j) for j in sistema.gerenciador_cadastros.jogadores],
             "juizes": [Persistencia._serializar_juiz(j) for j in sistema.gerenciador_cadastros.juizes],
-            "decks": [Persistencia._serializar_deck(d) for d in sistema.gerenciador_cadastros.decks]
+            "decks": [Persistencia._serializar_deck(d) for d in sistema.gerenciador_cadastros.decks],
+            "partidas_ativas": [
+                Persistencia._serializar_partida(p) for t in sistema.gerenciador_torneio.torneios for p in t.partidas_ativas
+            ],
+            "partidas_concluidas": [
+                Persistencia._serializar_partida(p) for t in sistema.gerenciador_torneio.torneios for p in t.partidas_concluidas
+            ]
         }
-        with open(caminho, 'w', encoding='utf-8') as f:
+        # Escreve em arquivo temporário e substitui, para nunca deixar um snapshot pela metade
+        caminho_tmp = caminho + '.tmp'
+        with open(caminho_tmp, 'w', encoding='utf-8') as f:
             json.dump(dados, f, ensure_ascii=False, indent=2)
+        os.replace(caminho_tmp, caminho)
         print(Fore.GREEN + f"Estado do sistema salvo em {caminho}" + Style.RESET_ALL)
 
     @staticmethod
     def carregar_estado(sistema: 'SistemaTorneioCommander', caminho: str = 'dados_sistema.json') -> bool:
-        """Carrega o estado do sistema a partir de um arquivo JSON"""
+        """Carrega o snapshot do sistema e reaplica as operações pendentes do journal"""
         try:
-            if not os.path.exists(caminho):
-                return False
-            
-            with open(caminho, 'r', encoding='utf-8') as f:
-                dados = json.load(f)
-            
-            # Primeiro carrega juízes e jogadores
-            sistema.gerenciador_cadastros.juizes = [
-                Persistencia._deserializar_juiz(j) for j in dados.get("juizes", [])
-            ]
-            sistema.gerenciador_cadastros.jogadores = [
-                Persistencia._deserializar_jogador(j) for j in dados.get("jogadores", [])
-            ]
-            
-            # Depois carrega decks (que dependem de jogadores)
-            sistema.gerenciador_cadastros.decks = [
-                Persistencia._deserializar_deck(d, sistema.gerenciador_cadastros.jogadores) 
-                for d in dados.get("decks", [])
-            ]
-            
-            # Por fim carrega torneios (que dependem de tudo)
-            sistema.gerenciador_torneio.torneios = [
-                Persistencia._deserializar_torneio(
-                    t, 
-                    sistema.gerenciador_cadastros.jogadores,
-                    sistema.gerenciador_cadastros.juizes
-                ) for t in dados.get("torneios", [])
-            ]
-            
-            print(Fore.GREEN + f"Estado do sistema carregado de {caminho}" + Style.RESET_ALL)
-            return True
+            carregado = False
+            if os.path.exists(caminho):
+                with open(caminho, 'r', encoding='utf-8') as f:
+                    dados = json.load(f)
+                Persistencia._carregar_snapshot(sistema, dados)
+                print(Fore.GREEN + f"Estado do sistema carregado de {caminho}" + Style.RESET_ALL)
+                carregado = True
+
+            aplicadas = Persistencia.reproduzir_journal(sistema, caminho)
+            if aplicadas:
+                print(Fore.GREEN + f"{aplicadas} operação(ões) reaplicada(s) do journal." + Style.RESET_ALL)
+            return carregado or aplicadas > 0
         except Exception as e:
             print(Fore.RED + f"Erro ao carregar estado: {e}" + Style.RESET_ALL)
             return False
 
+    @staticmethod
+    def _carregar_snapshot(sistema: 'SistemaTorneioCommander', dados: dict):
+        """Reconstrói o estado do sistema a partir de um snapshot já decodificado
+
+        As referências entre entidades são resolvidas por dicionários id -> objeto,
+        de modo que o carregamento é linear no tamanho do snapshot.
+        """
+        # Primeiro carrega juízes e jogadores
+        sistema.gerenciador_cadastros.juizes = [
+            Persistencia._deserializar_juiz(j) for j in dados.get("juizes", [])
+        ]
+        sistema.gerenciador_cadastros.jogadores = [
+            Persistencia._deserializar_jogador(j) for j in dados.get("jogadores", [])
+        ]
+        juizes_por_id = {j.id: j for j in sistema.gerenciador_cadastros.juizes}
+        jogadores_por_id = {j.id: j for j in sistema.gerenciador_cadastros.jogadores}
+
+        # Depois carrega torneios (que dependem de jogadores e juízes)
+        sistema.gerenciador_torneio.torneios = [
+            Persistencia._deserializar_torneio(t, jogadores_por_id, juizes_por_id)
+            for t in dados.get("torneios", [])
+        ]
+        sistema.gerenciador_torneio.detector_colusao = DetectorColusao()
+        sistema.gerenciador_torneio.reindexar()
+        torneios_por_id = sistema.gerenciador_torneio.torneios_por_id
+
+        # Por fim carrega decks (que dependem de jogadores e torneios)
+        sistema.gerenciador_cadastros.decks = [
+            Persistencia._deserializar_deck(d, jogadores_por_id, torneios_por_id)
+            for d in dados.get("decks", [])
+        ]
+        sistema.gerenciador_cadastros.reindexar()
+
+        # Snapshots anteriores ao estado por torneio não trazem torneio_id: as partidas eram do último torneio
+        ultimo_torneio = sistema.gerenciador_torneio.torneios[-1] if sistema.gerenciador_torneio.torneios else None
+        for dados_partida in dados.get("partidas_ativas", []):
+            partida = Persistencia._deserializar_partida(dados_partida, jogadores_por_id)
+            torneio = torneios_por_id.get(partida.torneio_id, ultimo_torneio)
+            if torneio:
+                partida.torneio_id = torneio.id
+                torneio.partidas_ativas.append(partida)
+
+        # Partidas concluídas e, a partir delas, o histórico de cada jogador (snapshots antigos não têm nenhum dos dois)
+        partidas_concluidas = {}
+        for dados_partida in dados.get("partidas_concluidas", []):
+            partida = Persistencia._deserializar_partida(dados_partida, jogadores_por_id)
+            partida.concluir()
+            torneio = torneios_por_id.get(partida.torneio_id)
+            if torneio:
+                torneio.partidas_concluidas.append(partida)
+                # As estatísticas dos detectores de colusão são derivadas dos resultados, não são gravadas
+                if partida.resultados:
+                    torneio.anti_colusao.registrar_estatisticas(partida, partida.resultados)
+            partidas_concluidas[partida.id] = partida
+        for dados_jogador in dados.get("jogadores", []):
+            if dados_jogador.get("historico_partidas"):
+                jogadores_por_id[dados_jogador["id"]].historico_partidas = [
+                    partidas_concluidas[pid] for pid in dados_jogador["historico_partidas"] if pid in partidas_concluidas
+                ]
+        sistema.gerenciador_torneio.historico.reconstruir(sistema.gerenciador_cadastros.jogadores)
+        sistema.seq_journal = dados.get("seq_journal", 0)
+
+    @staticmethod
+    def caminho_journal(caminho: str = 'dados_sistema.json') -> str:
+        """Retorna o caminho do journal associado a um snapshot"""
+        return str(Path(caminho).with_suffix('.journal'))
+
+    @staticmethod
+    def registrar_operacao(sistema: 'SistemaTorneioCommander', tipo: str, dados: dict, caminho: str = 'dados_sistema.json'):
+        """Acrescenta uma operação ao journal, sem reescrever o snapshot"""
+        Persistencia.registrar_operacoes(sistema, [(tipo, dados)], caminho)
+
+    @staticmethod
+    def registrar_operacoes(sistema: 'SistemaTorneioCommander', operacoes: List[Tuple[str, dict]], caminho: str = 'dados_sistema.json'):
+        """Acrescenta um lote de operações ao journal com uma única escrita em disco"""
+        linhas = []
+        for tipo, dados in operacoes:
+            sistema.seq_journal += 1
+            linhas.append(json.dumps({"seq": sistema.seq_journal, "tipo": tipo, "dados": dados}, ensure_ascii=False) + "\n")
+        with open(Persistencia.caminho_journal(caminho), 'a', encoding='utf-8') as f:
+            f.writelines(linhas)
+            f.flush()
+            os.fsync(f.fileno())
+        sistema.operacoes_desde_snapshot += len(linhas)
+
+    @staticmethod
+    def compactar(sistema: 'SistemaTorneioCommander', caminho: str = 'dados_sistema.json'):
+        """Grava um novo snapshot e descarta as operações do journal já incorporadas a ele"""
+        Persistencia.salvar_estado(sistema, caminho)
+        # O snapshot guarda seq_journal, então uma falha antes do truncamento não reaplica operações
+        open(Persistencia.caminho_journal(caminho), 'w', encoding='utf-8').close()
+        sistema.operacoes_desde_snapshot = 0
+
+    @staticmethod
+    def reproduzir_journal(sistema: 'SistemaTorneioCommander', caminho: str = 'dados_sistema.json') -> int:
+        """Reaplica sobre o estado carregado as operações do journal posteriores ao snapshot"""
+        caminho_journal = Persistencia.caminho_journal(caminho)
+        if not os.path.exists(caminho_journal):
+            return 0
+
+        # Os índices de cadastros são mantidos pelo próprio GerenciadorCadastros durante a reaplicação
+        indices = {
+            "juizes": sistema.gerenciador_cadastros.juizes_por_id,
+            "jogadores": sistema.gerenciador_cadastros.jogadores_por_id,
+            "decks": sistema.gerenciador_cadastros.decks_por_id,
+            "torneios": sistema.gerenciador_torneio.torneios_por_id,
+            "partidas": {p.id: p for t in sistema.gerenciador_torneio.torneios for p in t.partidas_ativas},
+            # Jogadores com ID alterado: as classificações são atualizadas uma vez, ao final da reaplicação
+            "classificacao_pendente": {},
+            # Partidas concluídas na reaplicação, acrescentadas de uma vez ao histórico colunar ao final
+            "historico_pendente": []
+        }
+        aplicadas = 0
+        with open(caminho_journal, 'r', encoding='utf-8') as f:
+            for linha in f:
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except json.JSONDecodeError:
+                    # Última linha incompleta (queda durante a escrita): o restante é descartado
+                    print(Fore.YELLOW + "Aviso: registro incompleto no journal ignorado." + Style.RESET_ALL)
+                    break
+                if registro["seq"] <= sistema.seq_journal:
+                    continue
+                aplicador = getattr(Persistencia, f"_aplicar_{registro['tipo']}")
+                aplicador(sistema, registro["dados"], indices)
+                sistema.seq_journal = registro["seq"]
+                sistema.operacoes_desde_snapshot += 1
+                aplicadas += 1
+        for jogador in indices["classificacao_pendente"].values():
+            Classificacao.atualizar_jogador(jogador)
+        sistema.gerenciador_torneio.historico.registrar_partidas(indices["historico_pendente"])
+        # Resultados e penalidades reaplicados alteram os jogadores diretamente; as visões são refeitas sob demanda
+        if aplicadas:
+            sistema.gerenciador_torneio.visoes.limpar()
+        return aplicadas
+
+    @staticmethod
+    def _aplicar_juiz(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        sistema.gerenciador_cadastros.adicionar_juiz(Persistencia._deserializar_juiz(dados))
+
+    @staticmethod
+    def _aplicar_jogador(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        sistema.gerenciador_cadastros.adicionar_jogador(Persistencia._deserializar_jogador(dados))
+
+    @staticmethod
+    def _aplicar_deck(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        sistema.gerenciador_cadastros.adicionar_deck(Persistencia._deserializar_deck(dados, indices["jogadores"], indices["torneios"]))
+
+    @staticmethod
+    def _aplicar_torneio(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        torneio = indices["torneios"].get(dados["id"])
+        if torneio is None:
+            sistema.gerenciador_torneio.adicionar_torneio(
+                Persistencia._deserializar_torneio(dados, indices["jogadores"], indices["juizes"])
+            )
+            return
+        torneio.rodadas = dados["rodadas"]
+        torneio.rodada_atual = dados["rodada_atual"]
+        torneio.inscricoes_abertas = dados["inscricoes_abertas"]
+
+    @staticmethod
+    def _aplicar_inscricao(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        torneio = indices["torneios"][dados["torneio_id"]]
+        jogador = indices["jogadores"][dados["jogador_id"]]
+        deck = indices["decks"][dados["deck_id"]]
+        sistema.gerenciador_cadastros.validar_deck(deck, torneio)
+        torneio.adicionar_jogador(jogador)
+
+    @staticmethod
+    def _aplicar_rodada(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        torneio = indices["torneios"][dados["torneio_id"]]
+        torneio.rodada_atual = dados["rodada_atual"]
+        for partida in torneio.partidas_ativas:
+            indices["partidas"].pop(partida.id, None)
+        torneio.partidas_ativas = [
+            Persistencia._deserializar_partida(p, indices["jogadores"]) for p in dados["partidas"]
+        ]
+        for partida in torneio.partidas_ativas:
+            partida.torneio_id = torneio.id
+            partida.rodada = partida.rodada or torneio.rodada_atual
+            indices["partidas"][partida.id] = partida
+        torneio.mesas = [p.jogadores for p in torneio.partidas_ativas]
+        if dados.get("historico_oponentes") is not None:
+            torneio.historico_oponentes = Persistencia._deserializar_historico(dados["historico_oponentes"])
+        else:
+            # Journals anteriores ao histórico em matriz não o gravam: mantém o histórico e soma as mesas da rodada
+            for mesa in torneio.mesas:
+                torneio.historico_oponentes.registrar_mesa([j.id for j in mesa])
+
+    @staticmethod
+    def _aplicar_eliminacao(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        partida = indices["partidas"][dados["partida_id"]]
+        partida.eliminacoes.append(Persistencia._deserializar_eliminacao(dados, indices["jogadores"]))
+
+    @staticmethod
+    def _aplicar_resultado(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        for dados_jogador in dados["jogadores"]:
+            jogador = indices["jogadores"][dados_jogador["id"]]
+            jogador.indice_desempenho = dados_jogador["indice_desempenho"]
+            jogador.vitorias_isoladas = dados_jogador["vitorias_isoladas"]
+            jogador.soma_ids_oponentes = dados_jogador.get("soma_ids_oponentes", jogador.soma_ids_oponentes)
+            jogador.num_oponentes = dados_jogador.get("num_oponentes", jogador.num_oponentes)
+            indices["classificacao_pendente"][jogador.id] = jogador
+        partida = indices["partidas"].pop(dados["partida_id"], None)
+        torneio = indices["torneios"].get(partida.torneio_id) if partida else None
+        if torneio and partida in torneio.partidas_ativas:
+            torneio.partidas_ativas.remove(partida)
+        # Registros anteriores ao histórico de partidas trazem apenas os agregados dos jogadores
+        if partida is None or "resultados" not in dados:
+            return
+        partida.eliminacoes = [Persistencia._deserializar_eliminacao(e, indices["jogadores"]) for e in dados["eliminacoes"]]
+        partida.pontuacoes = Persistencia._deserializar_pontuacoes(dados["pontuacoes"])
+        partida.resultados = Persistencia._deserializar_resultados(dados["resultados"])
+        partida.concluir()
+        for jogador in partida.jogadores:
+            jogador.historico_partidas.append(partida)
+        indices["historico_pendente"].append(partida)
+        if torneio:
+            torneio.partidas_concluidas.append(partida)
+            # Os logs de colusão são derivados dos resultados, então são refeitos na reaplicação
+            torneio.anti_colusao.analisar_padroes(partida, partida.resultados)
+
+    @staticmethod
+    def _aplicar_denuncia(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        torneio = indices["torneios"][dados["torneio_id"]]
+        jogador = indices["jogadores"][dados["jogador_id"]]
+        torneio.anti_colusao.denuncias.append({"jogador": jogador.nome, "jogador_id": jogador.id, "descricao": dados["descricao"], "data": datetime.fromisoformat(dados["data"])})
+
+    @staticmethod
+    def _aplicar_penalidade(sistema: 'SistemaTorneioCommander', dados: dict, indices: dict):
+        jogador = indices["jogadores"][dados["jogador_id"]]
+        torneio = indices["torneios"][dados["torneio_id"]]
+        jogador.penalidades.append({"jogador": jogador.nome, "tipo": dados["tipo"], "torneio": torneio.nome, "torneio_id": torneio.id, "data": datetime.fromisoformat(dados["data"])})
+        jogador.indice_desempenho = dados["indice_desempenho"]
+        if dados["tipo"] == "DESCLASSIFICACAO" and jogador in torneio.jogadores:
+            torneio.remover_jogador(jogador)
+        indices["classificacao_pendente"][jogador.id] = jogador
+
     @staticmethod
     def _serializar_torneio(torneio: 'Torneio') -> dict:
         return {
@@ -113,7 +372,21 @@ class Persistencia:
             "rodada_atual": torneio.rodada_atual,
             "inscricoes_abertas": torneio.inscricoes_abertas,
             "tempo_rodada": str(torneio.tempo_rodada),
-            "turnos_extras": torneio.turnos_extras
+            "turnos_extras": torneio.turnos_extras,
+            "historico_oponentes": Persistencia._serializar_historico(torneio.historico_oponentes),
+            "anti_colusao": {
+                "logs_suspeitos": list(torneio.anti_colusao.logs_suspeitos),
+                "denuncias": [dict(d, data=d["data"].isoformat()) for d in torneio.anti_colusao.denuncias]
+            }
+        }
+
+    @staticmethod
+    def _serializar_historico(historico: 'HistoricoOponentes') -> dict:
+        n = len(historico.ids)
+        linhas, colunas = np.nonzero(np.triu(historico.contagens[:n, :n]))
+        return {
+            "jogadores": historico.ids,
+            "pares": [[int(i), int(j), int(historico.contagens[i, j])] for i, j in zip(linhas, colunas)]
         }
 
     @staticmethod
@@ -124,7 +397,11 @@ class Persistencia:
             "email": jogador.email,
             "indice_desempenho": jogador.indice_desempenho,
             "vitorias_isoladas": jogador.vitorias_isoladas,
-            "senha_hash": jogador.senha_hash if hasattr(jogador, 'senha_hash') else None
+            "soma_ids_oponentes": jogador.soma_ids_oponentes,
+            "num_oponentes": jogador.num_oponentes,
+            "senha_hash": jogador.senha_hash if hasattr(jogador, 'senha_hash') else None,
+            "penalidades": [dict(p, data=p["data"].isoformat()) for p in jogador.penalidades],
+            "historico_partidas": [p.id for p in jogador.historico_partidas]
         }
 
     @staticmethod
@@ -149,27 +426,70 @@ class Persistencia:
         }
 
     @staticmethod
-    def _deserializar_torneio(dados: dict, jogadores: List['Jogador'], juizes: List['Juiz']) -> 'Torneio':
+    def _serializar_partida(partida: 'Partida') -> dict:
+        return {
+            "id": partida.id,
+            "torneio_id": partida.torneio_id,
+            "rodada": partida.rodada,
+            "jogadores": [j.id for j in partida.jogadores],
+            "turno_atual": partida.turno_atual,
+            "eliminacoes": [Persistencia._serializar_eliminacao(e) for e in partida.eliminacoes],
+            "pontuacoes": partida.pontuacoes,
+            "resultados": partida.resultados
+        }
+
+    @staticmethod
+    def _serializar_eliminacao(eliminacao: 'Eliminacao') -> dict:
+        return {
+            "jogador_eliminado": eliminacao.jogador_eliminado.id,
+            "jogador_causador": eliminacao.jogador_causador.id if eliminacao.jogador_causador else None,
+            "turno": eliminacao.turno,
+            "desistiu": eliminacao.desistiu
+        }
+
+    @staticmethod
+    def _deserializar_torneio(dados: dict, jogadores_por_id: Dict[str, 'Jogador'], juizes_por_id: Dict[str, 'Juiz']) -> 'Torneio':
         torneio = Torneio(dados["nome"], dados["min_jogadores"])
-        torneio.id = dados["id"]
+        torneio.id = Utilitarios.internar_id(dados["id"])
         torneio.data = datetime.fromisoformat(dados["data"])
         torneio.rodadas = dados["rodadas"]
-        torneio.jogadores = [j for j in jogadores if j.id in dados["jogadores"]]
-        torneio.juizes = [j for j in juizes if j.id in dados["juizes"]]
+        torneio.jogadores = [jogadores_por_id[jid] for jid in dados["jogadores"] if jid in jogadores_por_id]
+        torneio.classificacao.reconstruir(torneio.jogadores)
+        torneio.juizes = [juizes_por_id[jid] for jid in dados["juizes"] if jid in juizes_por_id]
         torneio.rodada_atual = dados["rodada_atual"]
         torneio.inscricoes_abertas = dados["inscricoes_abertas"]
-        torneio.tempo_rodada = datetime.strptime(dados["tempo_rodada"], "%H:%M:%S").time()
+        horas, minutos, segundos = (int(float(parte)) for parte in dados["tempo_rodada"].split(":"))
+        torneio.tempo_rodada = timedelta(hours=horas, minutes=minutos, seconds=segundos)
         torneio.turnos_extras = dados["turnos_extras"]
+        if dados.get("historico_oponentes"):
+            torneio.historico_oponentes = Persistencia._deserializar_historico(dados["historico_oponentes"])
+        anti_colusao = dados.get("anti_colusao") or {}
+        torneio.anti_colusao.logs_suspeitos = list(anti_colusao.get("logs_suspeitos", []))
+        torneio.anti_colusao.denuncias = [dict(d, data=datetime.fromisoformat(d["data"])) for d in anti_colusao.get("denuncias", [])]
         return torneio
 
+    @staticmethod
+    def _deserializar_historico(dados: dict) -> 'HistoricoOponentes':
+        historico = HistoricoOponentes(max(len(dados["jogadores"]), 16))
+        for jogador_id in dados["jogadores"]:
+            historico.indice(Utilitarios.internar_id(jogador_id))
+        if dados["pares"]:
+            i, j, c = np.array(dados["pares"], dtype=np.int64).T
+            historico.contagens[i, j] = c
+            historico.contagens[j, i] = c
+        return historico
+
     @staticmethod
     def _deserializar_jogador(dados: dict) -> 'Jogador':
         jogador = Jogador(dados["nome"], dados["email"])
-        jogador.id = dados["id"]
+        jogador.id = Utilitarios.internar_id(dados["id"])
         jogador.indice_desempenho = dados["indice_desempenho"]
         jogador.vitorias_isoladas = dados["vitorias_isoladas"]
+        jogador.soma_ids_oponentes = dados.get("soma_ids_oponentes", 0.0)
+        jogador.num_oponentes = dados.get("num_oponentes", 0)
         if dados.get("senha_hash"):
             jogador.senha_hash = dados["senha_hash"]
+        jogador.penalidades = [dict(p, data=datetime.fromisoformat(p["data"])) for p in dados.get("penalidades", [])]
         return jogador
 
     @staticmethod
@@ -182,14 +502,441 @@ class Persistencia:
         return juiz
 
     @staticmethod
-    def _deserializar_deck(dados: dict, jogadores: List['Jogador']) -> 'Deck':
-        jogador = next(j for j in jogadores if j.id == dados["jogador_id"])
+    def _deserializar_deck(dados: dict, jogadores_por_id: Dict[str, 'Jogador'], torneios_por_id: Dict[str, 'Torneio']) -> 'Deck':
+        jogador = jogadores_por_id[dados["jogador_id"]]
         deck = Deck(jogador, dados["comandante"])
         deck.id = dados["id"]
         deck.validado = dados["validado"]
+        deck.torneio = torneios_por_id.get(dados.get("torneio_id"))
         deck.ativo = dados.get("ativo", True)
+        jogador.decks.append(deck)
         return deck
 
+    @staticmethod
+    def _deserializar_partida(dados: dict, jogadores_por_id: Dict[str, 'Jogador']) -> 'Partida':
+        partida = Partida(
+            [jogadores_por_id[jid] for jid in dados["jogadores"]], dados.get("turno_atual", 1),
+            Utilitarios.internar_id(dados.get("torneio_id")), dados.get("rodada")
+        )
+        partida.id = dados["id"]
+        partida.eliminacoes = [
+            Persistencia._deserializar_eliminacao(e, jogadores_por_id) for e in dados.get("eliminacoes", [])
+        ]
+        partida.pontuacoes = Persistencia._deserializar_pontuacoes(dados.get("pontuacoes") or {})
+        partida.resultados = Persistencia._deserializar_resultados(dados.get("resultados") or {})
+        return partida
+
+    @staticmethod
+    def _deserializar_pontuacoes(dados: dict) -> Dict[str, float]:
+        return dict(zip(map(Utilitarios.internar_id, dados), dados.values()))
+
+    @staticmethod
+    def _deserializar_resultados(dados: dict) -> Dict[str, dict]:
+        """Resultados por jogador com os ids, os nomes dos campos e o tipo de resultado internados"""
+        resultados = {}
+        for jogador_id, dados_jogador in dados.items():
+            resultado = dict(zip(map(Utilitarios.internar_id, dados_jogador), dados_jogador.values()))
+            if isinstance(resultado.get("resultado"), str):
+                resultado["resultado"] = Utilitarios.internar_id(resultado["resultado"])
+            resultados[Utilitarios.internar_id(jogador_id)] = resultado
+        return resultados
+
+    @staticmethod
+    def _deserializar_eliminacao(dados: dict, jogadores_por_id: Dict[str, 'Jogador']) -> 'Eliminacao':
+        causador = jogadores_por_id[dados["jogador_causador"]] if dados["jogador_causador"] else None
+        return Eliminacao(jogadores_por_id[dados["jogador_eliminado"]], causador, dados["turno"], dados["desistiu"])
+
+class PersistenciaSQLite:
+    """Classe responsável pela persistência do sistema em um banco SQLite local, com tabelas indexadas"""
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS juizes (
+            id TEXT PRIMARY KEY,
+            nome TEXT NOT NULL,
+            email TEXT NOT NULL UNIQUE,
+            permissoes TEXT NOT NULL,
+            senha_hash TEXT
+        );
+        CREATE TABLE IF NOT EXISTS jogadores (
+            id TEXT PRIMARY KEY,
+            nome TEXT NOT NULL,
+            email TEXT NOT NULL UNIQUE,
+            indice_desempenho REAL NOT NULL DEFAULT 0,
+            vitorias_isoladas INTEGER NOT NULL DEFAULT 0,
+            soma_ids_oponentes REAL NOT NULL DEFAULT 0,
+            num_oponentes INTEGER NOT NULL DEFAULT 0,
+            senha_hash TEXT
+        );
+        CREATE TABLE IF NOT EXISTS torneios (
+            id TEXT PRIMARY KEY,
+            nome TEXT NOT NULL,
+            data TEXT NOT NULL,
+            rodadas INTEGER NOT NULL,
+            min_jogadores INTEGER NOT NULL,
+            juizes TEXT NOT NULL,
+            rodada_atual INTEGER NOT NULL,
+            inscricoes_abertas INTEGER NOT NULL,
+            tempo_rodada TEXT NOT NULL,
+            turnos_extras INTEGER NOT NULL,
+            historico_oponentes TEXT
+        );
+        CREATE TABLE IF NOT EXISTS decks (
+            id TEXT PRIMARY KEY,
+            jogador_id TEXT NOT NULL REFERENCES jogadores(id),
+            comandante TEXT NOT NULL,
+            validado INTEGER NOT NULL,
+            torneio_id TEXT REFERENCES torneios(id),
+            ativo INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_decks_jogador ON decks(jogador_id);
+        CREATE INDEX IF NOT EXISTS idx_decks_torneio ON decks(torneio_id);
+        CREATE TABLE IF NOT EXISTS inscricoes (
+            ordem INTEGER PRIMARY KEY AUTOINCREMENT,
+            torneio_id TEXT NOT NULL REFERENCES torneios(id),
+            jogador_id TEXT NOT NULL REFERENCES jogadores(id),
+            deck_id TEXT REFERENCES decks(id),
+            UNIQUE (torneio_id, jogador_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_inscricoes_jogador ON inscricoes(jogador_id);
+        CREATE TABLE IF NOT EXISTS partidas (
+            id TEXT PRIMARY KEY,
+            torneio_id TEXT REFERENCES torneios(id),
+            rodada INTEGER,
+            turno_atual INTEGER NOT NULL,
+            ativa INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_partidas_torneio ON partidas(torneio_id, rodada);
+        CREATE INDEX IF NOT EXISTS idx_partidas_ativa ON partidas(ativa);
+        CREATE TABLE IF NOT EXISTS partida_jogadores (
+            partida_id TEXT NOT NULL REFERENCES partidas(id),
+            posicao INTEGER NOT NULL,
+            jogador_id TEXT NOT NULL REFERENCES jogadores(id),
+            PRIMARY KEY (partida_id, posicao)
+        );
+        CREATE INDEX IF NOT EXISTS idx_partida_jogadores_jogador ON partida_jogadores(jogador_id);
+        CREATE TABLE IF NOT EXISTS eliminacoes (
+            ordem INTEGER PRIMARY KEY AUTOINCREMENT,
+            partida_id TEXT NOT NULL REFERENCES partidas(id),
+            jogador_eliminado TEXT NOT NULL REFERENCES jogadores(id),
+            jogador_causador TEXT REFERENCES jogadores(id),
+            turno INTEGER NOT NULL,
+            desistiu INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_eliminacoes_partida ON eliminacoes(partida_id);
+        CREATE INDEX IF NOT EXISTS idx_eliminacoes_causador ON eliminacoes(jogador_causador);
+        CREATE TABLE IF NOT EXISTS penalidades (
+            ordem INTEGER PRIMARY KEY AUTOINCREMENT,
+            jogador_id TEXT NOT NULL REFERENCES jogadores(id),
+            torneio_id TEXT NOT NULL REFERENCES torneios(id),
+            tipo TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_penalidades_jogador ON penalidades(jogador_id);
+        CREATE TABLE IF NOT EXISTS denuncias (
+            ordem INTEGER PRIMARY KEY AUTOINCREMENT,
+            torneio_id TEXT NOT NULL REFERENCES torneios(id),
+            jogador_id TEXT NOT NULL REFERENCES jogadores(id),
+            descricao TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_denuncias_torneio ON denuncias(torneio_id);
+    """
+
+    # Colunas acrescentadas depois da criação do esquema, adicionadas a bancos existentes
+    COLUNAS_ADICIONADAS = [
+        ("torneios", "historico_oponentes", "TEXT"),
+        ("jogadores", "soma_ids_oponentes", "REAL NOT NULL DEFAULT 0"),
+        ("jogadores", "num_oponentes", "INTEGER NOT NULL DEFAULT 0"),
+        ("partidas", "resultados", "TEXT"),
+        ("partidas", "pontuacoes", "TEXT"),
+        # Ordem de conclusão da partida, usada para reconstruir o histórico de cada jogador
+        ("partidas", "concluida", "INTEGER"),
+    ]
+
+    def __init__(self, caminho: str = 'dados_sistema.db'):
+        self.caminho = caminho
+        # A conexão pode ser usada por uma thread de gravação (ex.: servidor.py), sempre uma de cada vez
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.row_factory = sqlite3.Row
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA foreign_keys=ON")
+        self.conexao.executescript(self.ESQUEMA)
+        self._migrar_esquema()
+
+    def _migrar_esquema(self):
+        """Acrescenta a bancos criados por versões anteriores as colunas que ainda não existem"""
+        for tabela, coluna, tipo in self.COLUNAS_ADICIONADAS:
+            colunas = {row["name"] for row in self.conexao.execute(f"PRAGMA table_info({tabela})")}
+            if coluna not in colunas:
+                with self.conexao:
+                    self.conexao.execute(f"ALTER TABLE {tabela} ADD COLUMN {coluna} {tipo}")
+        # Índices sobre colunas acrescentadas só podem ser criados depois delas
+        with self.conexao:
+            self.conexao.execute("CREATE INDEX IF NOT EXISTS idx_partidas_concluida ON partidas(concluida)")
+
+    def fechar(self):
+        self.conexao.close()
+
+    def vazio(self) -> bool:
+        """Indica se o banco ainda não possui nenhum cadastro"""
+        return not any(
+            self.conexao.execute(f"SELECT 1 FROM {tabela} LIMIT 1").fetchone()
+            for tabela in ("juizes", "jogadores", "torneios")
+        )
+
+    def registrar_operacao(self, sistema: 'SistemaTorneioCommander', tipo: str, dados: dict):
+        """Grava uma operação em sua própria transação"""
+        self.registrar_operacoes(sistema, [(tipo, dados)])
+
+    def registrar_operacoes(self, sistema: 'SistemaTorneioCommander', operacoes: List[Tuple[str, dict]]):
+        """Grava um lote de operações em uma única transação"""
+        with self.conexao:
+            for tipo, dados in operacoes:
+                getattr(self, f"_gravar_{tipo}")(dados)
+
+    def salvar_estado(self, sistema: 'SistemaTorneioCommander'):
+        """Substitui todo o conteúdo do banco pelo estado em memória, em uma única transação"""
+        with self.conexao:
+            for tabela in ("denuncias", "penalidades", "eliminacoes", "partida_jogadores", "partidas", "inscricoes", "decks", "torneios", "jogadores", "juizes"):
+                self.conexao.execute(f"DELETE FROM {tabela}")
+            for juiz in sistema.gerenciador_cadastros.juizes:
+                self._gravar_juiz(Persistencia._serializar_juiz(juiz))
+            for jogador in sistema.gerenciador_cadastros.jogadores:
+                self._gravar_jogador(Persistencia._serializar_jogador(jogador))
+            for torneio in sistema.gerenciador_torneio.torneios:
+                self._gravar_torneio(Persistencia._serializar_torneio(torneio))
+            # Nomes de torneio podem se repetir: o nome só identifica penalidades de snapshots antigos, sem torneio_id
+            torneios_por_id = {t.id: t for t in sistema.gerenciador_torneio.torneios}
+            torneios_por_nome = {t.nome: t for t in sistema.gerenciador_torneio.torneios}
+            for jogador in sistema.gerenciador_cadastros.jogadores:
+                for penalidade in jogador.penalidades:
+                    torneio = torneios_por_id.get(penalidade.get("torneio_id")) or torneios_por_nome.get(penalidade["torneio"])
+                    if torneio:
+                        self.conexao.execute(
+                            "INSERT INTO penalidades (jogador_id, torneio_id, tipo, data) VALUES (?, ?, ?, ?)",
+                            (jogador.id, torneio.id, penalidade["tipo"], penalidade["data"].isoformat())
+                        )
+            for deck in sistema.gerenciador_cadastros.decks:
+                self._gravar_deck(Persistencia._serializar_deck(deck))
+            for torneio in sistema.gerenciador_torneio.torneios:
+                for jogador in torneio.jogadores:
+                    deck = next((d for d in jogador.decks if d.torneio == torneio), None)
+                    self._gravar_inscricao({"torneio_id": torneio.id, "jogador_id": jogador.id, "deck_id": deck.id if deck else None})
+            for torneio in sistema.gerenciador_torneio.torneios:
+                for partida in torneio.partidas_concluidas:
+                    self._gravar_partida(Persistencia._serializar_partida(partida), torneio.id, partida.rodada, ativa=False)
+                    self._concluir_partida(SistemaTorneioCommander._dados_resultado(partida))
+                for denuncia in torneio.anti_colusao.denuncias:
+                    if denuncia.get("jogador_id"):
+                        self._gravar_denuncia({"torneio_id": torneio.id, **denuncia, "data": denuncia["data"].isoformat()})
+            for torneio in sistema.gerenciador_torneio.torneios:
+                if torneio.partidas_ativas:
+                    self._gravar_rodada({
+                        "torneio_id": torneio.id,
+                        "rodada_atual": torneio.rodada_atual,
+                        "partidas": [Persistencia._serializar_partida(p) for p in torneio.partidas_ativas],
+                        "historico_oponentes": Persistencia._serializar_historico(torneio.historico_oponentes)
+                    })
+        print(Fore.GREEN + f"Estado do sistema salvo em {self.caminho}" + Style.RESET_ALL)
+
+    def carregar_estado(self, sistema: 'SistemaTorneioCommander') -> bool:
+        """Carrega o estado do sistema a partir do banco SQLite"""
+        try:
+            if self.vazio():
+                return False
+            c = self.conexao
+            inscritos = {}
+            for row in c.execute("SELECT torneio_id, jogador_id FROM inscricoes ORDER BY ordem"):
+                inscritos.setdefault(row["torneio_id"], []).append(row["jogador_id"])
+            torneios = []
+            for row in c.execute("SELECT * FROM torneios ORDER BY data"):
+                dados = dict(row)
+                dados["juizes"] = json.loads(dados["juizes"])
+                dados["inscricoes_abertas"] = bool(dados["inscricoes_abertas"])
+                dados["historico_oponentes"] = json.loads(dados["historico_oponentes"]) if dados["historico_oponentes"] else None
+                dados["jogadores"] = inscritos.get(dados["id"], [])
+                torneios.append(dados)
+            eliminacoes = {}
+            for row in c.execute("SELECT * FROM eliminacoes ORDER BY ordem"):
+                dados = dict(row)
+                dados["desistiu"] = bool(dados["desistiu"])
+                eliminacoes.setdefault(dados.pop("partida_id"), []).append(dados)
+            jogadores_partida = {}
+            for row in c.execute("SELECT partida_id, jogador_id FROM partida_jogadores ORDER BY partida_id, posicao"):
+                jogadores_partida.setdefault(row["partida_id"], []).append(row["jogador_id"])
+            partidas = []
+            concluidas = []
+            historico = {}
+            # Partidas concluídas na ordem de conclusão; as de versões anteriores, sem ordem registrada, vêm antes
+            for row in c.execute("SELECT * FROM partidas ORDER BY ativa, concluida, rowid"):
+                partida = {
+                    "id": row["id"],
+                    "torneio_id": row["torneio_id"],
+                    "rodada": row["rodada"],
+                    "turno_atual": row["turno_atual"],
+                    "jogadores": jogadores_partida.get(row["id"], []),
+                    "eliminacoes": eliminacoes.get(row["id"], []),
+                    "pontuacoes": json.loads(row["pontuacoes"]) if row["pontuacoes"] else {},
+                    "resultados": json.loads(row["resultados"]) if row["resultados"] else {}
+                }
+                if row["ativa"]:
+                    partidas.append(partida)
+                    continue
+                concluidas.append(partida)
+                for jogador_id in partida["jogadores"]:
+                    historico.setdefault(jogador_id, []).append(partida["id"])
+            dados = {
+                "juizes": [dict(r, permissoes=json.loads(r["permissoes"])) for r in c.execute("SELECT * FROM juizes")],
+                "jogadores": [dict(r, historico_partidas=historico.get(r["id"], [])) for r in c.execute("SELECT * FROM jogadores")],
+                "decks": [dict(r, validado=bool(r["validado"]), ativo=bool(r["ativo"])) for r in c.execute("SELECT * FROM decks")],
+                "torneios": torneios,
+                "partidas_ativas": partidas,
+                "partidas_concluidas": concluidas
+            }
+            Persistencia._carregar_snapshot(sistema, dados)
+            # O banco não guarda os logs de colusão: eles são refeitos a partir dos resultados das partidas concluídas
+            for torneio in sistema.gerenciador_torneio.torneios:
+                for partida in torneio.partidas_concluidas:
+                    if partida.resultados:
+                        torneio.anti_colusao.logs_suspeitos.extend(torneio.anti_colusao.verificar_partida(partida, partida.resultados))
+            torneios_por_id = sistema.gerenciador_torneio.torneios_por_id
+            jogadores_por_id = sistema.gerenciador_cadastros.jogadores_por_id
+            for row in c.execute("SELECT * FROM denuncias ORDER BY ordem"):
+                jogador = jogadores_por_id[row["jogador_id"]]
+                torneios_por_id[row["torneio_id"]].anti_colusao.denuncias.append(
+                    {"jogador": jogador.nome, "jogador_id": jogador.id, "descricao": row["descricao"], "data": datetime.fromisoformat(row["data"])}
+                )
+            penalidades = c.execute(
+                "SELECT p.jogador_id, p.torneio_id, p.tipo, p.data, t.nome AS torneio FROM penalidades p JOIN torneios t ON t.id = p.torneio_id ORDER BY p.ordem"
+            ).fetchall()
+            if penalidades:
+                jogadores_por_id = sistema.gerenciador_cadastros.jogadores_por_id
+                for row in penalidades:
+                    jogador = jogadores_por_id[row["jogador_id"]]
+                    jogador.penalidades.append({"jogador": jogador.nome, "tipo": row["tipo"], "torneio": row["torneio"], "torneio_id": row["torneio_id"], "data": datetime.fromisoformat(row["data"])})
+            print(Fore.GREEN + f"Estado do sistema carregado de {self.caminho}" + Style.RESET_ALL)
+            return True
+        except Exception as e:
+            print(Fore.RED + f"Erro ao carregar estado: {e}" + Style.RESET_ALL)
+            return False
+
+    def migrar_json(self, caminho_json: str = 'dados_sistema.json') -> bool:
+        """Importa um dados_sistema.json existente (e seu journal) para o banco SQLite"""
+        origem = SistemaTorneioCommander(modo_persistencia="json")
+        if not Persistencia.carregar_estado(origem, caminho_json):
+            return False
+        self.salvar_estado(origem)
+        print(Fore.GREEN + f"Dados migrados de {caminho_json} para {self.caminho}" + Style.RESET_ALL)
+        return True
+
+    def buscar_jogador_por_email(self, email: str) -> Optional[dict]:
+        """Busca um jogador pelo email usando o índice único da tabela"""
+        row = self.conexao.execute("SELECT * FROM jogadores WHERE email = ?", (email,)).fetchone()
+        return dict(row) if row else None
+
+    def _gravar_juiz(self, dados: dict):
+        self.conexao.execute(
+            "INSERT OR REPLACE INTO juizes (id, nome, email, permissoes, senha_hash) VALUES (?, ?, ?, ?, ?)",
+            (dados["id"], dados["nome"], dados["email"], json.dumps(dados["permissoes"]), dados["senha_hash"])
+        )
+
+    def _gravar_jogador(self, dados: dict):
+        self.conexao.execute(
+            """INSERT OR REPLACE INTO jogadores (id, nome, email, indice_desempenho, vitorias_isoladas, soma_ids_oponentes, num_oponentes, senha_hash)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (dados["id"], dados["nome"], dados["email"], dados["indice_desempenho"], dados["vitorias_isoladas"],
+             dados["soma_ids_oponentes"], dados["num_oponentes"], dados["senha_hash"])
+        )
+
+    def _gravar_torneio(self, dados: dict):
+        self.conexao.execute(
+            """INSERT INTO torneios (id, nome, data, rodadas, min_jogadores, juizes, rodada_atual, inscricoes_abertas, tempo_rodada, turnos_extras, historico_oponentes)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET rodadas = excluded.rodadas, rodada_atual = excluded.rodada_atual,
+                   inscricoes_abertas = excluded.inscricoes_abertas, juizes = excluded.juizes""",
+            (dados["id"], dados["nome"], dados["data"], dados["rodadas"], dados["min_jogadores"], json.dumps(dados["juizes"]),
+             dados["rodada_atual"], int(dados["inscricoes_abertas"]), dados["tempo_rodada"], dados["turnos_extras"],
+             json.dumps(dados["historico_oponentes"]))
+        )
+
+    def _gravar_deck(self, dados: dict):
+        self.conexao.execute(
+            "INSERT OR REPLACE INTO decks (id, jogador_id, comandante, validado, torneio_id, ativo) VALUES (?, ?, ?, ?, ?, ?)",
+            (dados["id"], dados["jogador_id"], dados["comandante"], int(dados["validado"]), dados["torneio_id"], int(dados["ativo"]))
+        )
+
+    def _gravar_inscricao(self, dados: dict):
+        self.conexao.execute(
+            "INSERT OR IGNORE INTO inscricoes (torneio_id, jogador_id, deck_id) VALUES (?, ?, ?)",
+            (dados["torneio_id"], dados["jogador_id"], dados["deck_id"])
+        )
+        if dados["deck_id"]:
+            self.conexao.execute("UPDATE decks SET validado = 1, torneio_id = ? WHERE id = ?", (dados["torneio_id"], dados["deck_id"]))
+
+    def _gravar_rodada(self, dados: dict):
+        if dados["torneio_id"]:
+            self.conexao.execute(
+                "UPDATE torneios SET rodada_atual = ?, historico_oponentes = ? WHERE id = ?",
+                (dados["rodada_atual"], json.dumps(dados["historico_oponentes"]), dados["torneio_id"])
+            )
+        for partida in dados["partidas"]:
+            self._gravar_partida(partida, dados["torneio_id"], dados["rodada_atual"], ativa=True)
+
+    def _gravar_partida(self, partida: dict, torneio_id: Optional[str], rodada: Optional[int], ativa: bool):
+        self.conexao.execute(
+            "INSERT OR REPLACE INTO partidas (id, torneio_id, rodada, turno_atual, ativa) VALUES (?, ?, ?, ?, ?)",
+            (partida["id"], torneio_id, rodada, partida["turno_atual"], int(ativa))
+        )
+        self.conexao.executemany(
+            "INSERT OR REPLACE INTO partida_jogadores (partida_id, posicao, jogador_id) VALUES (?, ?, ?)",
+            [(partida["id"], posicao, jogador_id) for posicao, jogador_id in enumerate(partida["jogadores"])]
+        )
+        for eliminacao in partida["eliminacoes"]:
+            self._gravar_eliminacao({"partida_id": partida["id"], **eliminacao})
+
+    def _gravar_eliminacao(self, dados: dict):
+        self.conexao.execute(
+            "INSERT INTO eliminacoes (partida_id, jogador_eliminado, jogador_causador, turno, desistiu) VALUES (?, ?, ?, ?, ?)",
+            (dados["partida_id"], dados["jogador_eliminado"], dados["jogador_causador"], dados["turno"], int(dados["desistiu"]))
+        )
+
+    def _gravar_resultado(self, dados: dict):
+        self.conexao.executemany(
+            "UPDATE jogadores SET indice_desempenho = ?, vitorias_isoladas = ?, soma_ids_oponentes = ?, num_oponentes = ? WHERE id = ?",
+            [(j["indice_desempenho"], j["vitorias_isoladas"], j["soma_ids_oponentes"], j["num_oponentes"], j["id"]) for j in dados["jogadores"]]
+        )
+        self._concluir_partida(dados)
+
+    def _concluir_partida(self, dados: dict):
+        """Marca a partida como concluída, com resultados, pontuações e as eliminações finais"""
+        if "resultados" not in dados:
+            self.conexao.execute("UPDATE partidas SET ativa = 0 WHERE id = ?", (dados["partida_id"],))
+            return
+        self.conexao.execute("DELETE FROM eliminacoes WHERE partida_id = ?", (dados["partida_id"],))
+        for eliminacao in dados["eliminacoes"]:
+            self._gravar_eliminacao({"partida_id": dados["partida_id"], **eliminacao})
+        self.conexao.execute(
+            """UPDATE partidas SET ativa = 0, resultados = ?, pontuacoes = ?,
+                   concluida = (SELECT COALESCE(MAX(concluida), 0) + 1 FROM partidas)
+               WHERE id = ?""",
+            (json.dumps(dados["resultados"]), json.dumps(dados["pontuacoes"]), dados["partida_id"])
+        )
+
+    def _gravar_denuncia(self, dados: dict):
+        self.conexao.execute(
+            "INSERT INTO denuncias (torneio_id, jogador_id, descricao, data) VALUES (?, ?, ?, ?)",
+            (dados["torneio_id"], dados["jogador_id"], dados["descricao"], dados["data"])
+        )
+
+    def _gravar_penalidade(self, dados: dict):
+        self.conexao.execute(
+            "INSERT INTO penalidades (jogador_id, torneio_id, tipo, data) VALUES (?, ?, ?, ?)",
+            (dados["jogador_id"], dados["torneio_id"], dados["tipo"], dados["data"])
+        )
+        self.conexao.execute("UPDATE jogadores SET indice_desempenho = ? WHERE id = ?", (dados["indice_desempenho"], dados["jogador_id"]))
+        if dados["tipo"] == "DESCLASSIFICACAO":
+            self.conexao.execute("DELETE FROM inscricoes WHERE torneio_id = ? AND jogador_id = ?", (dados["torneio_id"], dados["jogador_id"]))
+
 class Validador:
     """Classe responsável por validações do sistema"""
     
@@ -239,6 +986,13 @@ class Juiz:
         self.senha_hash = senha  # Em uma implementação real, usar hash seguro
 
 class Jogador:
+    """Jogador cadastrado; usa __slots__, pois uma temporada pode ter centenas de milhares deles"""
+
+    __slots__ = (
+        "id", "nome", "email", "decks", "historico_partidas", "indice_desempenho", "vitorias_isoladas",
+        "soma_ids_oponentes", "num_oponentes", "penalidades", "senha_hash", "classificacoes"
+    )
+
     def __init__(self, nome: str, email: str):
         self.id = str(uuid.uuid4())
         self.nome = nome
@@ -247,8 +1001,13 @@ class Jogador:
         self.historico_partidas: List['Partida'] = []
         self.indice_desempenho: float = 0.0
         self.vitorias_isoladas: int = 0
+        # Agregado da força dos oponentes, mantido por SistemaDesempate.registrar_partida
+        self.soma_ids_oponentes: float = 0.0
+        self.num_oponentes: int = 0
         self.penalidades: List[Dict] = []
         self.senha_hash = None
+        # Classificações de torneio em que o jogador aparece, atualizadas quando o ID muda
+        self.classificacoes: List['Classificacao'] = []
 
     def definir_senha(self, senha: str):
         """Define a senha do jogador após validação"""
@@ -258,6 +1017,8 @@ class Jogador:
         self.senha_hash = senha  # Em uma implementação real, usar hash seguro
 
 class Deck:
+    __slots__ = ("id", "jogador", "comandante", "validado", "torneio", "ativo", "cadastro")
+
     def __init__(self, jogador: 'Jogador', comandante: str):
         self.id = str(uuid.uuid4())
         self.jogador = jogador
@@ -265,11 +1026,21 @@ class Deck:
         self.validado = False
         self.torneio: Optional['Torneio'] = None
         self.ativo = True
+        # Cadastro que indexa o deck por status, ligado por GerenciadorCadastros ao indexá-lo
+        self.cadastro: Optional['GerenciadorCadastros'] = None
+
+    def status_alterado(self):
+        """Avisa o cadastro de que o torneio ou a atividade do deck mudou"""
+        if self.cadastro is not None:
+            self.cadastro.atualizar_status_deck(self)
 
     def desativar(self):
         """Desativa o deck após o término do torneio"""
+        if self.torneio is not None and self.torneio.visoes:
+            self.torneio.visoes.torneio_alterado(self.torneio)
         self.ativo = False
         self.torneio = None
+        self.status_alterado()
 
 class Torneio:
     def __init__(self, nome: str, min_jogadores: int):
@@ -285,6 +1056,34 @@ class Torneio:
         self.inscricoes_abertas = True
         self.tempo_rodada = timedelta(minutes=45)
         self.turnos_extras = 5
+        self.historico_oponentes = HistoricoOponentes()
+        self.classificacao = Classificacao()
+        # Estado de execução próprio do torneio, para que vários eventos avancem de forma independente
+        self.partidas_ativas: List['Partida'] = []
+        # Partidas com resultado registrado, na ordem de conclusão
+        self.partidas_concluidas: List['Partida'] = []
+        self.tempo = GerenciadorTempo()
+        self.anti_colusao = SistemaAntiColusao()
+        # Visões do relatório da temporada, ligadas por GerenciadorTorneio.adicionar_torneio
+        self.visoes: Optional['VisoesRelatorio'] = None
+        # Protege inscritos, rodada, mesas, histórico de oponentes e partidas ativas
+        self.trava = threading.RLock()
+
+    def adicionar_jogador(self, jogador: Jogador):
+        """Inscreve o jogador na lista do torneio e na classificação"""
+        with self.trava:
+            self.jogadores.append(jogador)
+            self.classificacao.adicionar(jogador)
+            if self.visoes:
+                self.visoes.inscricao_alterada(self, jogador, True)
+
+    def remover_jogador(self, jogador: Jogador):
+        """Remove o jogador da lista do torneio e da classificação"""
+        with self.trava:
+            self.jogadores.remove(jogador)
+            self.classificacao.remover(jogador)
+            if self.visoes:
+                self.visoes.inscricao_alterada(self, jogador, False)
 
     def finalizar(self):
         """Finaliza o torneio e libera os decks"""
@@ -294,15 +1093,42 @@ class Torneio:
                     deck.desativar()
 
 class Partida:
-    def __init__(self, jogadores: List[Jogador], turno_inicial: int = 1):
+    """Mesa de uma rodada; usa __slots__, pois o histórico da temporada guarda todas as partidas concluídas"""
+
+    __slots__ = (
+        "id", "torneio_id", "rodada", "jogadores", "trava", "concluida", "turno_atual", "eliminacoes",
+        "resultado", "pontuacoes", "resultados", "tempo_inicio"
+    )
+    # Trava das partidas concluídas, que não precisam de exclusão: concluida é marcada antes da troca
+    TRAVA_CONCLUIDA = contextlib.nullcontext()
+
+    def __init__(self, jogadores: List[Jogador], turno_inicial: int = 1, torneio_id: Optional[str] = None, rodada: Optional[int] = None):
         self.id = str(uuid.uuid4())
+        self.torneio_id = torneio_id
+        self.rodada = rodada
         self.jogadores = jogadores
+        # Protege eliminações e pontuações durante o registro da partida
+        self.trava = threading.RLock()
+        self.concluida = False
         self.turno_atual = turno_inicial
         self.eliminacoes: List['Eliminacao'] = []
         self.resultado: Optional[str] = None
         self.pontuacoes: Dict[str, float] = {}
+        # Resultados informados por jogador (resultado, turno, vida final...), guardados ao processar a partida
+        self.resultados: Dict[str, dict] = {}
         self.tempo_inicio = datetime.now()
 
+    def concluir(self):
+        """Marca a partida como concluída e troca a sua trava pela trava vazia compartilhada
+
+        Uma partida concluída não muda mais e toda operação sobre ela é
+        recusada, então o RLock de cada partida do histórico seria memória
+        desperdiçada. Quem já esperava a trava antiga a recebe ao fim do
+        registro e vê a partida concluída.
+        """
+        self.concluida = True
+        self.trava = Partida.TRAVA_CONCLUIDA
+
     def validar_turno(self, turno: int, torneio: 'Torneio') -> bool:
         """Valida se o turno está dentro dos limites permitidos"""
         return Validador.validar_turno(turno, self, torneio)
@@ -312,6 +1138,8 @@ class Partida:
         return any(e.jogador_eliminado == jogador for e in self.eliminacoes)
 
 class Eliminacao:
+    __slots__ = ("jogador_eliminado", "jogador_causador", "turno", "desistiu")
+
     def __init__(self, jogador_eliminado: Jogador, jogador_causador: Optional[Jogador], turno: int, desistiu: bool = False):
         self.jogador_eliminado = jogador_eliminado
         self.jogador_causador = jogador_causador
@@ -320,7 +1148,9 @@ class Eliminacao:
 
 class Inscricao:
     """Classe que representa a inscrição de um jogador em um torneio com seu deck"""
-    
+
+    __slots__ = ("id", "torneio", "jogador", "deck", "data_inscricao", "status")
+
     def __init__(self, torneio: 'Torneio', jogador: 'Jogador', deck: 'Deck'):
         self.id = str(uuid.uuid4())
         self.torneio = torneio
@@ -332,79 +1162,410 @@ class Inscricao:
     def cancelar(self):
         """Cancela a inscrição e libera o deck para outros torneios"""
         self.status = "CANCELADA"
+        if self.torneio.visoes:
+            self.torneio.visoes.torneio_alterado(self.torneio)
         self.deck.torneio = None
+        self.deck.status_alterado()
         if self.jogador in self.torneio.jogadores:
-            self.torneio.jogadores.remove(self.jogador)
+            self.torneio.remover_jogador(self.jogador)
             
     def concluir(self):
         """Marca a inscrição como concluída após o término do torneio"""
         self.status = "CONCLUIDA"
         self.deck.desativar()
 
+class DetectorColusao:
+    """Estatísticas por par de jogadores atualizadas a cada resultado, para detectar colusão entre rodadas
+
+    Para cada par que já dividiu uma mesa são mantidos: quantas mesas dividiram,
+    quantas vezes cada um eliminou o outro, quantas vitórias sem dano a
+    oponentes cada um teve com o outro na mesa e quantas partidas longas sem
+    eliminações jogaram juntos. As taxas esperadas vêm dos totais de todas as
+    partidas já registradas no escopo (um torneio ou a temporada inteira).
+
+    Um par é marcado quando uma contagem, com ao menos MIN_OCORRENCIAS
+    ocorrências, tem probabilidade (cauda da binomial) abaixo de ALFA dividido
+    pelo número de testes (pares acompanhados vezes estatísticas): com milhares
+    de pares, um limiar fixo marcaria centenas deles por acaso. Cada par e
+    estatística é marcado uma única vez. O custo por resultado depende só do
+    tamanho da mesa (até 6 pares), não do número de partidas já registradas.
+    """
+
+    ALFA = 0.01
+    MIN_OCORRENCIAS = 3
+    TURNO_PROLONGADO = 20
+    # Posições das contagens de cada par (a, b), com a < b
+    JUNTOS, ELIMINACOES_AB, ELIMINACOES_BA, VITORIAS_SEM_DANO_A, VITORIAS_SEM_DANO_B, LONGAS_SEM_ELIMINACAO = range(6)
+
+    def __init__(self):
+        self.pares: Dict[Tuple[str, str], List[int]] = {}
+        self.partidas_por_jogador: Dict[str, int] = {}
+        self.total_partidas = 0
+        self.total_assentos = 0
+        # Pares ordenados (a, b) que dividiram mesa, somados em todas as partidas
+        self.total_pares_ordenados = 0
+        self.total_eliminacoes = 0
+        self.total_vitorias_sem_dano = 0
+        self.total_longas_sem_eliminacao = 0
+        self.alertas: List[dict] = []
+        self.marcados: Set[Tuple[str, str, str]] = set()
+        self.trava = threading.Lock()
+
+    @staticmethod
+    def _cauda_binomial(observado: int, tentativas: int, probabilidade: float) -> float:
+        """Probabilidade de pelo menos `observado` sucessos em `tentativas` com a probabilidade dada
+
+        Só é usada acima da média, onde os termos caem rapidamente: a soma para
+        quando o próximo termo não altera mais o resultado.
+        """
+        if observado <= tentativas * probabilidade:
+            return 1.0
+        if probabilidade <= 0:
+            return 0.0
+        if probabilidade >= 1:
+            return 1.0
+        termo = math.exp(
+            math.lgamma(tentativas + 1) - math.lgamma(observado + 1) - math.lgamma(tentativas - observado + 1)
+            + observado * math.log(probabilidade) + (tentativas - observado) * math.log1p(-probabilidade)
+        )
+        cauda = 0.0
+        razao = probabilidade / (1 - probabilidade)
+        for k in range(observado, tentativas + 1):
+            cauda += termo
+            if termo <= cauda * 1e-9:
+                break
+            termo *= (tentativas - k) / (k + 1) * razao
+        return min(cauda, 1.0)
+
+    def registrar_partida(self, partida: Partida, resultados: Dict[str, dict]) -> List[dict]:
+        """Acumula as estatísticas da partida e retorna os alertas novos dos pares da mesa"""
+        ids = [j.id for j in partida.jogadores]
+        if len(ids) < 2:
+            return []
+        eliminacoes = [
+            (e.jogador_causador.id, e.jogador_eliminado.id) for e in partida.eliminacoes
+            if e.jogador_causador and e.jogador_causador is not e.jogador_eliminado
+        ]
+        sem_dano = {
+            jid for jid, dados in resultados.items()
+            if dados["resultado"] == "VITORIA" and dados["oponentes_danificados"] == 0
+        }
+        longa = not partida.eliminacoes and max((d["turno"] for d in resultados.values()), default=0) > self.TURNO_PROLONGADO
+        with self.trava:
+            self.total_partidas += 1
+            self.total_assentos += len(ids)
+            self.total_pares_ordenados += len(ids) * (len(ids) - 1)
+            self.total_eliminacoes += len(eliminacoes)
+            self.total_vitorias_sem_dano += len(sem_dano)
+            self.total_longas_sem_eliminacao += longa
+            for jid in ids:
+                self.partidas_por_jogador[jid] = self.partidas_por_jogador.get(jid, 0) + 1
+            pares = []
+            for a, b in itertools.combinations(sorted(ids), 2):
+                contagens = self.pares.get((a, b))
+                if contagens is None:
+                    contagens = self.pares[(a, b)] = [0] * 6
+                contagens[self.JUNTOS] += 1
+                contagens[self.VITORIAS_SEM_DANO_A] += a in sem_dano
+                contagens[self.VITORIAS_SEM_DANO_B] += b in sem_dano
+                contagens[self.LONGAS_SEM_ELIMINACAO] += longa
+                pares.append((a, b))
+            for causador, eliminado in eliminacoes:
+                if causador < eliminado:
+                    self.pares[(causador, eliminado)][self.ELIMINACOES_AB] += 1
+                else:
+                    self.pares[(eliminado, causador)][self.ELIMINACOES_BA] += 1
+            novos = []
+            for a, b in pares:
+                for alerta in self._avaliar_par(a, b):
+                    chave = (a, b, alerta["estatistica"])
+                    if chave not in self.marcados:
+                        self.marcados.add(chave)
+                        self.alertas.append(alerta)
+                        novos.append(alerta)
+        return novos
+
+    def _avaliar_par(self, a: str, b: str) -> List[dict]:
+        """Estatísticas do par acima do limiar, com base nas taxas atuais do escopo"""
+        c = self.pares[(a, b)]
+        juntos = c[self.JUNTOS]
+        # Em cada partida do jogador que jogou menos, cada um dos outros assentos é
+        # do outro jogador com a chance da sua fração dos assentos de todas as partidas
+        menos, mais = sorted((self.partidas_por_jogador[a], self.partidas_por_jogador[b]))
+        chance_mesa = min(1.0, (self.total_assentos / self.total_partidas - 1) * mais / self.total_assentos)
+        testes = [
+            ("mesas_juntos", None, juntos, menos, chance_mesa),
+            ("eliminacoes", (a, b), c[self.ELIMINACOES_AB], juntos, self.total_eliminacoes / self.total_pares_ordenados),
+            ("eliminacoes", (b, a), c[self.ELIMINACOES_BA], juntos, self.total_eliminacoes / self.total_pares_ordenados),
+            ("vitorias_sem_dano", (a, b), c[self.VITORIAS_SEM_DANO_A], juntos, self.total_vitorias_sem_dano / self.total_assentos),
+            ("vitorias_sem_dano", (b, a), c[self.VITORIAS_SEM_DANO_B], juntos, self.total_vitorias_sem_dano / self.total_assentos),
+            ("longas_sem_eliminacao", None, c[self.LONGAS_SEM_ELIMINACAO], juntos, self.total_longas_sem_eliminacao / self.total_partidas),
+        ]
+        limiar = self.ALFA / (len(self.pares) * len(testes))
+        alertas = []
+        for estatistica, direcao, observado, tentativas, probabilidade in testes:
+            if observado < self.MIN_OCORRENCIAS:
+                continue
+            p = self._cauda_binomial(observado, tentativas, probabilidade)
+            if p < limiar:
+                alertas.append({
+                    "estatistica": estatistica if direcao is None else f"{estatistica}:{direcao[0]}",
+                    "jogadores": direcao or (a, b),
+                    "observado": observado,
+                    "tentativas": tentativas,
+                    "esperado": tentativas * probabilidade,
+                    "p": p
+                })
+        return alertas
+
+    def pares_suspeitos(self, limite: Optional[int] = None) -> List[dict]:
+        """Alertas registrados, do menos para o mais provável por acaso"""
+        with self.trava:
+            alertas = sorted(self.alertas, key=lambda a: a["p"])
+        return alertas[:limite] if limite else alertas
+
+    @staticmethod
+    def descrever(alerta: dict, nomes: Dict[str, str]) -> str:
+        """Texto do alerta com os nomes dos jogadores"""
+        a, b = (nomes.get(jid, jid) for jid in alerta["jogadores"])
+        estatistica = alerta["estatistica"].split(":")[0]
+        descricao = {
+            "mesas_juntos": f"{a} e {b}: dividiram {alerta['observado']} mesa(s)",
+            "eliminacoes": f"{a} eliminou {b} {alerta['observado']} vez(es) em {alerta['tentativas']} mesa(s)",
+            "vitorias_sem_dano": f"{a} venceu sem dano a oponentes {alerta['observado']} vez(es) com {b} na mesa",
+            "longas_sem_eliminacao": f"{a} e {b}: {alerta['observado']} partida(s) longa(s) sem eliminações juntos",
+        }[estatistica]
+        return f"{descricao} (esperado {alerta['esperado']:.2f}, p = {alerta['p']:.1e})."
+
 class SistemaAntiColusao:
+    """Análise de colusão de um torneio
+
+    Cada resultado é verificado isoladamente (logs_suspeitos) e alimenta o
+    detector de pares do torneio e, quando o torneio pertence a um gerenciador,
+    o detector da temporada, compartilhado por todos os torneios.
+    """
+
     def __init__(self):
         self.denuncias = []
         self.logs_suspeitos = []
+        self.detector = DetectorColusao()
+        self.detector_temporada: Optional[DetectorColusao] = None
+        self.trava = threading.Lock()
 
     def analisar_padroes(self, partida: Partida, resultados: Dict[str, dict]) -> List[str]:
+        """Registra as suspeitas da partida e retorna-as junto com os alertas novos de pares"""
+        suspeitas = self.verificar_partida(partida, resultados)
+        with self.trava:
+            self.logs_suspeitos.extend(suspeitas)
+        return suspeitas + self.registrar_estatisticas(partida, resultados)
+
+    def verificar_partida(self, partida: Partida, resultados: Dict[str, dict]) -> List[str]:
+        """Padrões suspeitos de uma partida isolada, sem alterar o estado"""
+        jogadores = {j.id: j for j in partida.jogadores}
+        causadores = {e.jogador_causador.id for e in partida.eliminacoes if e.jogador_causador}
         suspeitas = []
         for jogador_id, dados in resultados.items():
-            jogador = next(j for j in partida.jogadores if j.id == jogador_id)
+            jogador = jogadores[jogador_id]
             if self._verificar_vitoria_sem_pa(dados):
                 suspeitas.append(f"{jogador.nome}: Vitória sem dano a oponentes (PA = 0).")
-            if self._verificar_eliminacoes_concentradas(partida, jogador_id, dados):
+            if self._verificar_eliminacoes_concentradas(causadores, jogador_id, dados):
                 suspeitas.append(f"{jogador.nome}: Eliminações concentradas em um único causador.")
             if self._verificar_turnos_prolongados(dados):
                 suspeitas.append(f"{jogador.nome}: Turno prolongado (>{dados['turno']}) sem eliminações.")
-        self.logs_suspeitos.extend(suspeitas)
+        return suspeitas
+
+    def registrar_estatisticas(self, partida: Partida, resultados: Dict[str, dict]) -> List[str]:
+        """Atualiza os detectores de pares do torneio e da temporada e descreve os alertas novos"""
+        nomes = {j.id: j.nome for j in partida.jogadores}
+        mensagens = [DetectorColusao.descrever(a, nomes) for a in self.detector.registrar_partida(partida, resultados)]
+        if self.detector_temporada is not None:
+            mensagens.extend(
+                f"Temporada: {DetectorColusao.descrever(a, nomes)}" for a in self.detector_temporada.registrar_partida(partida, resultados)
+            )
+        return mensagens
+
+    def analisar_rodada(self, mesas: List[Tuple[Partida, Dict[str, dict]]]) -> List[str]:
+        """Analisa os padrões de todas as mesas de uma rodada"""
+        suspeitas = []
+        for partida, resultados in mesas:
+            suspeitas.extend(self.analisar_padroes(partida, resultados))
         return suspeitas
 
     def _verificar_vitoria_sem_pa(self, dados: dict) -> bool:
         return dados["resultado"] == "VITORIA" and dados["oponentes_danificados"] == 0
 
-    def _verificar_eliminacoes_concentradas(self, partida: Partida, jogador_id: str, dados: dict) -> bool:
-        if dados["eliminacoes"] == 0:
-            return False
-        causadores = [e.jogador_causador.id for e in partida.eliminacoes if e.jogador_causador and e.jogador_causador.id == jogador_id]
-        return len(set(causadores)) == 1
+    def _verificar_eliminacoes_concentradas(self, causadores: Set[str], jogador_id: str, dados: dict) -> bool:
+        return dados["eliminacoes"] != 0 and jogador_id in causadores
 
     def _verificar_turnos_prolongados(self, dados: dict) -> bool:
         return dados["turno"] > 20 and dados["eliminacoes"] == 0
 
-    def registrar_denuncia(self, jogador: Jogador, descricao: str):
-        self.denuncias.append({"jogador": jogador.nome, "descricao": descricao, "data": datetime.now()})
+    def registrar_denuncia(self, jogador: Jogador, descricao: str) -> dict:
+        denuncia = {"jogador": jogador.nome, "jogador_id": jogador.id, "descricao": descricao, "data": datetime.now()}
+        with self.trava:
+            self.denuncias.append(denuncia)
         print(f"Denúncia registrada contra {jogador.nome}: {descricao}")
+        return denuncia
 
     def aplicar_penalidade(self, jogador: Jogador, tipo: str, torneio: Torneio) -> float:
-        penalidade = {"jogador": jogador.nome, "tipo": tipo, "torneio": torneio.nome, "data": datetime.now()}
+        penalidade = {"jogador": jogador.nome, "tipo": tipo, "torneio": torneio.nome, "torneio_id": torneio.id, "data": datetime.now()}
         jogador.penalidades.append(penalidade)
+        if torneio.visoes:
+            torneio.visoes.jogador_alterado(jogador)
         if tipo == "ADVERTENCIA":
             print(f"Advertência aplicada a {jogador.nome}.")
             return 0
         elif tipo == "REDUCAO_ID":
             reducao = jogador.indice_desempenho * 0.2
             jogador.indice_desempenho -= reducao
+            Classificacao.atualizar_jogador(jogador)
             print(f"Redução de 20% no ID aplicada a {jogador.nome} (-{reducao:.2f} pontos).")
             return reducao
         elif tipo == "DESCLASSIFICACAO":
-            torneio.jogadores.remove(jogador)
+            torneio.remover_jogador(jogador)
             jogador.indice_desempenho = 0
+            Classificacao.atualizar_jogador(jogador)
             print(f"{jogador.nome} desclassificado do torneio {torneio.nome}.")
             return jogador.indice_desempenho
         return 0
 
+class HistoricoOponentes:
+    """Histórico de confrontos de um torneio em uma matriz de contagens indexada por inteiros
+
+    Cada jogador recebe um índice inteiro na primeira vez em que aparece; a célula
+    [i, j] guarda quantas vezes os jogadores i e j dividiram uma mesa.
+    """
+
+    def __init__(self, capacidade: int = 16):
+        self.indices: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.contagens = np.zeros((capacidade, capacidade), dtype=np.uint8)
+
+    def indice(self, jogador_id: str) -> int:
+        """Retorna o índice inteiro do jogador, atribuindo um novo se necessário"""
+        indice = self.indices.get(jogador_id)
+        if indice is None:
+            indice = len(self.ids)
+            self.indices[jogador_id] = indice
+            self.ids.append(jogador_id)
+            if indice >= len(self.contagens):
+                capacidade = max(2 * len(self.contagens), 16)
+                contagens = np.zeros((capacidade, capacidade), dtype=np.uint8)
+                contagens[:len(self.contagens), :len(self.contagens)] = self.contagens
+                self.contagens = contagens
+        return indice
+
+    def registrar_mesa(self, jogadores_ids: List[str]):
+        """Registra que todos os jogadores da mesa se enfrentaram uma vez"""
+        idx = np.array([self.indice(jid) for jid in jogadores_ids])
+        self.contagens[np.ix_(idx, idx)] += 1
+        self.contagens[idx, idx] -= 1
+
+    def vezes_enfrentados(self, jogador_id: str, oponente_id: str) -> int:
+        a, b = self.indices.get(jogador_id), self.indices.get(oponente_id)
+        if a is None or b is None:
+            return 0
+        return int(self.contagens[a, b])
+
+    def oponentes(self, jogador_id: str) -> Set[str]:
+        """Retorna os ids dos oponentes já enfrentados pelo jogador"""
+        indice = self.indices.get(jogador_id)
+        if indice is None:
+            return set()
+        return {self.ids[i] for i in np.flatnonzero(self.contagens[indice, :len(self.ids)])}
+
+    def repeticoes(self, indices: List[int]) -> int:
+        """Pontua uma mesa candidata: total de confrontos anteriores entre seus jogadores"""
+        return int(self.contagens[np.ix_(indices, indices)].sum(dtype=np.int64)) // 2
+
+    def matriz_densa(self) -> np.ndarray:
+        """Cópia das contagens dos jogadores indexados, com uma linha e uma coluna zeradas ao final
+
+        O índice extra (len(ids)) completa mesas de 3 jogadores nas matrizes de mesas.
+        """
+        n = len(self.ids)
+        return np.pad(self.contagens[:n, :n], ((0, 1), (0, 1)))
+
+    @staticmethod
+    def repeticoes_das_mesas(contagens: np.ndarray, mesas: np.ndarray) -> np.ndarray:
+        """Pontua as linhas de uma matriz de mesas (completadas com o índice vazio) em uma única operação vetorizada"""
+        return contagens[mesas[:, :, None], mesas[:, None, :]].sum(axis=(1, 2), dtype=np.int64) // 2
+
+    def repeticoes_por_mesa(self, mesas: List[List[int]]) -> np.ndarray:
+        """Pontua todas as mesas de uma distribuição em uma única operação vetorizada"""
+        tamanho = max(len(m) for m in mesas)
+        vazio = len(self.ids)
+        matriz = np.array([m + [vazio] * (tamanho - len(m)) for m in mesas])
+        return self.repeticoes_das_mesas(self.matriz_densa(), matriz)
+
 class SistemaEmparelhamento:
-    def __init__(self):
-        self.historico_oponentes = {}
+    """Classe responsável por distribuir os jogadores em mesas a cada rodada
+
+    A distribuição parte de uma atribuição gulosa e é refinada por busca local
+    (trocas de jogadores entre mesas) dentro de um orçamento de tempo e de iterações,
+    minimizando o custo combinado de desvio de ID e de oponentes repetidos.
+    O histórico de oponentes fica em cada torneio (Torneio.historico_oponentes).
+
+    Com processos > 1, várias buscas com sementes independentes rodam em paralelo,
+    em um pool de processos reaproveitado entre as rodadas, e a de menor custo é
+    mantida; todas param no mesmo prazo, contado do início da distribuição. Com
+    uma semente fixa, o resultado é reproduzível sempre que o orçamento de
+    iterações se esgota antes do de tempo.
+    """
+
+    TOLERANCIA_DESVIO = 0.05
+    # Peso de cada confronto repetido, em unidades de desvio relativo da média
+    PESO_REPETICAO = 1.0
+    # Espera além do prazo pelos resultados das buscas paralelas, que param sozinhas no prazo
+    MARGEM_COLETA = 0.1
+
+    def __init__(self, tempo_limite: float = 1.0, max_iteracoes: int = 20000, processos: int = 1, inicios: Optional[int] = None, semente: Optional[int] = None):
+        self.tempo_limite = tempo_limite
+        self.max_iteracoes = max_iteracoes
+        self.processos = processos
+        self.inicios = inicios or processos
+        self.semente = semente
+        # Cada thread vê o resultado do seu último emparelhamento (torneios podem ser emparelhados em paralelo)
+        self._local = threading.local()
+        # Pool da busca paralela, criado no primeiro uso e mantido entre as rodadas
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._trava_pool = threading.Lock()
+
+    def _obter_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._trava_pool:
+            if self._pool is None:
+                self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.processos)
+            return self._pool
+
+    def fechar(self):
+        """Encerra o pool da busca paralela sem esperar as buscas em andamento, que param no próprio prazo"""
+        with self._trava_pool:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def ultimo_resultado(self) -> Dict:
+        return getattr(self._local, "ultimo_resultado", {})
+
+    @ultimo_resultado.setter
+    def ultimo_resultado(self, resultado: Dict):
+        self._local.ultimo_resultado = resultado
 
     def validar_desvio(self, mesa: List[Jogador], media_torneio: float) -> bool:
+        return self._desvio_mesa(mesa, media_torneio) <= self.TOLERANCIA_DESVIO
+
+    def evitar_repeticao(self, jogador: Jogador, mesa: List[Jogador], historico: HistoricoOponentes) -> bool:
+        return not any(historico.vezes_enfrentados(jogador.id, op.id) for op in mesa)
+
+    def _desvio_mesa(self, mesa: List[Jogador], media_torneio: float) -> float:
         media_mesa = Utilitarios.calcular_media_ids(mesa)
-        desvio = abs(media_mesa - media_torneio) / media_torneio if media_torneio > 0 else 0
-        return desvio <= 0.05
+        return abs(media_mesa - media_torneio) / media_torneio if media_torneio > 0 else 0
 
-    def evitar_repeticao(self, jogador: Jogador, mesa: List[Jogador]) -> bool:
-        oponentes_anteriores = self.historico_oponentes.get(jogador.id, set())
-        return not any(op.id in oponentes_anteriores for op in mesa)
+    def custo_mesa(self, mesa: List[Jogador], media_torneio: float, historico: HistoricoOponentes) -> float:
+        """Custo de uma mesa: desvio relativo da média do torneio mais as repetições de oponentes"""
+        repeticoes = historico.repeticoes([historico.indice(j.id) for j in mesa])
+        return self._desvio_mesa(mesa, media_torneio) + self.PESO_REPETICAO * repeticoes
 
     def distribuir_jogadores(self, torneio: Torneio) -> List[List[Jogador]]:
         num_jogadores = len(torneio.jogadores)
@@ -415,37 +1576,202 @@ class SistemaEmparelhamento:
         if not valido:
             raise ValueError(mensagem)
         
+        historico = torneio.historico_oponentes
+        # Com semente fixa, cada rodada tem sua própria sequência reproduzível
+        rng = random.Random(self.semente + torneio.rodada_atual) if self.semente is not None else random.Random()
         jogadores = torneio.jogadores.copy()
         media_torneio = Utilitarios.calcular_media_ids(jogadores)
         if torneio.rodada_atual == 0:
-            random.shuffle(jogadores)
+            rng.shuffle(jogadores)
         else:
             jogadores.sort(key=lambda x: x.indice_desempenho, reverse=True)
         
         mesas = []
         while jogadores:
             mesa_size = 4 if len(jogadores) >= 4 else 3
-            mesa = self._formar_mesa(jogadores, mesa_size)
-            if self.validar_desvio(mesa, media_torneio):
-                mesas.append(mesa)
-                for j in mesa:
-                    self.historico_oponentes.setdefault(j.id, set()).update(op.id for op in mesa if op != j)
-            else:
-                jogadores.extend(mesa)
-                random.shuffle(jogadores)
+            mesas.append(self._formar_mesa(jogadores, mesa_size, historico))
+
+        mesas, custo = self.otimizar_mesas(mesas, media_torneio, historico, rng)
+        for mesa in mesas:
+            historico.registrar_mesa([j.id for j in mesa])
         
         if not mesas:
             raise ValueError("Não foi possível formar mesas válidas.")
         return mesas
 
-    def _formar_mesa(self, jogadores: List[Jogador], mesa_size: int) -> List[Jogador]:
+    def _formar_mesa(self, jogadores: List[Jogador], mesa_size: int, historico: HistoricoOponentes) -> List[Jogador]:
+        """Retira da frente da fila uma mesa evitando repetições, completando-a se necessário"""
         mesa = []
-        for jogador in jogadores[:]:
-            if len(mesa) < mesa_size and self.evitar_repeticao(jogador, mesa):
+        escolhidos = []
+        for posicao, jogador in enumerate(jogadores):
+            if len(mesa) == mesa_size:
+                break
+            if self.evitar_repeticao(jogador, mesa, historico):
                 mesa.append(jogador)
-                jogadores.remove(jogador)
+                escolhidos.append(posicao)
+        # Sem candidatos sem repetição suficientes: completa com os próximos da fila
+        # e deixa a busca local decidir as trocas
+        for posicao in range(len(jogadores)):
+            if len(mesa) == mesa_size:
+                break
+            if posicao not in escolhidos:
+                mesa.append(jogadores[posicao])
+                escolhidos.append(posicao)
+        for posicao in sorted(escolhidos, reverse=True):
+            del jogadores[posicao]
         return mesa
 
+    def otimizar_mesas(self, mesas: List[List[Jogador]], media_torneio: float, historico: HistoricoOponentes, rng: Optional[random.Random] = None) -> Tuple[List[List[Jogador]], float]:
+        """Refina as mesas por trocas de jogadores, dentro do orçamento, e retorna a melhor distribuição e seu custo"""
+        rng = rng or random.Random(self.semente)
+        # A busca trabalha sobre os índices inteiros do histórico
+        jogadores = {historico.indice(j.id): j for mesa in mesas for j in mesa}
+        desempenho = [0.0] * len(historico.ids)
+        for i, j in jogadores.items():
+            desempenho[i] = j.indice_desempenho
+        mesas_idx = [[historico.indice(j.id) for j in mesa] for mesa in mesas]
+        sementes = [rng.randrange(2 ** 32) for _ in range(max(self.inicios, 1))]
+
+        inicio = time.perf_counter()
+        # Prazo único de todas as buscas, no relógio monotônico (comum aos processos)
+        prazo = time.monotonic() + self.tempo_limite
+        resultados = None
+        if self.processos > 1 and len(sementes) > 1:
+            resultados = self._buscar_em_paralelo(mesas_idx, desempenho, media_torneio, historico, sementes, prazo)
+        if not resultados:
+            # Modo de processo único (ou pool indisponível): uma busca com a primeira semente, no tempo que resta
+            melhores_idx, _, iteracoes = self._busca_local(
+                mesas_idx, desempenho, media_torneio, historico.matriz_densa(), random.Random(sementes[0]),
+                prazo, self.max_iteracoes, self.PESO_REPETICAO
+            )
+            resultados = [(melhores_idx, iteracoes, sementes[0])]
+
+        melhores_idx, iteracoes, semente = min(
+            resultados,
+            key=lambda r: sum(self._desvio_mesa([jogadores[i] for i in m], media_torneio) for m in r[0]) + self.PESO_REPETICAO * int(historico.repeticoes_por_mesa(r[0]).sum())
+        )
+        mesas_finais = [[jogadores[i] for i in mesa] for mesa in melhores_idx]
+        repeticoes = historico.repeticoes_por_mesa(melhores_idx)
+        custo_final = float(sum(self._desvio_mesa(m, media_torneio) for m in mesas_finais) + self.PESO_REPETICAO * repeticoes.sum())
+        self.ultimo_resultado = {
+            "custo": custo_final,
+            "iteracoes": iteracoes,
+            "tempo": time.perf_counter() - inicio,
+            "repeticoes": int(repeticoes.sum()),
+            "mesas_fora_tolerancia": sum(1 for m in mesas_finais if not self.validar_desvio(m, media_torneio)),
+            "inicios": len(resultados),
+            "semente": semente
+        }
+        return mesas_finais, custo_final
+
+    def _buscar_em_paralelo(self, mesas_idx: List[List[int]], desempenho: List[float], media_torneio: float, historico: HistoricoOponentes,
+                            sementes: List[int], prazo: float) -> List[Tuple[List[List[int]], int, int]]:
+        """Executa uma busca por semente no pool de processos e coleta as que terminam dentro do prazo
+
+        Sementes além do número de processos esperam um processo livre e têm
+        apenas o tempo que restar; as que não começarem até o prazo são canceladas.
+        """
+        contagens = historico.matriz_densa()
+        tarefas = [
+            {
+                "mesas": mesas_idx,
+                "desempenho": desempenho,
+                "media_torneio": media_torneio,
+                "contagens": contagens,
+                "semente": semente,
+                # A primeira semente parte da distribuição gulosa; as demais, de uma perturbação dela
+                "perturbar": k > 0,
+                "prazo": prazo,
+                "max_iteracoes": self.max_iteracoes,
+                "peso_repeticao": self.PESO_REPETICAO
+            }
+            for k, semente in enumerate(sementes)
+        ]
+        resultados = []
+        try:
+            pool = self._obter_pool()
+            futuros = [pool.submit(SistemaEmparelhamento._busca_em_processo, tarefa) for tarefa in tarefas]
+            restante = prazo - time.monotonic()
+            espera = None if math.isinf(restante) else max(restante, 0.0) + self.MARGEM_COLETA
+            concluidos, pendentes = concurrent.futures.wait(futuros, timeout=espera)
+            for futuro in pendentes:
+                futuro.cancel()
+            for futuro, semente in zip(futuros, sementes):
+                if futuro in concluidos and futuro.exception() is None:
+                    melhores_idx, _, iteracoes = futuro.result()
+                    resultados.append((melhores_idx, iteracoes, semente))
+        except (OSError, RuntimeError, concurrent.futures.BrokenExecutor) as e:
+            self.fechar()
+            print(Fore.YELLOW + f"Aviso: emparelhamento paralelo indisponível ({e}). Usando um único processo." + Style.RESET_ALL)
+        return resultados
+
+    @staticmethod
+    def _busca_em_processo(tarefa: dict) -> Tuple[List[List[int]], float, int]:
+        """Ponto de entrada dos processos do pool: executa a busca de uma semente sobre a matriz de confrontos recebida"""
+        rng = random.Random(tarefa["semente"])
+        mesas = [mesa.copy() for mesa in tarefa["mesas"]]
+        if tarefa["perturbar"] and len(mesas) > 1:
+            for _ in range(len(mesas)):
+                a, b = rng.sample(range(len(mesas)), 2)
+                i, k = rng.randrange(len(mesas[a])), rng.randrange(len(mesas[b]))
+                mesas[a][i], mesas[b][k] = mesas[b][k], mesas[a][i]
+        return SistemaEmparelhamento._busca_local(
+            mesas, tarefa["desempenho"], tarefa["media_torneio"], tarefa["contagens"], rng,
+            tarefa["prazo"], tarefa["max_iteracoes"], tarefa["peso_repeticao"]
+        )
+
+    @staticmethod
+    def _busca_local(mesas_idx: List[List[int]], desempenho: List[float], media_torneio: float, contagens: np.ndarray, rng: random.Random,
+                     prazo: float, max_iteracoes: int, peso_repeticao: float) -> Tuple[List[List[int]], float, int]:
+        """Busca local por trocas entre mesas até o prazo (time.monotonic); retorna a melhor distribuição, seu custo e as iterações usadas
+
+        contagens é a matriz de HistoricoOponentes.matriz_densa: as mesas ficam em
+        uma matriz de índices completada com o índice vazio, e as repetições das
+        duas mesas de cada troca saem de uma única indexação da matriz.
+        """
+        tamanhos = [len(mesa) for mesa in mesas_idx]
+        vazio = len(contagens) - 1
+        mesas = np.array([mesa + [vazio] * (max(tamanhos) - len(mesa)) for mesa in mesas_idx])
+        desempenho = list(desempenho) + [0.0]
+
+        def custos_das_mesas(linhas: List[int]) -> List[float]:
+            selecionadas = mesas[linhas]
+            repeticoes = HistoricoOponentes.repeticoes_das_mesas(contagens, selecionadas).tolist()
+            custos = []
+            for linha, mesa, repeticao in zip(linhas, selecionadas.tolist(), repeticoes):
+                media_mesa = sum(desempenho[i] for i in mesa) / tamanhos[linha]
+                desvio = abs(media_mesa - media_torneio) / media_torneio if media_torneio > 0 else 0
+                custos.append(desvio + peso_repeticao * repeticao)
+            return custos
+
+        custos = custos_das_mesas(list(range(len(mesas))))
+        custo_atual = sum(custos)
+        melhor = (mesas.copy(), custo_atual)
+        iteracoes = 0
+
+        while len(mesas) > 1 and custo_atual > 0 and iteracoes < max_iteracoes:
+            # Consulta o relógio periodicamente para não pesar em cada iteração
+            if iteracoes % 256 == 0 and time.monotonic() > prazo:
+                break
+            iteracoes += 1
+            # Seleção por torneio: entre algumas mesas sorteadas, parte da mais custosa
+            a = max(rng.sample(range(len(mesas)), min(4, len(mesas))), key=custos.__getitem__)
+            b = rng.randrange(len(mesas) - 1)
+            b += b >= a
+            i, k = rng.randrange(tamanhos[a]), rng.randrange(tamanhos[b])
+            mesas[a, i], mesas[b, k] = mesas[b, k], mesas[a, i]
+            novo_a, novo_b = custos_das_mesas([a, b])
+            delta = novo_a + novo_b - custos[a] - custos[b]
+            if delta <= 0:
+                custos[a], custos[b] = novo_a, novo_b
+                custo_atual += delta
+                if custo_atual < melhor[1] - 1e-12:
+                    melhor = (mesas.copy(), custo_atual)
+            else:
+                mesas[a, i], mesas[b, k] = mesas[b, k], mesas[a, i]
+
+        return [linha[:tamanho] for linha, tamanho in zip(melhor[0].tolist(), tamanhos)], melhor[1], iteracoes
+
 class CalculadorIndiceDesempenho:
     """Classe responsável por calcular o índice de desempenho dos jogadores"""
     
@@ -462,6 +1788,18 @@ class CalculadorIndiceDesempenho:
         }
     }
 
+    # Códigos inteiros dos resultados usados no cálculo em lote
+    CODIGOS_RESULTADO = {"VITORIA": 0, "EMPATE": 1, "DERROTA": 2}
+
+    # Domínio da tabela pré-calculada: o TV é constante a partir do turno 21
+    # e a vida é limitada a 40; eliminações e oponentes danificados vão até 3
+    TURNO_MAXIMO_TABELA = 21
+    VIDA_MAXIMA_TABELA = 40
+    ELIMINACOES_MAXIMAS_TABELA = 3
+    # Menor mesa da tabela: o último eixo é indexado por jogadores_mesa - MESA_MINIMA_TABELA
+    MESA_MINIMA_TABELA = 3
+    _tabela_pontuacao: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
     @staticmethod
     def calcular_rp(resultado: str) -> float:
         if resultado == "VITORIA":
@@ -537,124 +1875,1088 @@ class CalculadorIndiceDesempenho:
         min_lim, max_lim = CalculadorIndiceDesempenho.LIMITES_PONTUACAO[jogadores_mesa][resultado]
         return min_lim <= id_calculado <= max_lim
 
+    @staticmethod
+    def calcular_pontuacao(resultado: str, turno: int, eliminacoes: int, vida_final: int, oponentes_danificados: int, jogadores_mesa: int) -> Tuple[float, bool]:
+        """Calcula o ID de um jogador pela fórmula e indica se está dentro dos limites"""
+        id_calculado = CalculadorIndiceDesempenho.calcular_id(
+            CalculadorIndiceDesempenho.calcular_rp(resultado),
+            CalculadorIndiceDesempenho.calcular_tv(resultado, turno),
+            CalculadorIndiceDesempenho.calcular_er(resultado, eliminacoes, jogadores_mesa),
+            CalculadorIndiceDesempenho.calcular_pv(resultado, vida_final),
+            CalculadorIndiceDesempenho.calcular_pa(resultado, oponentes_danificados),
+            jogadores_mesa == 3
+        )
+        return id_calculado, CalculadorIndiceDesempenho.validar_pontuacao(id_calculado, resultado, jogadores_mesa)
+
+    @staticmethod
+    def tabela_pontuacao() -> Tuple[np.ndarray, np.ndarray]:
+        """Tabela (IDs, válidos) de todas as combinações de entrada, construída no primeiro uso
+
+        São dois vetores densos indexados por (código do resultado, turno,
+        eliminações, vida, oponentes danificados, jogadores na mesa - 3), com os
+        valores calculados por calcular_lote: cerca de 0,8 MB para 86.592 entradas.
+        """
+        calc = CalculadorIndiceDesempenho
+        if calc._tabela_pontuacao is None:
+            dimensoes = (
+                len(calc.CODIGOS_RESULTADO),
+                calc.TURNO_MAXIMO_TABELA + 1,
+                calc.ELIMINACOES_MAXIMAS_TABELA + 1,
+                calc.VIDA_MAXIMA_TABELA + 1,
+                calc.ELIMINACOES_MAXIMAS_TABELA + 1,
+                len(calc.LIMITES_PONTUACAO)
+            )
+            resultado, turno, eliminacoes, vida, danificados, mesa = np.indices(dimensoes).reshape(6, -1)
+            ids, validos = calc.calcular_lote(resultado, turno, eliminacoes, vida, danificados, mesa + calc.MESA_MINIMA_TABELA)
+            calc._tabela_pontuacao = (ids.reshape(dimensoes), validos.reshape(dimensoes))
+        return calc._tabela_pontuacao
+
+    @staticmethod
+    def consultar_pontuacao(resultado: str, turno: int, eliminacoes: int, vida_final: int, oponentes_danificados: int, jogadores_mesa: int) -> Tuple[float, bool]:
+        """Retorna (ID, válido) pela tabela pré-calculada, recorrendo à fórmula fora do domínio tabelado"""
+        calc = CalculadorIndiceDesempenho
+        ids, validos = calc._tabela_pontuacao or calc.tabela_pontuacao()
+        codigo = calc.CODIGOS_RESULTADO.get(resultado)
+        mesa = jogadores_mesa - calc.MESA_MINIMA_TABELA
+        maximo = calc.ELIMINACOES_MAXIMAS_TABELA
+        if codigo is None or turno < 0 or vida_final < 0 or not (0 <= eliminacoes <= maximo and 0 <= oponentes_danificados <= maximo and 0 <= mesa <= 1):
+            return calc.calcular_pontuacao(resultado, turno, eliminacoes, vida_final, oponentes_danificados, jogadores_mesa)
+        turno_maximo, vida_maxima = calc.TURNO_MAXIMO_TABELA, calc.VIDA_MAXIMA_TABELA
+        indice = (
+            codigo, turno if turno < turno_maximo else turno_maximo, eliminacoes,
+            vida_final if vida_final < vida_maxima else vida_maxima, oponentes_danificados, mesa
+        )
+        return ids.item(indice), validos.item(indice)
+
+    @staticmethod
+    def chaves_tabela() -> Iterator[Tuple[str, int, int, int, int, int]]:
+        """Gera as entradas (resultado, turno, eliminações, vida, oponentes danificados, jogadores na mesa) cobertas pela tabela"""
+        calc = CalculadorIndiceDesempenho
+        return itertools.product(
+            calc.CODIGOS_RESULTADO,
+            range(calc.TURNO_MAXIMO_TABELA + 1),
+            range(calc.ELIMINACOES_MAXIMAS_TABELA + 1),
+            range(calc.VIDA_MAXIMA_TABELA + 1),
+            range(calc.ELIMINACOES_MAXIMAS_TABELA + 1),
+            sorted(calc.LIMITES_PONTUACAO)
+        )
+
+    @staticmethod
+    def conferir_tabela() -> int:
+        """Confere exaustivamente a tabela contra a fórmula e retorna o número de combinações verificadas"""
+        verificadas = 0
+        for chave in CalculadorIndiceDesempenho.chaves_tabela():
+            obtido = CalculadorIndiceDesempenho.consultar_pontuacao(*chave)
+            esperado = CalculadorIndiceDesempenho.calcular_pontuacao(*chave)
+            if obtido != esperado:
+                raise ValueError(f"Tabela de pontuação divergente em {chave}: {obtido} != {esperado}")
+            verificadas += 1
+        return verificadas
+
+    @staticmethod
+    def codificar_resultados(resultados: List[str]) -> np.ndarray:
+        """Converte nomes de resultado (VITORIA/EMPATE/DERROTA) para os códigos do cálculo em lote"""
+        try:
+            return np.array([CalculadorIndiceDesempenho.CODIGOS_RESULTADO[r] for r in resultados], dtype=np.int64)
+        except KeyError as e:
+            raise ValueError(f"Resultado inválido: {e.args[0]}") from None
+
+    @staticmethod
+    def calcular_lote(resultados, turnos, eliminacoes, vidas_finais, oponentes_danificados, jogadores_mesa) -> Tuple[np.ndarray, np.ndarray]:
+        """Calcula o ID e a validade de uma rodada inteira a partir de colunas
+
+        Cada argumento é uma sequência com um elemento por jogador; `resultados`
+        usa os códigos de CODIGOS_RESULTADO. As operações seguem a mesma ordem
+        do cálculo individual, então os IDs são idênticos bit a bit aos de
+        calcular_id. Retorna (ids, validos).
+        """
+        resultado = np.asarray(resultados, dtype=np.int64)
+        turno = np.asarray(turnos, dtype=np.int64)
+        eliminacoes = np.asarray(eliminacoes, dtype=np.int64)
+        vida = np.minimum(np.asarray(vidas_finais).astype(np.int64), 40)
+        danificados = np.asarray(oponentes_danificados, dtype=np.int64)
+        mesa = np.asarray(jogadores_mesa, dtype=np.int64)
+        if not np.isin(resultado, (0, 1, 2)).all():
+            raise ValueError("Códigos de resultado devem ser 0 (VITORIA), 1 (EMPATE) ou 2 (DERROTA).")
+        if not np.isin(mesa, list(CalculadorIndiceDesempenho.LIMITES_PONTUACAO)).all():
+            raise ValueError("Mesas devem ter 3 ou 4 jogadores.")
+
+        vitoria, empate, derrota = resultado == 0, resultado == 1, resultado == 2
+
+        rp = np.select([vitoria, empate], [100 * 0.60, 20 * 0.60], 10 * 0.60)
+
+        tv_base = np.select(
+            [turno == 1, (turno >= 2) & (turno <= 10), (turno >= 11) & (turno <= 20)],
+            [100.0, 100 - ((turno - 1) * 0.222), 98 - ((turno - 10) * 0.1)],
+            95.8
+        )
+        tv = np.select([vitoria, empate], [tv_base, np.minimum(tv_base, 80)], np.minimum(tv_base, 35)) * 0.35
+
+        er = np.select(
+            [derrota, vitoria & (eliminacoes == 0)],
+            [0.0, 50.0],
+            (eliminacoes / (mesa - 1)) * 100 * 0.02
+        )
+
+        pv_parcial = (vida / 40) * 100 * 0.02
+        pv = np.select(
+            [vitoria, empate & (vida >= 16), empate, vida >= 6],
+            [100 * 0.02, 40 * 0.02, pv_parcial, 15 * 0.02],
+            pv_parcial
+        )
+
+        pa = np.select([vitoria & (danificados >= 2), vitoria & (danificados == 1)], [100 * 0.01, 50 * 0.01], 0.0)
+
+        ids = rp + tv + er + pv + pa
+        ids = np.where(mesa == 3, ids * 0.9998, ids)
+
+        limites = np.zeros((5, 3, 2))
+        for jogadores, por_resultado in CalculadorIndiceDesempenho.LIMITES_PONTUACAO.items():
+            for nome, codigo in CalculadorIndiceDesempenho.CODIGOS_RESULTADO.items():
+                limites[jogadores, codigo] = por_resultado[nome]
+        minimos, maximos = limites[mesa, resultado, 0], limites[mesa, resultado, 1]
+        validos = (minimos <= ids) & (ids <= maximos)
+        return ids, validos
+
 class GerenciadorTempo:
     def __init__(self):
         self.temporizadores = {}
+        self.trava = threading.Lock()
 
     def iniciar_temporizador(self, partida: Partida, duracao: timedelta):
-        self.temporizadores[partida.id] = {"inicio": datetime.now(), "duracao": duracao, "turnos_extras": 0}
+        with self.trava:
+            self.temporizadores[partida.id] = {"inicio": datetime.now(), "duracao": duracao, "turnos_extras": 0}
+
+    def encerrar_temporizador(self, partida_id: str):
+        with self.trava:
+            self.temporizadores.pop(partida_id, None)
 
     def verificar_tempo(self, partida: Partida, torneio: Torneio) -> bool:
-        if partida.id not in self.temporizadores:
-            return False
-        tempo = self.temporizadores[partida.id]
-        elapsed = datetime.now() - tempo["inicio"]
-        if elapsed >= tempo["duracao"] and tempo["turnos_extras"] < torneio.turnos_extras:
-            tempo["turnos_extras"] += 1
+        with self.trava:
+            if partida.id not in self.temporizadores:
+                return False
+            tempo = self.temporizadores[partida.id]
+            elapsed = datetime.now() - tempo["inicio"]
+            if elapsed >= tempo["duracao"] and tempo["turnos_extras"] < torneio.turnos_extras:
+                tempo["turnos_extras"] += 1
+                return False
+            elif elapsed >= tempo["duracao"] and tempo["turnos_extras"] >= torneio.turnos_extras:
+                return True
             return False
-        elif elapsed >= tempo["duracao"] and tempo["turnos_extras"] >= torneio.turnos_extras:
-            return True
-        return False
 
 class SistemaDesempate:
+    """Classe responsável pelos critérios de desempate do ranking
+
+    A força dos oponentes é mantida de forma incremental em cada jogador
+    (soma e quantidade dos IDs dos oponentes enfrentados), atualizada quando
+    uma partida é concluída, para que a consulta no ranking seja O(1).
+    """
+
     @staticmethod
-    def calcular_forca_oponentes(jogador: Jogador, partidas: List[Partida]) -> float:
-        oponentes_ids = set()
-        for partida in jogador.historico_partidas:
-            oponentes_ids.update(op.id for op in partida.jogadores if op != jogador)
-        if not oponentes_ids:
+    def registrar_partida(partida: Partida):
+        """Acumula, para cada jogador da partida, os IDs dos oponentes enfrentados"""
+        soma_mesa = sum(j.indice_desempenho for j in partida.jogadores)
+        for jogador in partida.jogadores:
+            jogador.soma_ids_oponentes += soma_mesa - jogador.indice_desempenho
+            jogador.num_oponentes += len(partida.jogadores) - 1
+
+    @staticmethod
+    def calcular_forca_oponentes(jogador: Jogador) -> float:
+        """Média dos IDs dos oponentes enfrentados pelo jogador"""
+        if not jogador.num_oponentes:
             return 0.0
-        oponentes = [op for p in partidas for op in p.jogadores if op.id in oponentes_ids]
-        return Utilitarios.calcular_media_ids(oponentes) if oponentes else 0.0
+        return jogador.soma_ids_oponentes / jogador.num_oponentes
+
+    @staticmethod
+    def forca_oponentes_em_lote(historico: 'HistoricoColunar', torneio_id: Optional[str] = None) -> Dict[str, float]:
+        """Força dos oponentes de todos os jogadores do histórico em uma única varredura das colunas
+
+        Sem torneio, coincide com calcular_forca_oponentes de cada jogador; com
+        um torneio, considera apenas as mesas dele.
+        """
+        estatisticas = historico.estatisticas(torneio_id)
+        num = estatisticas["num_oponentes"]
+        forca = np.divide(estatisticas["soma_ids_oponentes"], num, out=np.zeros(len(num)), where=num > 0)
+        return dict(zip((j.id for j in historico.jogadores), forca.tolist()))
 
     @staticmethod
-    def comparar_jogadores(j1: Jogador, j2: Jogador, partidas: List[Partida]) -> int:
+    def comparar_jogadores(j1: Jogador, j2: Jogador) -> int:
         if j1.indice_desempenho != j2.indice_desempenho:
             return -1 if j1.indice_desempenho > j2.indice_desempenho else 1
-        forca_j1 = SistemaDesempate.calcular_forca_oponentes(j1, partidas)
-        forca_j2 = SistemaDesempate.calcular_forca_oponentes(j2, partidas)
+        forca_j1 = SistemaDesempate.calcular_forca_oponentes(j1)
+        forca_j2 = SistemaDesempate.calcular_forca_oponentes(j2)
         if forca_j1 != forca_j2:
             return -1 if forca_j1 > forca_j2 else 1
         if j1.vitorias_isoladas != j2.vitorias_isoladas:
             return -1 if j1.vitorias_isoladas > j2.vitorias_isoladas else 1
         return random.choice([-1, 1])
 
+class Classificacao:
+    """Classificação de um torneio mantida ordenada a cada alteração de ID
+
+    A ordem é (ID, força dos oponentes, vitórias isoladas) decrescente; empates
+    mantêm a ordem de inscrição, como a ordenação estável usada no ranking.
+    As chaves ficam em uma lista ordenada, localizadas por busca binária, e
+    cada jogador guarda as classificações em que aparece para que resultados
+    e penalidades as atualizem sem reordenar o torneio inteiro. Cada
+    classificação tem sua própria trava, adquirida por último: resultados de
+    mesas diferentes só disputam o tempo curto de reposicionar os jogadores.
+    """
+
+    def __init__(self):
+        self.chaves: List[Tuple[float, float, int, int]] = []
+        self.chave_por_jogador: Dict[str, Tuple[float, float, int, int]] = {}
+        self.jogadores_por_ordem: Dict[int, Jogador] = {}
+        self.proxima_ordem = 0
+        self.trava = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.chaves)
+
+    @staticmethod
+    def _chave(jogador: Jogador, ordem: int) -> Tuple[float, float, int, int]:
+        return (
+            -jogador.indice_desempenho,
+            -SistemaDesempate.calcular_forca_oponentes(jogador),
+            -jogador.vitorias_isoladas,
+            ordem
+        )
+
+    @staticmethod
+    def atualizar_jogador(jogador: Jogador):
+        """Reposiciona o jogador em todas as classificações em que aparece"""
+        for classificacao in tuple(jogador.classificacoes):
+            classificacao.atualizar(jogador)
+
+    def reconstruir(self, jogadores: List[Jogador]):
+        """Reconstrói a classificação a partir da lista de inscritos, na ordem de inscrição"""
+        with self.trava:
+            for jogador in self.jogadores_por_ordem.values():
+                jogador.classificacoes.remove(self)
+            self.chave_por_jogador = {}
+            self.jogadores_por_ordem = {}
+            for ordem, jogador in enumerate(jogadores):
+                self.chave_por_jogador[jogador.id] = self._chave(jogador, ordem)
+                self.jogadores_por_ordem[ordem] = jogador
+                jogador.classificacoes.append(self)
+            self.chaves = sorted(self.chave_por_jogador.values())
+            self.proxima_ordem = len(jogadores)
+
+    def adicionar(self, jogador: Jogador):
+        with self.trava:
+            if jogador.id in self.chave_por_jogador:
+                return
+            chave = self._chave(jogador, self.proxima_ordem)
+            self.proxima_ordem += 1
+            bisect.insort(self.chaves, chave)
+            self.chave_por_jogador[jogador.id] = chave
+            self.jogadores_por_ordem[chave[-1]] = jogador
+            jogador.classificacoes.append(self)
+
+    def remover(self, jogador: Jogador):
+        with self.trava:
+            chave = self.chave_por_jogador.pop(jogador.id, None)
+            if chave is None:
+                return
+            del self.chaves[bisect.bisect_left(self.chaves, chave)]
+            del self.jogadores_por_ordem[chave[-1]]
+            jogador.classificacoes.remove(self)
+
+    def atualizar(self, jogador: Jogador):
+        with self.trava:
+            antiga = self.chave_por_jogador.get(jogador.id)
+            if antiga is None:
+                return
+            nova = self._chave(jogador, antiga[-1])
+            if nova == antiga:
+                return
+            del self.chaves[bisect.bisect_left(self.chaves, antiga)]
+            bisect.insort(self.chaves, nova)
+            self.chave_por_jogador[jogador.id] = nova
+
+    def posicao(self, jogador: Jogador) -> Optional[int]:
+        """Posição do jogador na classificação (a partir de 1), ou None se não estiver inscrito"""
+        with self.trava:
+            chave = self.chave_por_jogador.get(jogador.id)
+            if chave is None:
+                return None
+            return bisect.bisect_left(self.chaves, chave) + 1
+
+    def _jogadores(self, inicio: int, fim: int) -> List[Jogador]:
+        with self.trava:
+            return [self.jogadores_por_ordem[chave[-1]] for chave in self.chaves[inicio:fim]]
+
+    def top(self, k: int) -> List[Jogador]:
+        """Os k primeiros colocados"""
+        return self._jogadores(0, k)
+
+    def pagina(self, numero: int, tamanho: int = 20) -> List[Jogador]:
+        """Página da classificação (a partir de 1) com até `tamanho` jogadores"""
+        if numero < 1 or tamanho < 1:
+            raise ValueError("Número e tamanho da página devem ser positivos.")
+        inicio = (numero - 1) * tamanho
+        return self._jogadores(inicio, inicio + tamanho)
+
 class GerenciadorCadastros:
     """Classe responsável por gerenciar os cadastros de juízes, jogadores e decks"""
+
+    STATUS_DECK = ("DISPONIVEL", "EM_USO", "INATIVO")
     
     def __init__(self):
         self.juizes = []
         self.jogadores = []
         self.decks = []
+        # Índices mantidos a cada cadastro para buscas e validações em O(1)
+        self.juizes_por_email: Dict[str, Juiz] = {}
+        self.jogadores_por_email: Dict[str, Jogador] = {}
+        self.juizes_por_id: Dict[str, Juiz] = {}
+        self.jogadores_por_id: Dict[str, Jogador] = {}
+        self.decks_por_id: Dict[str, Deck] = {}
+        # jogador_id -> status -> {deck_id: deck}
+        self.decks_por_jogador: Dict[str, Dict[str, Dict[str, Deck]]] = {}
+        # Protege as listas e índices contra cadastros simultâneos
+        self.trava = threading.RLock()
+
+    @staticmethod
+    def status_deck(deck: Deck) -> str:
+        """Retorna o status de um deck: DISPONIVEL, EM_USO ou INATIVO"""
+        if not deck.ativo:
+            return "INATIVO"
+        return "EM_USO" if deck.torneio is not None else "DISPONIVEL"
+
+    def reindexar(self):
+        """Reconstrói todos os índices a partir das listas de cadastros"""
+        self.juizes_por_email = {j.email: j for j in self.juizes}
+        self.jogadores_por_email = {j.email: j for j in self.jogadores}
+        self.juizes_por_id = {j.id: j for j in self.juizes}
+        self.jogadores_por_id = {j.id: j for j in self.jogadores}
+        self.decks_por_id = {}
+        self.decks_por_jogador = {}
+        for deck in self.decks:
+            self._indexar_deck(deck)
+
+    def adicionar_juiz(self, juiz: Juiz):
+        """Adiciona um juiz já construído ao cadastro e aos índices"""
+        with self.trava:
+            self.juizes.append(juiz)
+            self.juizes_por_email[juiz.email] = juiz
+            self.juizes_por_id[juiz.id] = juiz
+
+    def adicionar_jogador(self, jogador: Jogador):
+        """Adiciona um jogador já construído ao cadastro e aos índices"""
+        with self.trava:
+            self.jogadores.append(jogador)
+            self.jogadores_por_email[jogador.email] = jogador
+            self.jogadores_por_id[jogador.id] = jogador
+
+    def adicionar_deck(self, deck: Deck):
+        """Adiciona um deck já construído ao cadastro e aos índices"""
+        with self.trava:
+            if deck not in deck.jogador.decks:
+                deck.jogador.decks.append(deck)
+            self.decks.append(deck)
+            self._indexar_deck(deck)
+        if deck.torneio is not None and deck.torneio.visoes:
+            deck.torneio.visoes.torneio_alterado(deck.torneio)
+
+    def _indexar_deck(self, deck: Deck):
+        deck.cadastro = self
+        self.decks_por_id[deck.id] = deck
+        por_status = self.decks_por_jogador.setdefault(deck.jogador.id, {s: {} for s in self.STATUS_DECK})
+        por_status[self.status_deck(deck)][deck.id] = deck
+
+    def atualizar_status_deck(self, deck: Deck):
+        """Move o deck para o grupo do seu status atual após uma alteração"""
+        with self.trava:
+            por_status = self.decks_por_jogador.setdefault(deck.jogador.id, {s: {} for s in self.STATUS_DECK})
+            for decks in por_status.values():
+                decks.pop(deck.id, None)
+            por_status[self.status_deck(deck)][deck.id] = deck
     
-    def cadastrar_juiz(self, nome: str, email: str) -> bool:
-        """Cadastra um novo juiz"""
-        # Valida email único
-        if any(j.email == email for j in self.juizes):
-            return False
-            
-        juiz = Juiz(nome, email)
-        self.juizes.append(juiz)
-        return True
+    def cadastrar_juiz(self, nome: str, email: str) -> Optional[Juiz]:
+        """Cadastra um novo juiz, retornando None se o email já estiver em uso"""
+        with self.trava:
+            # Valida email único
+            if email in self.juizes_por_email:
+                return None
+
+            juiz = Juiz(nome, email)
+            self.adicionar_juiz(juiz)
+            return juiz
         
-    def cadastrar_jogador(self, nome: str, email: str) -> bool:
-        """Cadastra um novo jogador"""
-        # Valida email único
-        if any(j.email == email for j in self.jogadores):
-            return False
-            
-        jogador = Jogador(nome, email)
-        self.jogadores.append(jogador)
-        return True
+    def cadastrar_jogador(self, nome: str, email: str) -> Optional[Jogador]:
+        """Cadastra um novo jogador, retornando None se o email já estiver em uso"""
+        with self.trava:
+            # Valida email único
+            if email in self.jogadores_por_email:
+                return None
+
+            jogador = Jogador(nome, email)
+            self.adicionar_jogador(jogador)
+            return jogador
         
     def cadastrar_deck(self, jogador: Jogador, comandante: str) -> Deck:
         """Cadastra um novo deck para um jogador"""
         deck = Deck(jogador, comandante)
-        jogador.decks.append(deck)
-        self.decks.append(deck)
+        self.adicionar_deck(deck)
         return deck
         
+    @staticmethod
+    def deck_utilizavel(deck: Deck) -> bool:
+        """Indica, sem alterar o deck, se ele pode ser associado a um torneio"""
+        return bool(deck.comandante) and deck.torneio is None
+
     def validar_deck(self, deck: Deck, torneio: Torneio) -> bool:
         """Valida se um deck pode ser usado em um torneio"""
-        if not deck.comandante or deck.torneio is not None:
+        if not self.deck_utilizavel(deck):
             return False
         deck.validado = True
         deck.torneio = torneio
+        self.atualizar_status_deck(deck)
+        if torneio.visoes:
+            torneio.visoes.torneio_alterado(torneio)
         return True
         
-    def buscar_juiz(self, email: str) -> Juiz:
+    def buscar_juiz(self, email: str) -> Optional[Juiz]:
         """Busca um juiz pelo email"""
-        return next((j for j in self.juizes if j.email == email), None)
+        return self.juizes_por_email.get(email)
         
-    def buscar_jogador(self, email: str) -> Jogador:
+    def buscar_jogador(self, email: str) -> Optional[Jogador]:
         """Busca um jogador pelo email"""
-        return next((j for j in self.jogadores if j.email == email), None)
+        return self.jogadores_por_email.get(email)
+
+    def buscar_decks(self, jogador: Jogador, status: str = "DISPONIVEL") -> List[Deck]:
+        """Lista os decks de um jogador com o status informado"""
+        return list(self.decks_por_jogador.get(jogador.id, {}).get(status, {}).values())
         
-    def buscar_deck(self, email_jogador: str, nome_deck: str) -> Deck:
-        """Busca um deck pelo nome e email do jogador"""
-        return next(
-            (
-                d for d in self.decks
-                if d.jogador.email == email_jogador and d.nome == nome_deck
-            ),
-            None
-        )
+    def buscar_deck(self, email_jogador: str, nome_deck: str) -> Optional[Deck]:
+        """Busca um deck pelo comandante e email do jogador"""
+        jogador = self.buscar_jogador(email_jogador)
+        if not jogador:
+            return None
+        return next((d for d in jogador.decks if d.comandante == nome_deck), None)
+
+class TabelaColunar:
+    """Tabela só de acréscimos, com um vetor de tipo fixo por coluna
+
+    As linhas novas entram em buffers array.array (um por coluna) e, a cada
+    TAMANHO_BLOCO linhas, o buffer é descarregado em um bloco NumPy. Na leitura
+    os blocos e o buffer pendente são juntados em um único vetor por coluna, que
+    é reaproveitado até a próxima linha acrescentada; os vetores lidos nunca são
+    alterados depois, então podem ser percorridos sem trava.
+    """
+
+    TAMANHO_BLOCO = 4096
+
+    def __init__(self, tipos: Dict[str, str], tamanho_bloco: Optional[int] = None):
+        self.tipos = tipos
+        self.tamanho_bloco = tamanho_bloco or self.TAMANHO_BLOCO
+        self.buffers = {nome: array.array(tipo) for nome, tipo in tipos.items()}
+        self.blocos: Dict[str, List[np.ndarray]] = {nome: [] for nome in tipos}
+        self.linhas = 0
+        self._colunas: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self.linhas
+
+    def acrescentar(self, valores: Dict[str, list]):
+        """Acrescenta várias linhas, dadas coluna a coluna (todas as listas com o mesmo tamanho)"""
+        primeira = next(iter(self.tipos))
+        if not valores[primeira]:
+            return
+        self.linhas += len(valores[primeira])
+        for nome, buffer in self.buffers.items():
+            buffer.extend(valores[nome])
+        self._colunas = None
+        if len(self.buffers[primeira]) >= self.tamanho_bloco:
+            self.descarregar()
+
+    def descarregar(self):
+        """Move as linhas pendentes dos buffers para um novo bloco de cada coluna"""
+        for nome, tipo in self.tipos.items():
+            if self.buffers[nome]:
+                self.blocos[nome].append(np.frombuffer(self.buffers[nome], dtype=tipo).copy())
+                self.buffers[nome] = array.array(tipo)
+
+    def colunas(self) -> Dict[str, np.ndarray]:
+        """Um vetor NumPy por coluna com todas as linhas; os blocos lidos são fundidos em um só"""
+        if self._colunas is None:
+            self.descarregar()
+            for nome, tipo in self.tipos.items():
+                blocos = self.blocos[nome]
+                if len(blocos) != 1:
+                    self.blocos[nome] = [np.concatenate(blocos) if blocos else np.zeros(0, dtype=tipo)]
+            self._colunas = {nome: blocos[0] for nome, blocos in self.blocos.items()}
+        return self._colunas
+
+
+class HistoricoColunar:
+    """Histórico das partidas concluídas da temporada em colunas de tipo fixo
+
+    Três tabelas colunares (TabelaColunar), com jogadores, torneios e partidas
+    referenciados por índices inteiros:
+
+    - partidas: torneio, rodada e a faixa de linhas da partida nas outras duas
+      tabelas (as linhas de uma partida são acrescentadas juntas);
+    - participacoes: uma linha por jogador de cada partida, com o resultado
+      (códigos do CalculadorIndiceDesempenho, -1 sem resultado), turno, vida
+      final, oponentes danificados, eliminações causadas e o ID da partida;
+    - eliminacoes: eliminado, causador (-1 sem causador), turno e desistência.
+
+    As varreduras do desempate, do histórico de cada jogador no relatório e da
+    análise de colusão leem os vetores diretamente, sem percorrer as partidas.
+    O histórico é derivado das partidas: é alimentado ao processar resultados e
+    refeito ao carregar o estado, e pode ser exportado para um arquivo .npz.
+    """
+
+    RESULTADOS = ("VITORIA", "EMPATE", "DERROTA")
+    TIPOS_PARTIDAS = {"torneio": "i", "rodada": "h", "inicio": "q", "jogadores": "b", "inicio_eliminacoes": "q", "eliminacoes": "b"}
+    TIPOS_PARTICIPACOES = {
+        "partida": "i", "jogador": "i", "resultado": "b", "turno": "h", "vida_final": "h",
+        "oponentes_danificados": "b", "eliminacoes": "b", "pontuacao": "d"
+    }
+    TIPOS_ELIMINACOES = {"partida": "i", "eliminado": "i", "causador": "i", "turno": "h", "desistiu": "b"}
+
+    def __init__(self, tamanho_bloco: Optional[int] = None):
+        self.tamanho_bloco = tamanho_bloco
+        self.trava = threading.Lock()
+        self.limpar()
+
+    def limpar(self):
+        """Descarta todas as linhas e os índices de ids"""
+        tamanho_bloco = self.tamanho_bloco
+        self.partidas = TabelaColunar(self.TIPOS_PARTIDAS, tamanho_bloco)
+        self.participacoes = TabelaColunar(self.TIPOS_PARTICIPACOES, tamanho_bloco)
+        self.eliminacoes = TabelaColunar(self.TIPOS_ELIMINACOES, tamanho_bloco)
+        self.ids_partidas: List[str] = []
+        self.indices_partidas: Dict[str, int] = {}
+        self.jogadores: List[Jogador] = []
+        self.indices_jogadores: Dict[str, int] = {}
+        self.ids_torneios: List[str] = []
+        self.indices_torneios: Dict[str, int] = {}
+        # Linhas de participação ordenadas por jogador e o início da faixa de cada jogador, refeitos após acréscimos
+        self._por_jogador: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids_partidas)
+
+    def _indice_jogador(self, jogador: Jogador) -> int:
+        indice = self.indices_jogadores.get(jogador.id)
+        if indice is None:
+            indice = self.indices_jogadores[jogador.id] = len(self.jogadores)
+            self.jogadores.append(jogador)
+        return indice
+
+    def _indice_torneio(self, torneio_id: Optional[str]) -> int:
+        if torneio_id is None:
+            return -1
+        indice = self.indices_torneios.get(torneio_id)
+        if indice is None:
+            indice = self.indices_torneios[torneio_id] = len(self.ids_torneios)
+            self.ids_torneios.append(torneio_id)
+        return indice
+
+    @staticmethod
+    def _linhas(partida: Partida, resultados: Dict[str, dict], pontuacoes: Dict[str, float]) -> tuple:
+        """Linhas de participação e de eliminação da partida, com os jogadores ainda como objetos"""
+        causadas = dict.fromkeys((j.id for j in partida.jogadores), 0)
+        eliminacoes = []
+        for e in partida.eliminacoes:
+            if e.jogador_causador and e.jogador_causador.id in causadas:
+                causadas[e.jogador_causador.id] += 1
+            eliminacoes.append((e.jogador_eliminado, e.jogador_causador, e.turno, e.desistiu))
+        codigos = CalculadorIndiceDesempenho.CODIGOS_RESULTADO
+        participacoes = []
+        for jogador in partida.jogadores:
+            dados = resultados.get(jogador.id)
+            pontuacao = pontuacoes.get(jogador.id, 0.0)
+            if dados:
+                participacoes.append((
+                    jogador, codigos[dados["resultado"]], dados["turno"], dados["vida_final"], dados["oponentes_danificados"], causadas[jogador.id], pontuacao
+                ))
+            else:
+                participacoes.append((jogador, -1, 0, 0, 0, causadas[jogador.id], pontuacao))
+        return partida, participacoes, eliminacoes
+
+    def preparar(self, partida: Partida, resultados: Dict[str, dict], pontuacoes: Dict[str, float]) -> tuple:
+        """Monta as linhas de uma partida cujos resultados ainda não foram aplicados, sem alterar o histórico
+
+        Os valores são convertidos aqui para os tipos das colunas, então um valor
+        fora do intervalo de uma coluna é recusado com ValueError antes de
+        qualquer jogador ser alterado. O retorno vai para registrar_preparadas.
+        """
+        preparada = self._linhas(partida, resultados, pontuacoes)
+        # A coluna da partida e as dos jogadores recebem índices só ao registrar
+        for tipos, linhas, indices in ((self.TIPOS_PARTICIPACOES, preparada[1], 1), (self.TIPOS_ELIMINACOES, preparada[2], 2)):
+            for nome, valores in zip(list(tipos)[indices + 1:], list(zip(*linhas))[indices:]):
+                try:
+                    array.array(tipos[nome], valores)
+                except (OverflowError, TypeError):
+                    raise ValueError(f"Valor fora do intervalo aceito em {nome} na partida {partida.id}: {list(valores)}") from None
+        return preparada
+
+    def _acumular(self, preparada: tuple, partidas: list, participacoes: list, eliminacoes: list):
+        """Acrescenta às listas as linhas de uma partida, como tuplas na ordem das colunas; chamado com a trava adquirida"""
+        partida, linhas_participacoes, linhas_eliminacoes = preparada
+        numero = self.indices_partidas[partida.id] = len(self.ids_partidas)
+        self.ids_partidas.append(partida.id)
+        partidas.append((
+            self._indice_torneio(partida.torneio_id), -1 if partida.rodada is None else partida.rodada,
+            len(self.participacoes) + len(participacoes), len(linhas_participacoes),
+            len(self.eliminacoes) + len(eliminacoes), len(linhas_eliminacoes)
+        ))
+        indice_jogador = self._indice_jogador
+        for eliminado, causador, turno, desistiu in linhas_eliminacoes:
+            eliminacoes.append((numero, indice_jogador(eliminado), indice_jogador(causador) if causador else -1, turno, desistiu))
+        for jogador, *valores in linhas_participacoes:
+            participacoes.append((numero, indice_jogador(jogador), *valores))
+
+    def _gravar(self, partidas: list, participacoes: list, eliminacoes: list):
+        """Acrescenta às tabelas as linhas acumuladas, transpostas em colunas; chamado com a trava adquirida"""
+        for tabela, linhas in ((self.partidas, partidas), (self.participacoes, participacoes), (self.eliminacoes, eliminacoes)):
+            if linhas:
+                tabela.acrescentar(dict(zip(tabela.tipos, zip(*linhas))))
+        self._por_jogador = None
+
+    def registrar_preparadas(self, preparadas: List[tuple]):
+        """Acrescenta, na ordem dada e de uma só vez, partidas montadas por preparar; partidas já registradas são ignoradas"""
+        with self.trava:
+            linhas = ([], [], [])
+            for preparada in preparadas:
+                if preparada[0].id not in self.indices_partidas:
+                    self._acumular(preparada, *linhas)
+            self._gravar(*linhas)
+
+    def registrar_partidas(self, partidas: List[Partida]):
+        """Acrescenta partidas já processadas (ex.: ao reproduzir o journal), lendo os resultados gravados nelas"""
+        self.registrar_preparadas([self._linhas(p, p.resultados, p.pontuacoes) for p in partidas])
+
+    def reconstruir(self, jogadores: List[Jogador]):
+        """Refaz o histórico a partir do histórico de partidas de cada jogador (ex.: após carregar o estado)
+
+        A ordem global das partidas não é gravada, então ela é refeita
+        intercalando os históricos: uma partida só é registrada depois das
+        anteriores de todos os seus jogadores, e cada jogador vê as suas partidas
+        na mesma ordem de antes. As linhas são acrescentadas de uma só vez.
+        """
+        seguintes: Dict[str, List[Partida]] = {}
+        pendentes: Dict[str, int] = {}
+        partidas: Dict[str, Partida] = {}
+        for jogador in jogadores:
+            anterior = None
+            for partida in jogador.historico_partidas:
+                if partida.id not in partidas:
+                    partidas[partida.id] = partida
+                    pendentes[partida.id] = 0
+                if anterior is not None:
+                    seguintes.setdefault(anterior.id, []).append(partida)
+                    pendentes[partida.id] += 1
+                anterior = partida
+        with self.trava:
+            self.limpar()
+            linhas = ([], [], [])
+            fila = [p for p in partidas.values() if not pendentes[p.id]]
+            while fila:
+                proximas = []
+                for partida in fila:
+                    self._acumular(self._linhas(partida, partida.resultados, partida.pontuacoes), *linhas)
+                    for seguinte in seguintes.get(partida.id, ()):
+                        pendentes[seguinte.id] -= 1
+                        if not pendentes[seguinte.id]:
+                            proximas.append(seguinte)
+                fila = proximas
+            self._gravar(*linhas)
+
+    def colunas(self) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """Vetores de partidas, participações e eliminações, lidos juntos para ficarem consistentes entre si"""
+        with self.trava:
+            return self.partidas.colunas(), self.participacoes.colunas(), self.eliminacoes.colunas()
+
+    @staticmethod
+    def linhas_das_faixas(inicios: np.ndarray, tamanhos: np.ndarray) -> np.ndarray:
+        """Concatena as faixas de linhas [inicio, inicio + tamanho) em um único vetor de índices"""
+        tamanhos = tamanhos.astype(np.int64)
+        return np.repeat(inicios, tamanhos) + np.arange(int(tamanhos.sum())) - np.repeat(np.cumsum(tamanhos) - tamanhos, tamanhos)
+
+    def linhas_jogador(self, jogador_id: str) -> np.ndarray:
+        """Linhas de participação do jogador, na ordem em que as partidas foram registradas"""
+        with self.trava:
+            indice = self.indices_jogadores.get(jogador_id)
+            if indice is None:
+                return np.zeros(0, dtype=np.int64)
+            if self._por_jogador is None:
+                jogadores = self.participacoes.colunas()["jogador"]
+                inicios = np.zeros(len(self.jogadores) + 1, dtype=np.int64)
+                np.cumsum(np.bincount(jogadores, minlength=len(self.jogadores)), out=inicios[1:])
+                self._por_jogador = (np.argsort(jogadores, kind="stable"), inicios)
+            ordem, inicios = self._por_jogador
+        return ordem[inicios[indice]:inicios[indice + 1]]
+
+    def colunas_jogador(self, jogador_id: str) -> Dict[str, np.ndarray]:
+        """Colunas das partidas do jogador, na ordem em que foram registradas
+
+        - partida, resultado, pontuacao, jogadores (tamanho da mesa) e
+          eliminacoes (quantidade): uma posição por partida;
+        - mesas: os jogadores de todas as mesas, em sequência;
+        - eliminado, causador, turno, desistiu e posicao (a partida, entre as
+          do jogador): as eliminações de todas as partidas, em sequência.
+        """
+        linhas = self.linhas_jogador(jogador_id)
+        partidas, participacoes, eliminacoes = self.colunas()
+        numeros = participacoes["partida"][linhas]
+        tamanhos = partidas["jogadores"][numeros]
+        quantidades = partidas["eliminacoes"][numeros]
+        faixas = self.linhas_das_faixas(partidas["inicio_eliminacoes"][numeros], quantidades)
+        colunas = {
+            "partida": numeros, "resultado": participacoes["resultado"][linhas], "pontuacao": participacoes["pontuacao"][linhas],
+            "jogadores": tamanhos, "eliminacoes": quantidades,
+            "mesas": participacoes["jogador"][self.linhas_das_faixas(partidas["inicio"][numeros], tamanhos)],
+            "posicao": np.repeat(np.arange(len(numeros)), quantidades)
+        }
+        colunas.update((nome, eliminacoes[nome][faixas]) for nome in ("eliminado", "causador", "turno", "desistiu"))
+        return colunas
+
+    def estatisticas(self, torneio_id: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """Agregados por jogador (na ordem de self.jogadores), opcionalmente de um único torneio
+
+        A soma e a quantidade de IDs de oponentes seguem SistemaDesempate: em
+        cada partida, a soma do ID dos demais jogadores da mesa na partida.
+        """
+        partidas, participacoes, _ = self.colunas()
+        n = len(self.jogadores)
+        linhas = slice(None)
+        if torneio_id is not None:
+            torneio = self.indices_torneios.get(torneio_id, -2)
+            linhas = np.flatnonzero(partidas["torneio"][participacoes["partida"]] == torneio)
+        numero = participacoes["partida"][linhas]
+        jogador = participacoes["jogador"][linhas]
+        resultado = participacoes["resultado"][linhas]
+        pontuacao = participacoes["pontuacao"][linhas]
+        tamanho = partidas["jogadores"][numero].astype(np.int64)
+        soma_mesa = np.bincount(numero, weights=pontuacao, minlength=len(partidas["inicio"]))[numero]
+        contar = lambda pesos=None: np.bincount(jogador, weights=pesos, minlength=n)
+        vitorias = resultado == CalculadorIndiceDesempenho.CODIGOS_RESULTADO["VITORIA"]
+        return {
+            "partidas": contar().astype(np.int64),
+            "vitorias": contar(vitorias).astype(np.int64),
+            "empates": contar(resultado == CalculadorIndiceDesempenho.CODIGOS_RESULTADO["EMPATE"]).astype(np.int64),
+            "vitorias_isoladas": contar(vitorias & (participacoes["eliminacoes"][linhas] == tamanho - 1)).astype(np.int64),
+            "eliminacoes": contar(participacoes["eliminacoes"][linhas]).astype(np.int64),
+            "soma_ids_oponentes": contar(soma_mesa - pontuacao),
+            "num_oponentes": contar(tamanho - 1).astype(np.int64)
+        }
+
+    def exportar(self, caminho: str):
+        """Grava as três tabelas e os ids em um arquivo .npz (NumPy), uma entrada por coluna"""
+        partidas, participacoes, eliminacoes = self.colunas()
+        with self.trava:
+            ids = {
+                "ids_partidas": np.array(self.ids_partidas, dtype=str),
+                "ids_jogadores": np.array([j.id for j in self.jogadores], dtype=str),
+                "ids_torneios": np.array(self.ids_torneios, dtype=str)
+            }
+        colunas = {f"{tabela}_{nome}": coluna for tabela, vetores in (
+            ("partidas", partidas), ("participacoes", participacoes), ("eliminacoes", eliminacoes)
+        ) for nome, coluna in vetores.items()}
+        # Grava pelo objeto de arquivo para que o NumPy não acrescente a extensão .npz ao nome escolhido
+        with open(caminho, 'wb') as f:
+            np.savez(f, **colunas, **ids)
+
+
+class VisoesRelatorio:
+    """Agregados do relatório materializados por torneio e por jogador
+
+    Cada visão é calculada na primeira consulta e reaproveitada até que uma
+    operação que a afete a invalide:
+
+    - inscrição ou remoção de jogador: a visão do torneio e a do jogador;
+    - deck associado ao torneio ou liberado dele: a visão do torneio;
+    - resultado ou penalidade: a visão do jogador e as dos torneios em que ele
+      está inscrito, pois a média de ID deles muda junto com o ID do jogador.
+
+    Os torneios de cada jogador ficam em um índice montado em uma passada e
+    atualizado a cada inscrição. O status dos torneios não é materializado,
+    pois é lido diretamente deles a cada consulta. Uma visão calculada
+    enquanto outra thread a invalidava é descartada em vez de guardada.
+    """
+
+    def __init__(self, gerenciador: 'GerenciadorTorneio'):
+        self.gerenciador = gerenciador
+        self.torneios: Dict[str, dict] = {}
+        self.jogadores: Dict[str, dict] = {}
+        self.torneios_por_jogador: Optional[Dict[str, List[Torneio]]] = None
+        self.acertos = 0
+        self.faltas = 0
+        self.invalidacoes = 0
+        # Incrementada a cada invalidação; uma visão só é guardada se ela não mudou durante o cálculo
+        self.geracao = 0
+        self.trava = threading.Lock()
+
+    def limpar(self):
+        """Descarta todas as visões e o índice (ex.: após carregar ou reaplicar o estado)"""
+        with self.trava:
+            self.invalidacoes += len(self.torneios) + len(self.jogadores)
+            self.torneios = {}
+            self.jogadores = {}
+            self.torneios_por_jogador = None
+            self.geracao += 1
+
+    def contadores(self) -> Dict[str, int]:
+        with self.trava:
+            return {
+                "acertos": self.acertos,
+                "faltas": self.faltas,
+                "invalidacoes": self.invalidacoes,
+                "torneios": len(self.torneios),
+                "jogadores": len(self.jogadores)
+            }
+
+    def _indice(self) -> Dict[str, List[Torneio]]:
+        """Torneios de cada jogador, na ordem de criação; chamado com a trava adquirida"""
+        if self.torneios_por_jogador is None:
+            self.torneios_por_jogador = {}
+            for torneio in self.gerenciador.torneios:
+                for jogador in torneio.jogadores:
+                    self.torneios_por_jogador.setdefault(jogador.id, []).append(torneio)
+        return self.torneios_por_jogador
+
+    def _invalidar(self, torneios_ids: List[str], jogadores_ids: List[str]):
+        self.geracao += 1
+        for torneio_id in torneios_ids:
+            self.invalidacoes += self.torneios.pop(torneio_id, None) is not None
+        for jogador_id in jogadores_ids:
+            self.invalidacoes += self.jogadores.pop(jogador_id, None) is not None
+
+    def torneio_adicionado(self, torneio: Torneio):
+        """Um torneio novo (ou reaplicado já com inscritos) refaz o índice na próxima consulta"""
+        with self.trava:
+            self.torneios_por_jogador = None
+            self._invalidar([torneio.id], [j.id for j in torneio.jogadores])
+
+    def inscricao_alterada(self, torneio: Torneio, jogador: Jogador, inscrito: bool):
+        with self.trava:
+            self._invalidar([torneio.id], [jogador.id])
+            if self.torneios_por_jogador is None:
+                return
+            torneios = self.torneios_por_jogador.setdefault(jogador.id, [])
+            if inscrito and torneio not in torneios:
+                torneios.append(torneio)
+                torneios.sort(key=lambda t: t.data)
+            elif not inscrito and torneio in torneios:
+                torneios.remove(torneio)
+
+    def torneio_alterado(self, torneio: Torneio):
+        with self.trava:
+            self._invalidar([torneio.id], [])
+
+    def jogador_alterado(self, jogador: Jogador):
+        with self.trava:
+            # Sem visões de torneio guardadas não há média de ID a invalidar, nem motivo para montar o índice
+            torneios = [t.id for t in self._indice().get(jogador.id, [])] if self.torneios else []
+            self._invalidar(torneios, [jogador.id])
+
+    def torneio(self, torneio: Torneio) -> dict:
+        """Inscritos, mesas, média de ID, comandantes e deck de cada inscrito"""
+        with self.trava:
+            visao = self.torneios.get(torneio.id)
+            if visao is not None:
+                self.acertos += 1
+                return visao
+            self.faltas += 1
+            geracao = self.geracao
+        jogadores = list(torneio.jogadores)
+        decks = {}
+        comandantes = {}
+        for jogador in jogadores:
+            do_torneio = [d.comandante for d in jogador.decks if d.torneio is torneio]
+            decks[jogador.id] = do_torneio[0] if do_torneio else None
+            comandantes.update(dict.fromkeys(do_torneio))
+        visao = {
+            "inscritos": len(jogadores),
+            "mesas": len(jogadores) // 4 + (1 if len(jogadores) % 4 == 3 else 0),
+            "media_id": Utilitarios.calcular_media_ids(jogadores) if jogadores else None,
+            "comandantes": list(comandantes),
+            "decks": decks
+        }
+        with self.trava:
+            if self.geracao == geracao:
+                self.torneios[torneio.id] = visao
+        return visao
+
+    def jogador(self, jogador: Jogador) -> dict:
+        """Torneios do jogador, partidas, vitórias isoladas, winrate e ID"""
+        with self.trava:
+            visao = self.jogadores.get(jogador.id)
+            if visao is not None:
+                self.acertos += 1
+                return visao
+            self.faltas += 1
+            geracao = self.geracao
+            torneios = list(self._indice().get(jogador.id, []))
+        partidas = len(jogador.historico_partidas)
+        visao = {
+            "torneios": torneios,
+            "partidas": partidas,
+            "vitorias_isoladas": jogador.vitorias_isoladas,
+            "winrate": jogador.vitorias_isoladas / partidas * 100 if partidas else 0.0,
+            "indice_desempenho": jogador.indice_desempenho
+        }
+        with self.trava:
+            if self.geracao == geracao:
+                self.jogadores[jogador.id] = visao
+        return visao
 
 class GerenciadorTorneio:
-    """Classe responsável por gerenciar os torneios"""
-    
+    """Classe responsável por gerenciar os torneios
+
+    Pode ser usado por várias threads. Não há uma trava global: cada torneio e
+    cada partida têm a sua, e os jogadores são protegidos por um conjunto fixo
+    de travas escolhidas pelo id (um jogador pode estar em mais de um torneio).
+    As travas são sempre adquiridas na mesma ordem, o que evita deadlocks:
+    partidas (por id), jogadores (por índice da trava), torneio e, por último,
+    classificações, histórico colunar, temporizadores e logs.
+    """
+
+    NUM_TRAVAS_JOGADORES = 64
+    # Maior turno e maior vida final aceitos em um resultado (colunas de 16 bits no histórico colunar)
+    VALOR_MAXIMO_RESULTADO = 32767
+
     def __init__(self):
         self.torneios = []
+        self.torneios_por_id: Dict[str, Torneio] = {}
         self.inscricoes = []
+        self.inscricoes_por_chave: Dict[Tuple[str, str], Inscricao] = {}
         self.partidas = []
         self.emparelhamento = SistemaEmparelhamento()
-        self.tempo = GerenciadorTempo()
         self.desempate = SistemaDesempate()
+        # Estatísticas de pares acumuladas em todos os torneios da temporada
+        self.detector_colusao = DetectorColusao()
+        self.visoes = VisoesRelatorio(self)
+        # Partidas processadas da temporada em colunas, para as varreduras do desempate, do relatório e das análises
+        self.historico = HistoricoColunar()
+        # Protege as listas e índices de torneios e inscrições
+        self.trava = threading.RLock()
+        self.travas_jogadores = [threading.RLock() for _ in range(self.NUM_TRAVAS_JOGADORES)]
+
+    def reindexar(self):
+        """Reconstrói o índice de torneios por id após a lista ser substituída (ex.: carregamento) e liga os torneios ao detector e às visões da temporada"""
+        with self.trava:
+            self.torneios_por_id = {t.id: t for t in self.torneios}
+            for torneio in self.torneios:
+                torneio.anti_colusao.detector_temporada = self.detector_colusao
+                torneio.visoes = self.visoes
+            self.visoes.limpar()
+
+    def adicionar_torneio(self, torneio: Torneio):
+        with self.trava:
+            self.torneios.append(torneio)
+            self.torneios_por_id[torneio.id] = torneio
+            torneio.anti_colusao.detector_temporada = self.detector_colusao
+            torneio.visoes = self.visoes
+            self.visoes.torneio_adicionado(torneio)
+
+    @contextlib.contextmanager
+    def travar_jogadores(self, jogadores: List[Jogador]):
+        """Adquire, em ordem crescente de índice, as travas dos jogadores informados"""
+        indices = sorted({hash(j.id) % self.NUM_TRAVAS_JOGADORES for j in jogadores})
+        with contextlib.ExitStack() as pilha:
+            for indice in indices:
+                pilha.enter_context(self.travas_jogadores[indice])
+            yield
+
+    @contextlib.contextmanager
+    def _travar_mesas(self, partidas: List[Partida]):
+        """Adquire as travas das partidas (por id) e depois as dos seus jogadores"""
+        with contextlib.ExitStack() as pilha:
+            for partida in sorted(partidas, key=lambda p: p.id):
+                pilha.enter_context(partida.trava)
+            pilha.enter_context(self.travar_jogadores([j for p in partidas for j in p.jogadores]))
+            yield
+
+    def configurar_torneio(self, nome: str, min_jogadores: int) -> Torneio:
+        torneio = Torneio(nome, min_jogadores)
+        self.adicionar_torneio(torneio)
+        return torneio
+
+    def iniciar_rodada(self, torneio: Torneio) -> List[Partida]:
+        """Emparelha a próxima rodada do torneio e a torna a lista de partidas ativas dele
+
+        Só o estado do próprio torneio é alterado; as partidas ativas de outros
+        torneios continuam em andamento.
+        """
+        with torneio.trava:
+            return self._iniciar_rodada(torneio)
+
+    def _iniciar_rodada(self, torneio: Torneio) -> List[Partida]:
+        if torneio.inscricoes_abertas:
+            raise ValueError(f"Inscrições do torneio {torneio.nome} ainda abertas. Finalize as inscrições primeiro (opção 6).")
+        if not torneio.jogadores:
+            raise ValueError(f"Nenhum jogador inscrito no torneio {torneio.nome}. Inscreva jogadores e finalize as inscrições (opções 5 e 6).")
+        if torneio.rodada_atual >= torneio.rodadas:
+            raise ValueError(f"Torneio {torneio.nome} já concluído.")
+        if torneio.partidas_ativas:
+            raise ValueError(f"O torneio {torneio.nome} ainda tem {len(torneio.partidas_ativas)} partida(s) ativa(s) na rodada {torneio.rodada_atual}.")
+
+        torneio.rodada_atual += 1
+        mesas = self.emparelhamento.distribuir_jogadores(torneio)
+        if not mesas:
+            torneio.rodada_atual -= 1
+            raise ValueError("Nenhuma mesa formada. Verifique o número de jogadores.")
+        torneio.mesas = mesas
+        torneio.partidas_ativas = [Partida(mesa, torneio_id=torneio.id, rodada=torneio.rodada_atual) for mesa in mesas if mesa]
+        for partida in torneio.partidas_ativas:
+            torneio.tempo.iniciar_temporizador(partida, torneio.tempo_rodada)
+        return torneio.partidas_ativas
+
+    @staticmethod
+    def buscar_partida(torneio: Torneio, partida_id: str) -> Partida:
+        """Retorna uma partida ativa do torneio pelo id
+
+        Não usa a trava do torneio: partidas_ativas só é substituída por uma
+        nova lista, nunca alterada no lugar, então a leitura não espera o
+        emparelhamento em andamento.
+        """
+        partida = next((p for p in torneio.partidas_ativas if p.id == partida_id), None)
+        if partida is None:
+            raise ValueError(f"Partida {partida_id} não está ativa no torneio {torneio.nome}.")
+        return partida
 
-    def configurar_torneio(self, nome: str, min_jogadores: int) -> Torneio:
-        torneio = Torneio(nome, min_jogadores)
-        self.torneios.append(torneio)
-        return torneio
+    @staticmethod
+    def registrar_eliminacao(torneio: Torneio, partida: Partida, jogador_eliminado: Jogador, jogador_causador: Optional[Jogador], turno: int, desistiu: bool = False) -> Eliminacao:
+        """Valida e acrescenta à partida a eliminação ou desistência de um jogador"""
+        with partida.trava:
+            return GerenciadorTorneio._registrar_eliminacao(torneio, partida, jogador_eliminado, jogador_causador, turno, desistiu)
+
+    @staticmethod
+    def _registrar_eliminacao(torneio: Torneio, partida: Partida, jogador_eliminado: Jogador, jogador_causador: Optional[Jogador], turno: int, desistiu: bool) -> Eliminacao:
+        if partida.concluida:
+            raise ValueError(f"Partida {partida.id} já tem resultado registrado.")
+        if jogador_eliminado not in partida.jogadores:
+            raise ValueError(f"{jogador_eliminado.nome} não está nesta partida.")
+        if jogador_causador is not None and jogador_causador not in partida.jogadores:
+            raise ValueError(f"{jogador_causador.nome} não está nesta partida.")
+        if partida.jogador_eliminado(jogador_eliminado):
+            raise ValueError(f"{jogador_eliminado.nome} já foi eliminado nesta partida.")
+        if turno < 1:
+            raise ValueError("Turno deve ser um número positivo.")
+        # Validação de turno com base nos turnos extras permitidos
+        if not partida.validar_turno(turno, torneio):
+            raise ValueError(f"Turno {turno} excede o limite permitido (máximo: {partida.turno_atual + torneio.turnos_extras}).")
+        eliminacao = Eliminacao(jogador_eliminado, jogador_causador, turno, desistiu)
+        partida.eliminacoes.append(eliminacao)
+        return eliminacao
+
+    @staticmethod
+    def concluir_partidas(torneio: Torneio, partidas: List[Partida]):
+        """Retira as partidas com resultado registrado da lista de partidas ativas do torneio"""
+        concluidas = {p.id for p in partidas}
+        for partida in partidas:
+            partida.concluir()
+        with torneio.trava:
+            torneio.partidas_concluidas.extend(p for p in torneio.partidas_ativas if p.id in concluidas)
+            torneio.partidas_ativas = [p for p in torneio.partidas_ativas if p.id not in concluidas]
+        for partida_id in concluidas:
+            torneio.tempo.encerrar_temporizador(partida_id)
 
     def calcular_rodadas(self, num_jogadores: int) -> int:
         if num_jogadores <= 8:
@@ -684,11 +2986,77 @@ class GerenciadorTorneio:
             sugestao += f"Adicione {num_maior - num_jogadores} jogador(es) para {num_maior}."
         return False, sugestao
 
-    def processar_resultados(self, partida: Partida, resultados: Dict[str, dict], anti_colusao: SistemaAntiColusao) -> None:
-        self._validar_resultados(partida, resultados)
-        eliminacoes_por_jogador = self._contar_eliminacoes(partida)
-        self._calcular_e_atualizar_pontuacoes(partida, resultados, eliminacoes_por_jogador)
-        self._analisar_anti_colusao(partida, resultados, anti_colusao)
+    def processar_resultados(self, partida: Partida, resultados: Dict[str, dict], anti_colusao: SistemaAntiColusao, torneio: Optional[Torneio] = None) -> None:
+        self.processar_rodada([(partida, resultados)], anti_colusao, torneio)
+
+    def processar_rodada(self, mesas: List[Tuple[Partida, Dict[str, dict]]], anti_colusao: SistemaAntiColusao, torneio: Optional[Torneio] = None) -> List[str]:
+        """Processa os resultados de várias mesas de uma vez e retorna as suspeitas de colusão
+
+        Todas as mesas são validadas e pontuadas antes de qualquer jogador ser
+        alterado, então um erro em qualquer mesa não deixa a rodada aplicada pela metade.
+        As travas das partidas e dos jogadores envolvidos ficam adquiridas durante
+        todo o processamento; mesas sem jogadores em comum seguem em paralelo.
+        Ainda sob as travas, as partidas são marcadas como concluídas e, com o
+        torneio informado, saem das partidas ativas, então um envio simultâneo
+        da mesma mesa é recusado com ValueError em vez de pontuá-la de novo.
+        """
+        partidas = [p for p, _ in mesas]
+        with self._travar_mesas(partidas):
+            for partida in partidas:
+                if partida.concluida:
+                    raise ValueError(f"Partida {partida.id} já tem resultado registrado.")
+                if torneio is not None and partida.torneio_id not in (None, torneio.id):
+                    raise ValueError(f"Partida {partida.id} não está ativa no torneio {torneio.nome}.")
+            self._processar_mesas(mesas)
+            if torneio is not None:
+                self.concluir_partidas(torneio, partidas)
+            else:
+                for partida in partidas:
+                    partida.concluir()
+        return self._analisar_anti_colusao(mesas, anti_colusao)
+
+    def _processar_mesas(self, mesas: List[Tuple[Partida, Dict[str, dict]]]):
+        pontuadas = []
+        for partida, resultados in mesas:
+            self._validar_resultados(partida, resultados)
+            eliminacoes_por_jogador = self._contar_eliminacoes(partida)
+            pontuacoes = self._calcular_pontuacoes(partida, resultados, eliminacoes_por_jogador)
+            preparada = self.historico.preparar(partida, resultados, pontuacoes)
+            pontuadas.append((partida, resultados, eliminacoes_por_jogador, pontuacoes, preparada))
+        for partida, resultados, eliminacoes_por_jogador, pontuacoes, preparada in pontuadas:
+            self._atualizar_pontuacoes(partida, resultados, eliminacoes_por_jogador, pontuacoes)
+            for jogador in partida.jogadores:
+                jogador.historico_partidas.append(partida)
+            self.historico.registrar_preparadas([preparada])
+            self.desempate.registrar_partida(partida)
+            for jogador in partida.jogadores:
+                Classificacao.atualizar_jogador(jogador)
+                self.visoes.jogador_alterado(jogador)
+
+    def registrar_resultados_mesa(self, torneio: Torneio, partida: Partida, resultados: Dict[str, dict]) -> List[str]:
+        """Processa e conclui uma partida ativa do torneio, retornando as suspeitas de colusão
+
+        Seguro para chamadas simultâneas: um segundo envio da mesma partida
+        espera o primeiro terminar e é recusado com ValueError.
+        """
+        return self.processar_rodada([(partida, resultados)], torneio.anti_colusao, torneio)
+
+    def processar_mesas_em_paralelo(self, torneio: Torneio, mesas: List[Tuple[Partida, Dict[str, dict]]], trabalhadores: int = 4) -> List[object]:
+        """Registra as mesas em threads de trabalho, cada uma de forma independente
+
+        Ao contrário de processar_rodada, um erro em uma mesa não impede as
+        demais. Retorna, na ordem das mesas, as suspeitas de cada mesa
+        registrada ou o ValueError de cada mesa recusada.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix="mesas") as executor:
+            futuros = [executor.submit(self.registrar_resultados_mesa, torneio, partida, resultados) for partida, resultados in mesas]
+            retorno = []
+            for futuro in futuros:
+                try:
+                    retorno.append(futuro.result())
+                except ValueError as e:
+                    retorno.append(e)
+        return retorno
 
     def _validar_resultados(self, partida: Partida, resultados: Dict[str, dict]) -> None:
         resultados_por_tipo = [dados["resultado"] for dados in resultados.values()]
@@ -711,35 +3079,55 @@ class GerenciadorTorneio:
             if resultados[jogador.id]["resultado"] != "DERROTA":
                 raise ValueError("Jogadores eliminados devem ter DERROTA.")
 
+        maximo = GerenciadorTorneio.VALOR_MAXIMO_RESULTADO
+        for dados in resultados.values():
+            if not 0 <= dados["turno"] <= maximo:
+                raise ValueError(f"Turno deve estar entre 0 e {maximo}.")
+            if not 0 <= dados["vida_final"] <= maximo:
+                raise ValueError(f"Vida final deve estar entre 0 e {maximo}.")
+            if not 0 <= dados["oponentes_danificados"] <= len(partida.jogadores) - 1:
+                raise ValueError(f"Oponentes danificados deve estar entre 0 e {len(partida.jogadores) - 1}.")
+
     def _contar_eliminacoes(self, partida: Partida) -> Dict[str, int]:
         eliminacoes = {}
         for jogador in partida.jogadores:
             eliminacoes[jogador.id] = sum(1 for e in partida.eliminacoes if e.jogador_causador == jogador)
         return eliminacoes
 
-    def _calcular_e_atualizar_pontuacoes(self, partida: Partida, resultados: Dict[str, dict], eliminacoes_por_jogador: Dict[str, int]) -> None:
+    def _calcular_pontuacoes(self, partida: Partida, resultados: Dict[str, dict], eliminacoes_por_jogador: Dict[str, int]) -> Dict[str, float]:
+        """Calcula o ID de cada jogador da mesa sem alterar o estado"""
+        pontuacoes = {}
         for jogador_id, dados in resultados.items():
             jogador = next(j for j in partida.jogadores if j.id == jogador_id)
-            rp = CalculadorIndiceDesempenho.calcular_rp(dados["resultado"])
-            tv = CalculadorIndiceDesempenho.calcular_tv(dados["resultado"], dados["turno"])
-            er = CalculadorIndiceDesempenho.calcular_er(dados["resultado"], eliminacoes_por_jogador[jogador_id], len(partida.jogadores))
-            pv = CalculadorIndiceDesempenho.calcular_pv(dados["resultado"], dados["vida_final"])
-            pa = CalculadorIndiceDesempenho.calcular_pa(dados["resultado"], dados["oponentes_danificados"])
-            
-            id_calculado = CalculadorIndiceDesempenho.calcular_id(rp, tv, er, pv, pa, len(partida.jogadores) == 3)
-            if not CalculadorIndiceDesempenho.validar_pontuacao(id_calculado, dados["resultado"], len(partida.jogadores)):
+            id_calculado, valido = CalculadorIndiceDesempenho.consultar_pontuacao(
+                dados["resultado"],
+                dados["turno"],
+                eliminacoes_por_jogador[jogador_id],
+                dados["vida_final"],
+                dados["oponentes_danificados"],
+                len(partida.jogadores)
+            )
+            if not valido:
                 raise ValueError(f"Pontuação inválida para {jogador.nome}: {id_calculado}")
-            
-            jogador.indice_desempenho = id_calculado
+            pontuacoes[jogador_id] = id_calculado
+        return pontuacoes
+
+    def _atualizar_pontuacoes(self, partida: Partida, resultados: Dict[str, dict], eliminacoes_por_jogador: Dict[str, int], pontuacoes: Dict[str, float]) -> None:
+        for jogador_id, dados in resultados.items():
+            jogador = next(j for j in partida.jogadores if j.id == jogador_id)
+            jogador.indice_desempenho = pontuacoes[jogador_id]
+            partida.pontuacoes[jogador_id] = pontuacoes[jogador_id]
+            partida.resultados[jogador_id] = dict(dados)
             if dados["resultado"] == "VITORIA" and eliminacoes_por_jogador[jogador_id] == len(partida.jogadores) - 1:
                 jogador.vitorias_isoladas += 1
 
-    def _analisar_anti_colusao(self, partida: Partida, resultados: Dict[str, dict], anti_colusao: SistemaAntiColusao) -> None:
-        suspeitas = anti_colusao.analisar_padroes(partida, resultados)
+    def _analisar_anti_colusao(self, mesas: List[Tuple[Partida, Dict[str, dict]]], anti_colusao: SistemaAntiColusao) -> List[str]:
+        suspeitas = anti_colusao.analisar_rodada(mesas)
         if suspeitas:
             print("\nALERTA: Padrões suspeitos detectados!")
             for suspeita in suspeitas:
                 print(suspeita)
+        return suspeitas
 
     def inscrever_jogador(
         self,
@@ -748,16 +3136,15 @@ class GerenciadorTorneio:
         deck: Deck
     ) -> bool:
         """Inscreve um jogador em um torneio"""
-        # Valida se o jogador já está inscrito
-        if any(
-            i.torneio == torneio and i.jogador == jogador
-            for i in self.inscricoes
-        ):
-            return False
-            
-        inscricao = Inscricao(torneio, jogador, deck)
-        self.inscricoes.append(inscricao)
-        return True
+        with self.trava:
+            # Valida se o jogador já está inscrito
+            if (torneio.id, jogador.id) in self.inscricoes_por_chave:
+                return False
+
+            inscricao = Inscricao(torneio, jogador, deck)
+            self.inscricoes.append(inscricao)
+            self.inscricoes_por_chave[(torneio.id, jogador.id)] = inscricao
+            return True
         
     def iniciar_torneio(self, torneio: Torneio) -> bool:
         """Inicia um torneio"""
@@ -812,6 +3199,10 @@ class GerenciadorTorneio:
     def buscar_torneio(self, nome: str) -> Torneio:
         """Busca um torneio pelo nome"""
         return next((t for t in self.torneios if t.nome == nome), None)
+
+    def buscar_torneio_por_id(self, torneio_id: str) -> Optional[Torneio]:
+        """Busca um torneio pelo id"""
+        return self.torneios_por_id.get(torneio_id)
         
     def listar_inscricoes(self, torneio: Torneio) -> list[Inscricao]:
         """Lista as inscrições de um torneio"""
@@ -821,13 +3212,1068 @@ class GerenciadorTorneio:
         """Lista as partidas de um torneio"""
         return [p for p in self.partidas if p.torneio == torneio]
 
+class ImportadorLote:
+    """Classe responsável pela importação em lote de jogadores, decks e inscrições a partir de CSV, JSONL ou JSON
+
+    Cada linha descreve um jogador (nome, email, senha) e, opcionalmente, o comandante
+    de um deck e o nome do torneio em que ele deve ser inscrito. CSV e JSONL são lidos
+    em lotes, sem carregar tudo em memória; um .json contém uma lista de registros (ou
+    {"jogadores": [...]}) e é lido inteiro. O estado é persistido uma única vez ao final.
+    Cada linha é aplicada por inteiro ou recusada sem criar nada: tudo o que pode
+    falhar é conferido antes de o jogador, o deck e a inscrição serem criados.
+    """
+
+    TAMANHO_LOTE = 500
+    CAMPOS = ("nome", "email", "senha", "comandante", "torneio")
+
+    def __init__(self, sistema: 'SistemaTorneioCommander'):
+        self.sistema = sistema
+        self.cadastros = sistema.gerenciador_cadastros
+        self.gerenciador_torneio = sistema.gerenciador_torneio
+        self.torneios_por_nome = {t.nome: t for t in self.gerenciador_torneio.torneios}
+        self.inscritos_por_torneio: Dict[str, Set[str]] = {}
+
+    def importar(self, caminho: str, torneio_padrao: Optional[str] = None) -> Dict:
+        """Importa o arquivo e retorna um relatório com contagens e erros por linha"""
+        relatorio = {"linhas": 0, "jogadores_criados": 0, "jogadores_existentes": 0, "decks_criados": 0, "inscricoes": 0, "erros": []}
+        operacoes: List[Tuple[str, dict]] = []
+        linhas = self._ler_linhas(caminho)
+        try:
+            while True:
+                lote = list(itertools.islice(linhas, self.TAMANHO_LOTE))
+                if not lote:
+                    break
+                for numero, registro, torneio, erro in self._validar_lote(lote, torneio_padrao):
+                    relatorio["linhas"] += 1
+                    if erro:
+                        relatorio["erros"].append({"linha": numero, "email": registro.get("email", ""), "erro": erro})
+                        continue
+                    try:
+                        self._aplicar_registro(registro, torneio, relatorio, operacoes)
+                    except ValueError as e:
+                        relatorio["erros"].append({"linha": numero, "email": registro["email"], "erro": str(e)})
+        finally:
+            # Se a leitura falhar no meio do arquivo, as linhas já aplicadas ainda são gravadas
+            self.sistema._registrar_operacoes(operacoes)
+        return relatorio
+
+    def _ler_linhas(self, caminho: str):
+        """Gera (número da linha ou do registro, registro) a partir de um arquivo CSV, JSONL ou JSON"""
+        with open(caminho, 'r', encoding='utf-8', newline='') as f:
+            if caminho.lower().endswith('.jsonl'):
+                for numero, linha in enumerate(f, 1):
+                    if not linha.strip():
+                        continue
+                    try:
+                        registro = json.loads(linha)
+                    except json.JSONDecodeError as e:
+                        yield numero, {"_erro": f"JSON inválido: {e}"}
+                        continue
+                    yield numero, registro if isinstance(registro, dict) else {"_erro": "Linha não é um objeto JSON."}
+            elif caminho.lower().endswith('.json'):
+                try:
+                    registros = json.load(f)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"JSON inválido em {caminho}: {e}") from None
+                if isinstance(registros, dict):
+                    registros = registros.get("jogadores", [])
+                if not isinstance(registros, list):
+                    raise ValueError("O arquivo deve conter uma lista de registros.")
+                for numero, registro in enumerate(registros, 1):
+                    yield numero, registro if isinstance(registro, dict) else {"_erro": "Registro não é um objeto JSON."}
+            else:
+                # A linha 1 é o cabeçalho
+                for numero, registro in enumerate(csv.DictReader(f), 2):
+                    yield numero, registro
+
+    def _validar_lote(self, lote: List[Tuple[int, dict]], torneio_padrao: Optional[str]) -> List[Tuple[int, dict, Optional[Torneio], Optional[str]]]:
+        """Normaliza e valida um lote de registros, retornando (número, registro, torneio, erro)
+
+        Os torneios citados no lote são resolvidos uma única vez e os emails já
+        cadastrados são separados de uma só vez. A senha dos demais é validada
+        aqui e o erro, guardado no registro, só recusa a linha se o jogador ainda
+        não existir ao aplicá-la (outra linha do arquivo pode tê-lo criado).
+        """
+        registros = []
+        for numero, bruto in lote:
+            if "_erro" in bruto:
+                registros.append((numero, {}, bruto["_erro"]))
+                continue
+            registro = {campo: str(bruto.get(campo) or "").strip() for campo in self.CAMPOS}
+            registro["torneio"] = registro["torneio"] or (torneio_padrao or "")
+            registros.append((numero, registro, None))
+
+        torneios: Dict[str, Tuple[Optional[Torneio], Optional[str]]] = {}
+        for nome in {r["torneio"] for _, r, erro in registros if not erro and r["torneio"]}:
+            torneio = self.torneios_por_nome.get(nome)
+            if not torneio:
+                torneios[nome] = (None, f"Torneio {nome} não encontrado.")
+            elif not torneio.inscricoes_abertas:
+                torneios[nome] = (None, f"Inscrições do torneio {torneio.nome} já finalizadas.")
+            else:
+                torneios[nome] = (torneio, None)
+        cadastrados = {r["email"] for _, r, erro in registros if not erro} & self.cadastros.jogadores_por_email.keys()
+
+        validados = []
+        for numero, registro, erro in registros:
+            torneio = None
+            if not erro:
+                if not registro["nome"]:
+                    erro = "Nome do jogador não pode ser vazio."
+                elif not Validador.validar_email(registro["email"]):
+                    erro = "Email inválido."
+                elif registro["torneio"] and torneios[registro["torneio"]][1]:
+                    erro = torneios[registro["torneio"]][1]
+                else:
+                    torneio = torneios[registro["torneio"]][0] if registro["torneio"] else None
+                    # Jogador já cadastrado: a senha não é revalidada
+                    valido, mensagem = (True, "") if registro["email"] in cadastrados else Validador.validar_senha(registro["senha"])
+                    registro["erro_senha"] = None if valido else mensagem
+            validados.append((numero, registro, torneio, erro))
+        return validados
+
+    def _aplicar_registro(self, registro: dict, torneio: Optional[Torneio], relatorio: Dict, operacoes: List[Tuple[str, dict]]):
+        """Confere a linha contra o estado atual e só então cria o jogador, o deck e a inscrição"""
+        jogador = self.cadastros.buscar_jogador(registro["email"])
+        if not jogador and registro["erro_senha"]:
+            raise ValueError(registro["erro_senha"])
+        nome = jogador.nome if jogador else registro["nome"]
+        deck = None
+        if jogador and registro["comandante"]:
+            # Reaproveita um deck ativo com o mesmo comandante, evitando duplicatas ao reimportar
+            deck = next((d for d in jogador.decks if d.ativo and d.comandante == registro["comandante"]), None)
+
+        inscritos = None
+        if torneio:
+            inscritos = self.inscritos_por_torneio.setdefault(torneio.id, {j.id for j in torneio.jogadores})
+            if jogador and jogador.id in inscritos:
+                raise ValueError(f"{nome} já está inscrito no torneio {torneio.nome}.")
+            if deck is None and not registro["comandante"]:
+                disponiveis = self.cadastros.buscar_decks(jogador, "DISPONIVEL") if jogador else []
+                if not disponiveis:
+                    raise ValueError(f"{nome} não possui decks disponíveis para o torneio {torneio.nome}.")
+                deck = disponiveis[0]
+            if deck is not None and not self.cadastros.deck_utilizavel(deck):
+                raise ValueError("Deck inválido ou já associado a outro torneio.")
+
+        # A linha é válida: a partir daqui nenhum passo falha
+        if jogador:
+            relatorio["jogadores_existentes"] += 1
+        else:
+            jogador = self.cadastros.cadastrar_jogador(registro["nome"], registro["email"])
+            jogador.definir_senha(registro["senha"])
+            operacoes.append(("jogador", Persistencia._serializar_jogador(jogador)))
+            relatorio["jogadores_criados"] += 1
+
+        if deck is None and registro["comandante"]:
+            deck = self.cadastros.cadastrar_deck(jogador, registro["comandante"])
+            operacoes.append(("deck", Persistencia._serializar_deck(deck)))
+            relatorio["decks_criados"] += 1
+
+        if torneio:
+            self.cadastros.validar_deck(deck, torneio)
+            self.gerenciador_torneio.inscrever_jogador(torneio, jogador, deck)
+            torneio.adicionar_jogador(jogador)
+            inscritos.add(jogador.id)
+            operacoes.append(("inscricao", {"torneio_id": torneio.id, "jogador_id": jogador.id, "deck_id": deck.id}))
+            relatorio["inscricoes"] += 1
+
+class RegistroResultadosLote:
+    """Registro não interativo dos resultados de uma rodada a partir de JSON ou JSONL
+
+    Cada mesa traz uma lista de resultados identificados pelo email do jogador;
+    jogadores já eliminados podem ser omitidos e recebem DERROTA no turno da
+    eliminação. Um arquivo .json contém uma lista de mesas (ou {"mesas": [...]})
+    e um .jsonl contém uma mesa por linha. Todas as mesas são validadas antes de
+    qualquer alteração e a rodada é registrada em uma única escrita. Apenas as
+    partidas ativas do torneio informado são consideradas.
+    """
+
+    RESULTADOS = ("VITORIA", "EMPATE", "DERROTA")
+
+    def __init__(self, sistema: 'SistemaTorneioCommander', torneio: Torneio, partidas: Optional[List[Partida]] = None):
+        self.sistema = sistema
+        self.torneio = torneio
+        self.cadastros = sistema.gerenciador_cadastros
+        # Sem partidas informadas, aceita resultados de qualquer partida ativa do torneio
+        partidas = torneio.partidas_ativas if partidas is None else partidas
+        self.partidas_por_jogador = {j.id: p for p in partidas for j in p.jogadores}
+
+    def registrar(self, caminho: str) -> Dict:
+        """Valida, pontua e registra todas as mesas do arquivo; nada é aplicado se houver erro"""
+        torneio = self.torneio
+        if not torneio.partidas_ativas:
+            raise ValueError(f"{self.sistema.erros['sem_partidas_ativas']} no torneio {torneio.nome}.")
+        mesas = []
+        partidas_vistas = set()
+        for numero, registro in self._ler_mesas(caminho):
+            partida, resultados = self._montar_resultados(numero, registro, torneio)
+            if partida.id in partidas_vistas:
+                raise ValueError(f"Mesa {numero}: resultados da mesma partida enviados mais de uma vez.")
+            partidas_vistas.add(partida.id)
+            mesas.append((partida, resultados))
+        if not mesas:
+            raise ValueError("Nenhuma mesa encontrada no arquivo.")
+
+        suspeitas = self.sistema.gerenciador_torneio.processar_rodada(mesas, torneio.anti_colusao, torneio)
+        self.sistema._registrar_operacoes([("resultado", self.sistema._dados_resultado(p)) for p, _ in mesas])
+        return {
+            "torneio": torneio.nome,
+            "mesas": len(mesas),
+            "jogadores": sum(len(p.jogadores) for p, _ in mesas),
+            "pendentes": len(torneio.partidas_ativas),
+            "suspeitas": suspeitas
+        }
+
+    def _ler_mesas(self, caminho: str) -> List[Tuple[int, dict]]:
+        """Lê (número da mesa no arquivo, registro) de um arquivo .json ou .jsonl"""
+        with open(caminho, 'r', encoding='utf-8') as f:
+            try:
+                if caminho.lower().endswith('.jsonl'):
+                    registros = [json.loads(linha) for linha in f if linha.strip()]
+                else:
+                    registros = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"JSON inválido em {caminho}: {e}") from None
+        if isinstance(registros, dict):
+            registros = registros.get("mesas", [])
+        if not isinstance(registros, list) or not all(isinstance(r, dict) for r in registros):
+            raise ValueError("O arquivo deve conter uma lista de mesas.")
+        return list(enumerate(registros, 1))
+
+    @staticmethod
+    def _inteiro(valor, campo: str, numero: int) -> int:
+        if isinstance(valor, bool) or not (isinstance(valor, int) or (isinstance(valor, str) and valor.strip().isdigit())):
+            raise ValueError(f"Mesa {numero}: {campo} deve ser um número inteiro não-negativo.")
+        valor = int(valor)
+        if valor < 0:
+            raise ValueError(f"Mesa {numero}: {campo} deve ser um número inteiro não-negativo.")
+        return valor
+
+    def _montar_resultados(self, numero: int, registro: dict, torneio: Torneio) -> Tuple[Partida, Dict[str, dict]]:
+        """Converte o registro de uma mesa nos resultados esperados por processar_resultados"""
+        entradas = registro.get("resultados")
+        if not isinstance(entradas, list) or not entradas:
+            raise ValueError(f"Mesa {numero}: lista de resultados ausente.")
+
+        partida = None
+        resultados = {}
+        for entrada in entradas:
+            email = str(entrada.get("email", "")).strip()
+            jogador = self.cadastros.buscar_jogador(email)
+            if not jogador:
+                raise ValueError(f"Mesa {numero}: jogador {email or 'sem email'} não encontrado.")
+            partida_jogador = self.partidas_por_jogador.get(jogador.id)
+            if partida_jogador is None:
+                raise ValueError(f"Mesa {numero}: {jogador.nome} não está em nenhuma partida ativa do torneio {torneio.nome}.")
+            if partida is None:
+                partida = partida_jogador
+            elif partida_jogador is not partida:
+                raise ValueError(f"Mesa {numero}: {jogador.nome} está em outra mesa.")
+            if jogador.id in resultados:
+                raise ValueError(f"Mesa {numero}: {jogador.nome} aparece mais de uma vez.")
+
+            resultado = str(entrada.get("resultado", "")).upper()
+            if resultado not in self.RESULTADOS:
+                raise ValueError(f"Mesa {numero}: resultado inválido para {jogador.nome}. Use VITORIA, EMPATE ou DERROTA.")
+            turno = self._inteiro(entrada.get("turno"), "turno", numero)
+            if not partida.validar_turno(turno, torneio):
+                raise ValueError(f"Mesa {numero}: turno {turno} fora do limite permitido (1 a {partida.turno_atual + torneio.turnos_extras}).")
+            vida_final = min(self._inteiro(entrada.get("vida_final", 0), "vida_final", numero), 40)
+            oponentes_danificados = self._inteiro(entrada.get("oponentes_danificados", 0), "oponentes_danificados", numero)
+            if oponentes_danificados > len(partida.jogadores) - 1:
+                raise ValueError(f"Mesa {numero}: oponentes danificados deve ser entre 0 e {len(partida.jogadores) - 1}.")
+            resultados[jogador.id] = {
+                "resultado": resultado,
+                "turno": turno,
+                "eliminacoes": 0,
+                "vida_final": vida_final,
+                "oponentes_danificados": oponentes_danificados
+            }
+
+        if registro.get("partida_id") and registro["partida_id"] != partida.id:
+            raise ValueError(f"Mesa {numero}: os jogadores não pertencem à partida {registro['partida_id']}.")
+        for eliminacao in partida.eliminacoes:
+            resultados.setdefault(eliminacao.jogador_eliminado.id, {
+                "resultado": "DERROTA",
+                "turno": eliminacao.turno,
+                "eliminacoes": 0,
+                "vida_final": 0,
+                "oponentes_danificados": 0
+            })
+        faltantes = [j.nome for j in partida.jogadores if j.id not in resultados]
+        if faltantes:
+            raise ValueError(f"Mesa {numero}: faltam resultados de {', '.join(faltantes)}.")
+        try:
+            self.sistema.gerenciador_torneio._validar_resultados(partida, resultados)
+        except ValueError as e:
+            raise ValueError(f"Mesa {numero}: {e}") from None
+        return partida, resultados
+
+class GeradorRelatorio:
+    """Relatório do sistema gerado em fluxo, página a página, em texto, CSV ou JSON
+
+    Os agregados de cada torneio e de cada jogador vêm das visões
+    materializadas da temporada (VisoesRelatorio), reaproveitadas entre
+    relatórios, e o histórico de partidas de cada jogador vem das colunas do
+    histórico da temporada (HistoricoColunar). Cada torneio e cada jogador
+    viram um registro montado apenas quando chega a sua vez, e os registros são
+    escritos em páginas de tamanho fixo. O tempo é linear no tamanho do estado.
+    A memória não é constante: a saída guarda uma página de registros, e o
+    tamanho de um registro cresce com as partidas do jogador ou os inscritos do
+    torneio; além disso, os índices por jogador do histórico e os nomes dos
+    jogadores, montados uma vez e mantidos entre relatórios, crescem
+    linearmente com jogadores e participações.
+
+    - texto: o mesmo relatório do menu, com cores apenas na tela;
+    - csv: uma linha por juiz, torneio, inscrito, alerta de colusão, jogador e
+      partida do histórico, identificada pela coluna "secao";
+    - json: uma lista com um objeto por juiz, torneio, jogador e alertas da
+      temporada, escrita registro a registro.
+    """
+
+    FORMATOS = ("texto", "csv", "json")
+    TAMANHO_PAGINA = 20
+    CAMPOS_CSV = (
+        "secao", "torneio", "status", "nome", "email", "deck", "inscritos", "rodadas", "mesas", "media_id",
+        "comandantes", "torneios", "partidas", "vitorias_isoladas", "winrate", "indice_desempenho",
+        "partida_id", "mesa", "resultado", "id_partida", "descricao"
+    )
+
+    def __init__(self, sistema: 'SistemaTorneioCommander', filtro_torneio: str = "", filtro_status: str = "TODOS", cores: bool = False,
+                 visoes: Optional[VisoesRelatorio] = None):
+        self.sistema = sistema
+        self.filtro_torneio = filtro_torneio.lower()
+        self.filtro_status = filtro_status if filtro_status in ("ATIVO", "INATIVO") else "TODOS"
+        self.cores = cores
+        self.visoes = visoes or sistema.gerenciador_torneio.visoes
+        self.historico = sistema.gerenciador_torneio.historico
+        self._nomes_historico = np.zeros(0, dtype=object)
+
+    @staticmethod
+    def _status(torneio: Torneio, curto: bool = False) -> str:
+        if torneio.inscricoes_abertas:
+            return "Inscrições Abertas"
+        andamento = "Concluído" if torneio.rodada_atual >= torneio.rodadas else f"Em Andamento, Rodada {torneio.rodada_atual}"
+        return andamento if curto else f"Inscrições Finalizadas ({andamento})"
+
+    def _torneios(self) -> List[Torneio]:
+        """Torneios cujo nome contém o filtro"""
+        torneios = self.sistema.gerenciador_torneio.torneios
+        if self.filtro_torneio:
+            torneios = [t for t in torneios if self.filtro_torneio in t.nome.lower()]
+        return torneios
+
+    def _alertas(self, detector: DetectorColusao, limite: int = 10) -> dict:
+        jogadores_por_id = self.sistema.gerenciador_cadastros.jogadores_por_id
+        alertas = detector.pares_suspeitos(limite)
+        nomes = {jid: jogadores_por_id[jid].nome for a in alertas for jid in a["jogadores"] if jid in jogadores_por_id}
+        return {
+            "total": len(detector.alertas),
+            "pares_acompanhados": len(detector.pares),
+            "descricoes": [DetectorColusao.descrever(a, nomes) for a in alertas]
+        }
+
+    def _registro_torneio(self, torneio: Torneio) -> dict:
+        visao = self.visoes.torneio(torneio)
+        return {
+            "secao": "torneio",
+            "id": torneio.id,
+            "nome": torneio.nome,
+            "data": torneio.data.isoformat(),
+            "status": self._status(torneio),
+            "min_jogadores": torneio.min_jogadores,
+            "inscritos": visao["inscritos"],
+            "rodadas": torneio.rodadas,
+            "mesas": visao["mesas"],
+            "jogadores": [{"nome": j.nome, "email": j.email, "deck": visao["decks"].get(j.id)} for j in torneio.jogadores],
+            "media_id": visao["media_id"],
+            "comandantes": visao["comandantes"],
+            "colusao": self._alertas(torneio.anti_colusao.detector)
+        }
+
+    def _nomes(self) -> np.ndarray:
+        """Nomes dos jogadores do histórico na ordem dos seus índices, refeitos só quando entram jogadores novos"""
+        jogadores = self.historico.jogadores
+        if len(self._nomes_historico) != len(jogadores):
+            self._nomes_historico = np.array([j.nome for j in jogadores], dtype=object)
+        return self._nomes_historico
+
+    def _partidas(self, jogador: Jogador) -> List[dict]:
+        """Histórico de partidas do jogador, lido das colunas do histórico da temporada sem percorrer as partidas"""
+        c = self.historico.colunas_jogador(jogador.id)
+        if not len(c["partida"]):
+            return []
+        nomes = self._nomes()
+        indice = self.historico.indices_jogadores[jogador.id]
+        mesas = nomes[c["mesas"]].tolist()
+        eliminacoes = [[] for _ in range(len(c["partida"]))]
+        # Apenas as eliminações causadas ou sofridas pelo jogador entram no histórico
+        proprias = (c["causador"] == indice) | (c["eliminado"] == indice)
+        for posicao, eliminado, causador, turno, desistiu in zip(*(c[nome][proprias].tolist() for nome in ("posicao", "eliminado", "causador", "turno", "desistiu"))):
+            if causador == indice:
+                eliminacoes[posicao].append({"tipo": "Eliminou", "jogador": nomes[eliminado], "turno": turno})
+            else:
+                eliminacoes[posicao].append({
+                    "tipo": "Desistência" if desistiu else "Eliminação",
+                    "jogador": nomes[causador] if causador >= 0 else "Auto-eliminação",
+                    "turno": turno
+                })
+        ids = self.historico.ids_partidas
+        partidas = []
+        inicio = 0
+        for numero, resultado, pontuacao, tamanho, eliminacoes_partida in zip(
+            c["partida"].tolist(), c["resultado"].tolist(), c["pontuacao"].tolist(), c["jogadores"].tolist(), eliminacoes
+        ):
+            partidas.append({
+                "partida_id": ids[numero],
+                "mesa": mesas[inicio:inicio + tamanho],
+                "id_partida": pontuacao if resultado >= 0 else 0,
+                "resultado": HistoricoColunar.RESULTADOS[resultado] if resultado >= 0 else "Desconhecido",
+                "eliminacoes": eliminacoes_partida
+            })
+            inicio += tamanho
+        return partidas
+
+    def _registro_jogador(self, jogador: Jogador) -> dict:
+        partidas = self._partidas(jogador)
+        visao = self.visoes.jogador(jogador)
+        return {
+            "secao": "jogador",
+            "id": jogador.id,
+            "nome": jogador.nome,
+            "email": jogador.email,
+            "decks": [
+                {"comandante": d.comandante, "torneio": d.torneio.nome if d.torneio else None, "ativo": d.ativo}
+                for d in jogador.decks
+            ],
+            "torneios": [{"nome": t.nome, "status": self._status(t, curto=True)} for t in visao["torneios"]],
+            "vitorias_isoladas": visao["vitorias_isoladas"],
+            "winrate": visao["winrate"],
+            "indice_desempenho": visao["indice_desempenho"],
+            "partidas": partidas
+        }
+
+    def secoes(self) -> Iterator[Tuple[str, int, Iterator[dict]]]:
+        """Seções do relatório: (nome, quantidade de itens antes dos filtros de status, registros gerados sob demanda)"""
+        cadastros = self.sistema.gerenciador_cadastros
+        yield "juizes", len(cadastros.juizes), ({"secao": "juiz", "nome": j.nome, "email": j.email} for j in cadastros.juizes)
+        torneios = self._torneios()
+
+        def registros_torneios():
+            for torneio in torneios:
+                ativo = torneio.inscricoes_abertas or torneio.rodada_atual < torneio.rodadas
+                if (self.filtro_status == "ATIVO" and not ativo) or (self.filtro_status == "INATIVO" and ativo):
+                    continue
+                yield self._registro_torneio(torneio)
+
+        yield "torneios", len(torneios), registros_torneios()
+        temporada = self.sistema.gerenciador_torneio.detector_colusao
+        yield "colusao_temporada", len(temporada.alertas), (
+            dict(self._alertas(temporada), secao="colusao_temporada") for _ in range(1 if temporada.alertas else 0)
+        )
+        yield "jogadores", len(cadastros.jogadores), (self._registro_jogador(j) for j in cadastros.jogadores)
+
+    def _cor(self, texto: str, cor: str) -> str:
+        return cor + texto + Style.RESET_ALL if self.cores else texto
+
+    def _texto_cabecalho(self, secao: str, quantidade: int) -> str:
+        titulos = {
+            "juizes": ("\nJuízes Cadastrados:", "  Nenhum juiz cadastrado."),
+            "torneios": ("\nTorneios:", "  Nenhum torneio encontrado com o filtro aplicado."),
+            "colusao_temporada": ("\nColusão na Temporada (todos os torneios):", None),
+            "jogadores": ("\nJogadores Cadastrados:", "  Nenhum jogador cadastrado."),
+        }
+        titulo, vazio = titulos[secao]
+        if not quantidade:
+            return f"{self._cor(titulo, Fore.CYAN)}\n{vazio}\n" if vazio else ""
+        return self._cor(titulo, Fore.CYAN) + "\n"
+
+    def _linhas_alertas(self, alertas: dict, recuo: str) -> List[str]:
+        if not alertas["descricoes"]:
+            return []
+        linhas = [f"{recuo}Pares Suspeitos ({alertas['total']} alerta(s), {alertas['pares_acompanhados']} pares acompanhados):"]
+        linhas.extend(self._cor(f"{recuo}  - {d}", Fore.YELLOW) for d in alertas["descricoes"])
+        return linhas
+
+    def _texto(self, r: dict) -> str:
+        linhas = []
+        if r["secao"] == "juiz":
+            linhas.append(f"  - {r['nome']} ({r['email']})")
+        elif r["secao"] == "torneio":
+            linhas.append(self._cor(f"\n  Torneio: {r['nome']}", Fore.YELLOW))
+            linhas.append(f"    Data de Criação: {datetime.fromisoformat(r['data']).strftime('%d/%m/%Y %H:%M')}")
+            linhas.append(f"    Status: {r['status']}")
+            linhas.append(f"    Mínimo de Jogadores: {r['min_jogadores']}")
+            linhas.append(f"    Jogadores Inscritos: {r['inscritos']}")
+            linhas.append(f"    Rodadas: {r['rodadas']}")
+            linhas.append(f"    Mesas: {r['mesas']}")
+            linhas.append("    Jogadores e Decks:")
+            if not r["jogadores"]:
+                linhas.append("      Nenhum jogador inscrito.")
+            for j in r["jogadores"]:
+                linhas.append(f"      - {j['nome']} ({j['email']}): Deck {j['deck'] or 'Sem deck associado'}")
+            linhas.append("    Estatísticas do Torneio:")
+            if r["media_id"] is not None:
+                linhas.append(f"      Média de ID: {r['media_id']:.2f}")
+                linhas.append(f"      Comandantes utilizados: {', '.join(r['comandantes']) if r['comandantes'] else 'Nenhum'}")
+            linhas.extend(self._linhas_alertas(r["colusao"], "    "))
+        elif r["secao"] == "colusao_temporada":
+            linhas.extend(self._linhas_alertas(r, "  "))
+        else:
+            linhas.append(self._cor(f"\n  Jogador: {r['nome']} ({r['email']})", Fore.YELLOW))
+            linhas.append("    Decks:")
+            if not r["decks"]:
+                linhas.append("      Nenhum deck cadastrado.")
+            for d in r["decks"]:
+                linhas.append(f"      - {d['comandante']} (Torneio: {d['torneio'] or 'Não associado a torneio'}, Status: {'Ativo' if d['ativo'] else 'Inativo'})")
+            linhas.append("    Torneios Participados/Participando:")
+            if not r["torneios"]:
+                linhas.append("      Nenhum torneio.")
+            for t in r["torneios"]:
+                linhas.append(f"      - {t['nome']} ({t['status']})")
+            linhas.append("    Visão Individual:")
+            if not r["partidas"]:
+                linhas.append("      Nenhuma partida registrada.")
+            else:
+                linhas.append(f"      Vitórias Isoladas: {r['vitorias_isoladas']}")
+                linhas.append(f"      Winrate: {r['winrate']:.2f}%")
+                linhas.append(f"      Índice de Desempenho Total: {r['indice_desempenho']:.2f}")
+                linhas.append("      Histórico de Partidas:")
+                for p in r["partidas"]:
+                    linhas.append(f"        - Mesa com {', '.join(p['mesa'])}: ID {p['id_partida']:.2f} ({p['resultado']})")
+                    linhas.append("          Eliminações:")
+                    for e in p["eliminacoes"]:
+                        if e["tipo"] == "Eliminou":
+                            linhas.append(f"            Eliminou {e['jogador']} no turno {e['turno']}")
+                        else:
+                            linhas.append(f"            {e['tipo']} por {e['jogador']} no turno {e['turno']}")
+        return "".join(linha + "\n" for linha in linhas)
+
+    @staticmethod
+    def _linhas_csv(r: dict) -> List[dict]:
+        if r["secao"] == "juiz":
+            return [r]
+        if r["secao"] == "colusao_temporada":
+            return [{"secao": "alerta_colusao", "descricao": d} for d in r["descricoes"]]
+        if r["secao"] == "torneio":
+            linhas = [{
+                "secao": "torneio", "torneio": r["nome"], "status": r["status"], "inscritos": r["inscritos"], "rodadas": r["rodadas"],
+                "mesas": r["mesas"], "media_id": f"{r['media_id']:.2f}" if r["media_id"] is not None else "",
+                "comandantes": "; ".join(r["comandantes"])
+            }]
+            linhas.extend({"secao": "inscrito", "torneio": r["nome"], "nome": j["nome"], "email": j["email"], "deck": j["deck"] or ""} for j in r["jogadores"])
+            linhas.extend({"secao": "alerta_colusao", "torneio": r["nome"], "descricao": d} for d in r["colusao"]["descricoes"])
+            return linhas
+        linhas = [{
+            "secao": "jogador", "nome": r["nome"], "email": r["email"], "deck": "; ".join(d["comandante"] for d in r["decks"]),
+            "torneios": "; ".join(t["nome"] for t in r["torneios"]), "partidas": len(r["partidas"]),
+            "vitorias_isoladas": r["vitorias_isoladas"], "winrate": f"{r['winrate']:.2f}", "indice_desempenho": f"{r['indice_desempenho']:.2f}"
+        }]
+        linhas.extend({
+            "secao": "partida", "nome": r["nome"], "email": r["email"], "partida_id": p["partida_id"], "mesa": "; ".join(p["mesa"]),
+            "resultado": p["resultado"], "id_partida": f"{p['id_partida']:.2f}",
+            "descricao": "; ".join(f"{e['tipo']} {e['jogador']} no turno {e['turno']}" for e in p["eliminacoes"])
+        } for p in r["partidas"])
+        return linhas
+
+    def _blocos(self, formato: str) -> Iterator[Tuple[str, bool]]:
+        """Texto de saída em ordem: (bloco, se é um registro que conta para o tamanho da página)"""
+        if formato == "texto":
+            yield self._cor("\n=== Relatório do Sistema de Torneios Commander ===", Fore.GREEN) + "\n", False
+            for secao, quantidade, registros in self.secoes():
+                # O cabeçalho da seção acompanha o primeiro registro para abrir a mesma página
+                cabecalho = self._texto_cabecalho(secao, quantidade)
+                for registro in registros:
+                    yield cabecalho + self._texto(registro), True
+                    cabecalho = ""
+                if cabecalho:
+                    yield cabecalho, False
+        elif formato == "csv":
+            buffer = io.StringIO()
+            escritor = csv.DictWriter(buffer, fieldnames=self.CAMPOS_CSV, extrasaction="ignore")
+            escritor.writeheader()
+            for _, _, registros in self.secoes():
+                for registro in registros:
+                    escritor.writerows(self._linhas_csv(registro))
+                    yield buffer.getvalue(), True
+                    buffer.seek(0)
+                    buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue(), False
+        else:
+            separador = "[\n"
+            for _, _, registros in self.secoes():
+                for registro in registros:
+                    yield separador + json.dumps(registro, ensure_ascii=False), True
+                    separador = ",\n"
+            yield ("[" if separador == "[\n" else "\n") + "]\n", False
+
+    def escrever(self, destino, formato: str = "texto", tamanho_pagina: int = TAMANHO_PAGINA, ao_fim_da_pagina: Optional[Callable[[int], bool]] = None) -> int:
+        """Escreve o relatório no arquivo aberto, uma página de registros por escrita, e retorna o número de páginas
+
+        Após cada página completa (exceto a última), `ao_fim_da_pagina` recebe o
+        número da página e pode interromper o relatório retornando False.
+        """
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato inválido: {formato}. Use {', '.join(self.FORMATOS)}.")
+        if tamanho_pagina < 1:
+            raise ValueError("O tamanho da página deve ser positivo.")
+        pagina: List[str] = []
+        registros = 0
+        paginas = 0
+        for bloco, conta in self._blocos(formato):
+            if conta and registros == tamanho_pagina:
+                destino.write("".join(pagina))
+                destino.flush()
+                paginas += 1
+                pagina, registros = [], 0
+                if ao_fim_da_pagina and not ao_fim_da_pagina(paginas):
+                    return paginas
+            pagina.append(bloco)
+            registros += conta
+        destino.write("".join(pagina))
+        destino.flush()
+        return paginas + 1
+
+    @staticmethod
+    def formato_do_arquivo(caminho: str) -> str:
+        """Formato indicado pela extensão do arquivo (.csv, .json ou texto)"""
+        extensao = Path(caminho).suffix.lower().lstrip(".")
+        return extensao if extensao in ("csv", "json") else "texto"
+
+    def exportar(self, caminho: str, formato: Optional[str] = None, tamanho_pagina: int = 100) -> int:
+        """Grava o relatório em um arquivo; sem formato, usa a extensão (.csv, .json ou texto)"""
+        formato = formato or self.formato_do_arquivo(caminho)
+        with open(caminho, 'w', encoding='utf-8', newline='' if formato == "csv" else None) as f:
+            return self.escrever(f, formato, tamanho_pagina)
+
+
+class AnaliseGrafoColusao:
+    """Análise em lote das eliminações e mesas de todos os torneios, para a revisão de colusão pelos juízes
+
+    As partidas concluídas são lidas uma única vez para vetores de índices
+    inteiros (das colunas do histórico da temporada, quando informado, ou
+    percorrendo as partidas de cada torneio); a partir deles são montadas, em forma esparsa (chaves linha * n +
+    coluna ordenadas, com as contagens), as matrizes jogador x jogador de
+    eliminações (quem eliminou quem), de mesas divididas e de empates juntos.
+    Todo o restante é feito com operações vetorizadas do NumPy sobre essas
+    matrizes:
+
+    - cada par que dividiu mesa recebe um desvio (raiz com sinal da razão de
+      verossimilhança da binomial) para mesas divididas, eliminações em cada
+      sentido, eliminações entre os dois e empates juntos, comparados às taxas
+      de toda a temporada, além da reciprocidade das eliminações;
+    - pares acima do limiar (corrigido pelo número de testes) formam um grafo
+      cujos componentes conexos são os grupos suspeitos;
+    - jogadores com taxa de empates acima da esperada, ou com eliminações
+      causadas ou sofridas concentradas em um único jogador acima do esperado
+      se os alvos fossem indiferentes entre os oponentes que enfrentou (o
+      mesmo desvio), são destacados.
+
+    O resultado é uma lista de revisão ordenada, com o jogador, o torneio e a
+    descrição a usar no registro de denúncia (opção 12 do menu).
+    """
+
+    ALFA = 0.01
+    MIN_OCORRENCIAS = 3
+    MIN_ELIMINACOES = 5
+
+    def __init__(self, torneios: List[Torneio], historico: Optional[HistoricoColunar] = None):
+        self.torneios = torneios
+        self.historico = historico
+        self.jogadores: List[Jogador] = []
+        self.indices: Dict[str, int] = {}
+        # Matrizes esparsas da última análise: nome -> (chaves linha * n + coluna ordenadas, contagens)
+        self.matrizes: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _indice(self, jogador: Jogador) -> int:
+        indice = self.indices.get(jogador.id)
+        if indice is None:
+            indice = self.indices[jogador.id] = len(self.jogadores)
+            self.jogadores.append(jogador)
+        return indice
+
+    def _extrair(self) -> Dict[str, np.ndarray]:
+        """Percorre as partidas concluídas uma vez e devolve vetores de índices inteiros"""
+        if self.historico is not None:
+            return self._extrair_colunas()
+        assentos, tamanhos, torneio_partida = [], [], []
+        causadores, eliminados = [], []
+        empates_jogador, empates_partida = [], []
+        for t, torneio in enumerate(self.torneios):
+            for partida in torneio.partidas_concluidas:
+                numero = len(tamanhos)
+                assentos.extend(self._indice(j) for j in partida.jogadores)
+                tamanhos.append(len(partida.jogadores))
+                torneio_partida.append(t)
+                for e in partida.eliminacoes:
+                    if e.jogador_causador and e.jogador_causador is not e.jogador_eliminado:
+                        causadores.append(self._indice(e.jogador_causador))
+                        eliminados.append(self._indice(e.jogador_eliminado))
+                for jogador_id, dados in partida.resultados.items():
+                    if dados["resultado"] == "EMPATE":
+                        empates_jogador.append(self.indices[jogador_id])
+                        empates_partida.append(numero)
+        vetor = lambda valores: np.asarray(valores, dtype=np.int64)
+        return {
+            "assentos": vetor(assentos), "tamanhos": vetor(tamanhos), "torneio_partida": vetor(torneio_partida),
+            "causadores": vetor(causadores), "eliminados": vetor(eliminados),
+            "empates_jogador": vetor(empates_jogador), "empates_partida": vetor(empates_partida)
+        }
+
+    def _extrair_colunas(self) -> Dict[str, np.ndarray]:
+        """Os mesmos vetores de _extrair, montados a partir das colunas do histórico sem percorrer as partidas
+
+        As partidas seguem a ordem dos torneios analisados e, em cada torneio, a
+        ordem de registro no histórico.
+        """
+        historico = self.historico
+        partidas, participacoes, eliminacoes = historico.colunas()
+        # Posição de cada torneio do histórico na lista analisada; a entrada extra, -1, atende as partidas sem torneio
+        posicoes = np.full(len(historico.ids_torneios) + 1, -1, dtype=np.int64)
+        for t, torneio in enumerate(self.torneios):
+            indice = historico.indices_torneios.get(torneio.id)
+            if indice is not None:
+                posicoes[indice] = t
+        torneio_partida = posicoes[partidas["torneio"]]
+        selecionadas = np.flatnonzero(torneio_partida >= 0)
+        selecionadas = selecionadas[np.argsort(torneio_partida[selecionadas], kind="stable")]
+        tamanhos = partidas["jogadores"][selecionadas].astype(np.int64)
+        # Linhas de participação das partidas selecionadas, mesa a mesa
+        linhas = historico.linhas_das_faixas(partidas["inicio"][selecionadas], tamanhos)
+        jogadores = participacoes["jogador"][linhas]
+        # Índices da análise na ordem em que cada jogador aparece pela primeira vez, como em _extrair
+        unicos, primeiras = np.unique(jogadores, return_index=True)
+        ordem = unicos[np.argsort(primeiras)]
+        mapa = np.full(len(historico.jogadores), -1, dtype=np.int64)
+        mapa[ordem] = np.arange(len(ordem))
+        self.jogadores = [historico.jogadores[i] for i in ordem.tolist()]
+        self.indices = {j.id: i for i, j in enumerate(self.jogadores)}
+        numeros = np.full(len(partidas["inicio"]), -1, dtype=np.int64)
+        numeros[selecionadas] = np.arange(len(selecionadas))
+        causadores, eliminados = eliminacoes["causador"], eliminacoes["eliminado"]
+        validas = (numeros[eliminacoes["partida"]] >= 0) & (causadores >= 0) & (causadores != eliminados)
+        empates = participacoes["resultado"][linhas] == CalculadorIndiceDesempenho.CODIGOS_RESULTADO["EMPATE"]
+        return {
+            "assentos": mapa[jogadores], "tamanhos": tamanhos, "torneio_partida": torneio_partida[selecionadas],
+            "causadores": mapa[causadores[validas]], "eliminados": mapa[eliminados[validas]],
+            "empates_jogador": mapa[jogadores[empates]], "empates_partida": np.repeat(np.arange(len(selecionadas)), tamanhos)[empates]
+        }
+
+    @staticmethod
+    def _esparsa(chaves: np.ndarray, pesos: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Agrega chaves repetidas: retorna as chaves distintas ordenadas e a soma dos pesos de cada uma"""
+        unicas, inversos = np.unique(chaves, return_inverse=True)
+        valores = np.bincount(inversos, weights=pesos, minlength=len(unicas))
+        return unicas, valores if pesos is not None else valores.astype(np.int64)
+
+    @staticmethod
+    def _consultar(chaves: np.ndarray, valores: np.ndarray, consulta: np.ndarray) -> np.ndarray:
+        """Valores da matriz esparsa nas chaves consultadas (0 onde não há entrada)"""
+        if len(chaves) == 0:
+            return np.zeros(len(consulta), dtype=valores.dtype)
+        posicoes = np.minimum(np.searchsorted(chaves, consulta), len(chaves) - 1)
+        return np.where(chaves[posicoes] == consulta, valores[posicoes], 0)
+
+    @staticmethod
+    def _pares_mesas(linhas: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pares (i < j) de cada linha de uma matriz de mesas preenchida com -1, e a linha de cada par"""
+        largura = linhas.shape[1]
+        a, b = np.triu_indices(largura, 1)
+        i, j = linhas[:, a].ravel(), linhas[:, b].ravel()
+        origem = np.repeat(np.arange(len(linhas)), len(a))
+        validos = (i >= 0) & (j >= 0)
+        i, j, origem = i[validos], j[validos], origem[validos]
+        return np.minimum(i, j), np.maximum(i, j), origem
+
+    @staticmethod
+    def _agrupar(valores: np.ndarray, grupos: np.ndarray, num_grupos: int, largura: int) -> np.ndarray:
+        """Distribui valores ordenados por grupo em uma matriz (grupos x largura) preenchida com -1"""
+        matriz = np.full((num_grupos, largura), -1, dtype=np.int64)
+        if len(valores):
+            inicios = np.searchsorted(grupos, grupos, side="left")
+            matriz[grupos, np.arange(len(valores)) - inicios] = valores
+        return matriz
+
+    @staticmethod
+    def _desvio(observado: np.ndarray, tentativas: np.ndarray, probabilidade) -> Tuple[np.ndarray, np.ndarray]:
+        """Desvio (raiz com sinal da razão de verossimilhança da binomial) e contagem esperada"""
+        observado = observado.astype(np.float64)
+        tentativas = tentativas.astype(np.float64)
+        esperado = np.maximum(tentativas * probabilidade, 1e-12)
+        restante = tentativas - observado
+        with np.errstate(divide="ignore", invalid="ignore"):
+            g = 2 * (
+                np.where(observado > 0, observado * np.log(observado / esperado), 0.0)
+                + np.where(restante > 0, restante * np.log(restante / np.maximum(tentativas - esperado, 1e-12)), 0.0)
+            )
+        return np.sign(observado - esperado) * np.sqrt(np.maximum(g, 0.0)), tentativas * probabilidade
+
+    @classmethod
+    def _limiar(cls, testes: int) -> float:
+        """Desvio mínimo para `testes` comparações: aproximação da cauda normal com P(Z > z) = ALFA / testes"""
+        return math.sqrt(2 * math.log(max(testes, 1) / cls.ALFA))
+
+    @staticmethod
+    def _componentes(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Rótulo do componente conexo de cada vértice (o menor índice do componente)"""
+        rotulos = np.arange(n)
+        while True:
+            anteriores = rotulos.copy()
+            np.minimum.at(rotulos, a, rotulos[b])
+            np.minimum.at(rotulos, b, rotulos[a])
+            rotulos = rotulos[rotulos]
+            if np.array_equal(rotulos, anteriores):
+                return rotulos
+
+    def analisar(self, limite: Optional[int] = 50) -> Dict:
+        """Executa a análise e retorna pares, grupos, jogadores atípicos e a lista de revisão ordenada"""
+        tempos = {}
+        inicio = time.perf_counter()
+        v = self._extrair()
+        n = len(self.jogadores)
+        tempos["extracao"] = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+
+        assentos, tamanhos = v["assentos"], v["tamanhos"]
+        num_partidas = len(tamanhos)
+        total_assentos = len(assentos)
+        # Mesas em uma matriz (partidas x maior mesa) preenchida com -1
+        partida_assento = np.repeat(np.arange(num_partidas), tamanhos)
+        largura = int(tamanhos.max()) if num_partidas else 0
+        mesas = self._agrupar(assentos, partida_assento, num_partidas, largura)
+
+        # Matrizes esparsas: mesas divididas (triangular superior), eliminações (dirigida) e empates juntos
+        i, j, origem = self._pares_mesas(mesas)
+        chaves_mesas, juntos = self._esparsa(i * n + j)
+        # Último torneio em que cada par dividiu mesa: máximo por chave, com as chaves agrupadas pela ordenação
+        ordem = np.lexsort((v["torneio_partida"][origem], i * n + j))
+        ultimo_torneio = np.zeros(len(chaves_mesas), dtype=np.int64)
+        if len(ordem):
+            fins = np.cumsum(juntos) - 1
+            ultimo_torneio = v["torneio_partida"][origem][ordem][fins]
+        chaves_eliminacoes, eliminacoes = self._esparsa(v["causadores"] * n + v["eliminados"])
+        ei, ej, _ = self._pares_mesas(self._agrupar(v["empates_jogador"], v["empates_partida"], num_partidas, largura))
+        chaves_empates, empates = self._esparsa(ei * n + ej)
+
+        # Estatísticas por par (a < b) que dividiu mesa
+        a, b = chaves_mesas // n, chaves_mesas % n
+        elim_ab = self._consultar(chaves_eliminacoes, eliminacoes, a * n + b)
+        elim_ba = self._consultar(chaves_eliminacoes, eliminacoes, b * n + a)
+        empates_par = self._consultar(chaves_empates, empates, chaves_mesas)
+        partidas_jogador = np.bincount(assentos, minlength=n)
+        pares_ordenados = int((tamanhos * (tamanhos - 1)).sum())
+        taxa_eliminacao = len(v["causadores"]) / pares_ordenados if pares_ordenados else 0.0
+        taxa_empate = 2 * len(ei) / pares_ordenados if pares_ordenados else 0.0
+        menos = np.minimum(partidas_jogador[a], partidas_jogador[b])
+        mais = np.maximum(partidas_jogador[a], partidas_jogador[b])
+        chance_mesa = np.minimum(1.0, (total_assentos / max(num_partidas, 1) - 1) * mais / max(total_assentos, 1))
+        estatisticas = {
+            "mesas_juntos": (juntos, menos, chance_mesa),
+            "eliminacoes_ab": (elim_ab, juntos, taxa_eliminacao),
+            "eliminacoes_ba": (elim_ba, juntos, taxa_eliminacao),
+            "eliminacoes_par": (elim_ab + elim_ba, 2 * juntos, taxa_eliminacao),
+            "empates": (empates_par, juntos, taxa_empate),
+        }
+        desvios, esperados = {}, {}
+        for nome, (observado, tentativas, probabilidade) in estatisticas.items():
+            desvio, esperado = self._desvio(observado, tentativas, probabilidade)
+            desvios[nome] = np.where(observado >= self.MIN_OCORRENCIAS, desvio, 0.0)
+            esperados[nome] = esperado
+        matriz_desvios = np.vstack(list(desvios.values())) if len(chaves_mesas) else np.zeros((len(estatisticas), 0))
+        escore = matriz_desvios.max(axis=0) if len(chaves_mesas) else np.zeros(0)
+        principal = matriz_desvios.argmax(axis=0) if len(chaves_mesas) else np.zeros(0, dtype=np.int64)
+        total_elim = elim_ab + elim_ba
+        reciprocidade = np.where(total_elim > 0, 2 * np.minimum(elim_ab, elim_ba) / np.maximum(total_elim, 1), 0.0)
+        limiar = self._limiar(len(chaves_mesas) * len(estatisticas))
+        suspeitos = np.flatnonzero(escore >= limiar)
+
+        # Grupos: componentes conexos do grafo dos pares suspeitos
+        rotulos = self._componentes(n, a[suspeitos], b[suspeitos])
+        envolvidos = np.unique(np.concatenate([a[suspeitos], b[suspeitos]]))
+        grupos_rotulos, tamanhos_grupos = np.unique(rotulos[envolvidos], return_counts=True)
+        numero_grupo = {int(r): g for g, r in enumerate(grupos_rotulos[np.argsort(-tamanhos_grupos, kind="stable")], 1)}
+
+        # Jogadores atípicos: concentração das eliminações (linhas e colunas da matriz dirigida) e taxa de empates.
+        # Sem preferência, cada eliminação recairia sobre qualquer um dos oponentes distintos já enfrentados
+        oponentes = np.bincount(a, minlength=n) + np.bincount(b, minlength=n)
+        limiar_atipico = self._limiar(int(oponentes.sum()) + n)
+        atipicos = []
+        for nome, chaves in (("causadas", chaves_eliminacoes), ("sofridas", (chaves_eliminacoes % n) * n + chaves_eliminacoes // n)):
+            ordem = np.argsort(chaves, kind="stable")
+            linhas, valores, alvos = chaves[ordem] // n, eliminacoes[ordem], chaves[ordem] % n
+            if not len(linhas):
+                continue
+            inicios = np.flatnonzero(np.r_[True, linhas[1:] != linhas[:-1]])
+            jogadores = linhas[inicios]
+            totais = np.add.reduceat(valores, inicios)
+            maximos = np.maximum.reduceat(valores, inicios)
+            # Alvo da maior contagem de cada jogador: primeira posição do grupo com o máximo
+            posicao_maximo = np.flatnonzero(valores == np.repeat(maximos, np.diff(np.r_[inicios, len(valores)])))
+            grupo_posicao = np.searchsorted(inicios, posicao_maximo, side="right") - 1
+            primeiro = np.unique(grupo_posicao, return_index=True)[1]
+            alvo = alvos[posicao_maximo[primeiro]]
+            z, _ = self._desvio(maximos, totais, 1 / np.maximum(oponentes[jogadores], 1))
+            for k in np.flatnonzero((z > limiar_atipico) & (totais >= self.MIN_ELIMINACOES) & (maximos >= self.MIN_OCORRENCIAS)):
+                atipicos.append({
+                    "estatistica": f"concentracao_{nome}", "jogador": int(jogadores[k]), "alvo": int(alvo[k]),
+                    "valor": float(maximos[k] / totais[k]), "total": int(totais[k]), "escore": float(z[k])
+                })
+        empates_jogador = np.bincount(v["empates_jogador"], minlength=n)
+        z, _ = self._desvio(empates_jogador, partidas_jogador, len(v["empates_jogador"]) / max(total_assentos, 1))
+        for k in np.flatnonzero((z > limiar_atipico) & (empates_jogador >= self.MIN_OCORRENCIAS)):
+            atipicos.append({
+                "estatistica": "taxa_empates", "jogador": int(k), "alvo": None,
+                "valor": float(empates_jogador[k] / partidas_jogador[k]), "total": int(partidas_jogador[k]), "escore": float(z[k])
+            })
+        self.matrizes = {
+            "mesas": (chaves_mesas, juntos), "eliminacoes": (chaves_eliminacoes, eliminacoes), "empates": (chaves_empates, empates)
+        }
+        tempos["analise"] = time.perf_counter() - inicio
+
+        nomes_estatisticas = list(estatisticas)
+        pares = []
+        for k in suspeitos[np.argsort(-escore[suspeitos], kind="stable")]:
+            motivos = {
+                nome: {"observado": int(estatisticas[nome][0][k]), "esperado": float(esperados[nome][k]), "desvio": float(desvios[nome][k])}
+                for nome in nomes_estatisticas if desvios[nome][k] >= limiar
+            }
+            pares.append({
+                "jogadores": (int(a[k]), int(b[k])), "mesas": int(juntos[k]), "eliminacoes": (int(elim_ab[k]), int(elim_ba[k])),
+                "empates": int(empates_par[k]), "reciprocidade": float(reciprocidade[k]), "escore": float(escore[k]),
+                "principal": nomes_estatisticas[principal[k]], "motivos": motivos,
+                "torneio": int(ultimo_torneio[k]), "grupo": numero_grupo[int(rotulos[a[k]])]
+            })
+        grupos = {}
+        for jogador in envolvidos:
+            grupos.setdefault(numero_grupo[int(rotulos[jogador])], []).append(int(jogador))
+        revisao = self._revisao(pares, atipicos, limiar, limiar_atipico, limite)
+        return {
+            "jogadores": n, "partidas": num_partidas, "eliminacoes": len(v["causadores"]), "pares": len(chaves_mesas),
+            "limiar": limiar, "limiar_atipico": limiar_atipico, "pares_suspeitos": pares, "grupos": grupos, "atipicos": atipicos, "revisao": revisao, "tempos": tempos
+        }
+
+    def _revisao(self, pares: List[dict], atipicos: List[dict], limiar: float, limiar_atipico: float, limite: Optional[int]) -> List[dict]:
+        """Lista de revisão ordenada pela prioridade (quantas vezes o escore excede o limiar de cada critério)"""
+        jogadores = self.jogadores
+        itens = []
+        for par in pares:
+            a, b = (jogadores[x] for x in par["jogadores"])
+            ab, ba = par["eliminacoes"]
+            # O jogador indicado é o que mais eliminou o outro (o beneficiado), ou o primeiro do par
+            denunciado, outro = (b, a) if ba > ab else (a, b)
+            motivos = []
+            for nome, m in par["motivos"].items():
+                if nome == "mesas_juntos":
+                    motivos.append(f"dividiram {m['observado']} mesa(s) (esperado {m['esperado']:.2f})")
+                elif nome == "eliminacoes_ab":
+                    motivos.append(f"{a.nome} eliminou {b.nome} {m['observado']} vez(es) (esperado {m['esperado']:.2f})")
+                elif nome == "eliminacoes_ba":
+                    motivos.append(f"{b.nome} eliminou {a.nome} {m['observado']} vez(es) (esperado {m['esperado']:.2f})")
+                elif nome == "eliminacoes_par":
+                    motivos.append(f"{m['observado']} eliminações entre os dois (esperado {m['esperado']:.2f}, reciprocidade {par['reciprocidade']:.2f})")
+                else:
+                    motivos.append(f"empataram juntos {m['observado']} vez(es) (esperado {m['esperado']:.2f})")
+            itens.append({
+                "prioridade": par["escore"] / limiar, "tipo": "par", "grupo": par["grupo"],
+                "jogador_id": denunciado.id, "email": denunciado.email, "nome": denunciado.nome, "relacionado": outro.nome,
+                "torneio_id": self.torneios[par["torneio"]].id, "torneio": self.torneios[par["torneio"]].nome,
+                "descricao": f"Conluio com {outro.nome} em {par['mesas']} mesa(s): " + "; ".join(motivos) + "."
+            })
+        for atipico in atipicos:
+            jogador = jogadores[atipico["jogador"]]
+            if atipico["estatistica"] == "taxa_empates":
+                descricao = f"Taxa de empates atípica: {atipico['valor']:.0%} de {atipico['total']} partida(s)."
+                relacionado = ""
+            else:
+                alvo = jogadores[atipico["alvo"]]
+                relacionado = alvo.nome
+                if atipico["estatistica"] == "concentracao_causadas":
+                    descricao = f"{atipico['valor']:.0%} de {atipico['total']} eliminações causadas foram sobre {alvo.nome}."
+                else:
+                    descricao = f"{atipico['valor']:.0%} de {atipico['total']} eliminações sofridas foram causadas por {alvo.nome}."
+            torneio = next((t for t in reversed(self.torneios) if jogador in t.jogadores), self.torneios[-1])
+            itens.append({
+                "prioridade": atipico["escore"] / limiar_atipico, "tipo": "jogador", "grupo": None,
+                "jogador_id": jogador.id, "email": jogador.email, "nome": jogador.nome, "relacionado": relacionado,
+                "torneio_id": torneio.id, "torneio": torneio.nome, "descricao": descricao
+            })
+        itens.sort(key=lambda item: item["prioridade"], reverse=True)
+        return itens[:limite] if limite else itens
+
 class SistemaTorneioCommander:
-    def __init__(self):
+    def __init__(self, modo_persistencia: str = "journal"):
         self.gerenciador_torneio = GerenciadorTorneio()
         self.gerenciador_cadastros = GerenciadorCadastros()
-        self.partidas_ativas: List[Partida] = []
-        self.anti_colusao = SistemaAntiColusao()
+        # Torneio em que as opções do menu operam; None usa o último torneio criado
+        self.torneio_atual_id: Optional[str] = None
         self.erros = Utilitarios.mensagens_erro()
+        # "journal": acrescenta cada operação ao journal e compacta periodicamente
+        # "json": reescreve o snapshot completo após cada opção do menu
+        # "sqlite": grava cada operação em uma transação no banco dados_sistema.db
+        self.modo_persistencia = modo_persistencia
+        self.seq_journal = 0
+        self.operacoes_desde_snapshot = 0
+        self.banco = PersistenciaSQLite() if modo_persistencia == "sqlite" else None
+        self.trava_persistencia = threading.Lock()
+
+    def _registrar_operacao(self, tipo: str, dados: dict):
+        """Registra uma operação já aplicada ao estado em memória"""
+        self._registrar_operacoes([(tipo, dados)])
+
+    def _registrar_operacoes(self, operacoes: List[Tuple[str, dict]]):
+        """Registra de uma só vez um lote de operações já aplicadas ao estado em memória"""
+        if not operacoes:
+            return
+        # Lotes de threads diferentes são gravados um de cada vez, na ordem de chegada
+        with self.trava_persistencia:
+            if self.modo_persistencia == "journal":
+                Persistencia.registrar_operacoes(self, operacoes)
+            elif self.modo_persistencia == "sqlite":
+                self.banco.registrar_operacoes(self, operacoes)
+
+    @staticmethod
+    def _dados_resultado(partida: Partida) -> dict:
+        """Dados da operação "resultado" de uma partida concluída
+
+        Além dos agregados dos jogadores, o registro traz a partida completa
+        (eliminações, resultados informados e pontuações), para que a
+        reaplicação reconstrua o histórico de partidas e os logs de colusão.
+        """
+        return {
+            "partida_id": partida.id,
+            "torneio_id": partida.torneio_id,
+            "rodada": partida.rodada,
+            "eliminacoes": [Persistencia._serializar_eliminacao(e) for e in partida.eliminacoes],
+            "resultados": partida.resultados,
+            "pontuacoes": partida.pontuacoes,
+            "jogadores": [
+                {
+                    "id": j.id,
+                    "indice_desempenho": j.indice_desempenho,
+                    "vitorias_isoladas": j.vitorias_isoladas,
+                    "soma_ids_oponentes": j.soma_ids_oponentes,
+                    "num_oponentes": j.num_oponentes
+                }
+                for j in partida.jogadores
+            ]
+        }
+
+    def _carregar_estado(self) -> bool:
+        """Carrega o estado salvo conforme o modo de persistência configurado"""
+        if self.modo_persistencia != "sqlite":
+            return Persistencia.carregar_estado(self)
+        if self.banco.vazio() and os.path.exists('dados_sistema.json'):
+            self.banco.migrar_json('dados_sistema.json')
+        return self.banco.carregar_estado(self)
+
+    def _persistir_apos_operacao(self):
+        """Persiste o estado ao final de uma opção do menu conforme o modo configurado"""
+        if self.modo_persistencia == "json":
+            Persistencia.salvar_estado(self)
+        elif self.modo_persistencia == "journal" and self.operacoes_desde_snapshot >= Persistencia.LIMITE_COMPACTACAO:
+            Persistencia.compactar(self)
 
     def exibir_menu(self):
         print("\n=== Sistema de Gerenciamento de Torneios Commander ===")
@@ -844,13 +4290,52 @@ class SistemaTorneioCommander:
         print("11. Registrar Eliminação/Desistência Parcial")
         print("12. Registrar Denúncia de Colusão")
         print("13. Aplicar Penalidade")
-        print("14. Sair")
-        return input("Escolha uma opção (1-14): ") 
+        print("14. Selecionar Torneio")
+        print("15. Sair")
+        if self.gerenciador_torneio.torneios:
+            print(f"Torneio selecionado: {self._validar_torneio_existe().nome}")
+        return input("Escolha uma opção (1-15): ") 
 
-    def _validar_torneio_existe(self) -> Torneio:
+    def _validar_torneio_existe(self, torneio_id: Optional[str] = None) -> Torneio:
+        """Retorna o torneio indicado pelo id, o torneio selecionado ou, sem seleção, o último criado"""
         if not self.gerenciador_torneio.torneios:
             raise ValueError(self.erros["torneio_nao_existe"])
-        return self.gerenciador_torneio.torneios[-1]
+        torneio_id = torneio_id or self.torneio_atual_id
+        if torneio_id is None:
+            return self.gerenciador_torneio.torneios[-1]
+        torneio = self.gerenciador_torneio.buscar_torneio_por_id(torneio_id)
+        if not torneio:
+            raise ValueError(f"Torneio {torneio_id} não encontrado.")
+        return torneio
+
+    def _localizar_torneio(self, referencia: Optional[str]) -> Torneio:
+        """Localiza um torneio pelo id ou pelo nome; sem referência, usa o torneio selecionado"""
+        if not referencia:
+            return self._validar_torneio_existe()
+        torneio = self.gerenciador_torneio.buscar_torneio_por_id(referencia) or self.gerenciador_torneio.buscar_torneio(referencia)
+        if not torneio:
+            raise ValueError(f"Torneio {referencia} não encontrado.")
+        return torneio
+
+    def selecionar_torneio(self):
+        try:
+            torneios = self.gerenciador_torneio.torneios
+            if not torneios:
+                raise ValueError(self.erros["torneio_nao_existe"])
+            atual = self._validar_torneio_existe()
+            print("Torneios:")
+            for i, torneio in enumerate(torneios, 1):
+                if torneio.inscricoes_abertas:
+                    status = "Inscrições Abertas"
+                else:
+                    status = f"Rodada {torneio.rodada_atual}/{torneio.rodadas}, {len(torneio.partidas_ativas)} partida(s) ativa(s)"
+                marcador = " (selecionado)" if torneio is atual else ""
+                print(f"{i}. {torneio.nome} - {status}{marcador}")
+            idx = Utilitarios.validar_indice_numerico(input("Selecione o torneio (número): ").strip(), 1, len(torneios))
+            self.torneio_atual_id = torneios[idx - 1].id
+            print(Fore.GREEN + f"Torneio {torneios[idx - 1].nome} selecionado." + Style.RESET_ALL)
+        except ValueError as e:
+            print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
 
     def cadastrar_juiz(self):
         try:
@@ -862,15 +4347,18 @@ class SistemaTorneioCommander:
                 print(Fore.RED + "Email inválido. Por favor, forneça um email válido." + Style.RESET_ALL)
                 return
                 
-            juiz = self.gerenciador_cadastros.cadastrar_juiz(nome, email)
-            
             # Definir senha para o juiz
             senha = input("Senha para o juiz (mínimo 8 caracteres): ").strip()
             valido, mensagem = Validador.validar_senha(senha)
             if not valido:
                 print(Fore.RED + f"Erro: {mensagem}" + Style.RESET_ALL)
                 return
+
+            juiz = self.gerenciador_cadastros.cadastrar_juiz(nome, email)
+            if not juiz:
+                raise ValueError(self.erros["email_ja_cadastrado"])
             juiz.definir_senha(senha)
+            self._registrar_operacao("juiz", Persistencia._serializar_juiz(juiz))
             
             print(Fore.GREEN + f"Juiz {juiz.nome} cadastrado com sucesso!" + Style.RESET_ALL)
         except ValueError as e:
@@ -884,6 +4372,8 @@ class SistemaTorneioCommander:
                 raise ValueError("Mínimo de jogadores deve ser pelo menos 4.")
             min_jogadores = int(min_jogadores)
             torneio = self.gerenciador_torneio.configurar_torneio(nome, min_jogadores)
+            self.torneio_atual_id = torneio.id
+            self._registrar_operacao("torneio", Persistencia._serializar_torneio(torneio))
             print(Fore.GREEN + f"Torneio {torneio.nome} criado com sucesso! O número de rodadas será definido ao finalizar inscrições." + Style.RESET_ALL)
         except ValueError as e:
             print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
@@ -898,15 +4388,18 @@ class SistemaTorneioCommander:
                 print(Fore.RED + "Email inválido. Por favor, forneça um email válido." + Style.RESET_ALL)
                 return
                 
-            jogador = self.gerenciador_cadastros.cadastrar_jogador(nome, email)
-            
             # Definir senha para o jogador
             senha = input("Senha para o jogador (mínimo 8 caracteres): ").strip()
             valido, mensagem = Validador.validar_senha(senha)
             if not valido:
                 print(Fore.RED + f"Erro: {mensagem}" + Style.RESET_ALL)
                 return
+
+            jogador = self.gerenciador_cadastros.cadastrar_jogador(nome, email)
+            if not jogador:
+                raise ValueError(self.erros["email_ja_cadastrado"])
             jogador.definir_senha(senha)
+            self._registrar_operacao("jogador", Persistencia._serializar_jogador(jogador))
             
             print(Fore.GREEN + f"Jogador {jogador.nome} cadastrado com sucesso!" + Style.RESET_ALL)
         except ValueError as e:
@@ -915,7 +4408,7 @@ class SistemaTorneioCommander:
     def cadastrar_deck(self):
         try:
             email = input("Email do jogador: ").strip()
-            jogador = next((j for j in self.gerenciador_cadastros.jogadores if j.email == email), None)
+            jogador = self.gerenciador_cadastros.buscar_jogador(email)
             if not jogador:
                 raise ValueError(self.erros["jogador_nao_encontrado"])
                 
@@ -924,6 +4417,7 @@ class SistemaTorneioCommander:
                 raise ValueError("Nome do comandante não pode ser vazio.")
                 
             deck = self.gerenciador_cadastros.cadastrar_deck(jogador, comandante)
+            self._registrar_operacao("deck", Persistencia._serializar_deck(deck))
             print(Fore.GREEN + f"Deck com comandante {deck.comandante} cadastrado com sucesso!" + Style.RESET_ALL)
         except ValueError as e:
             print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL) 
@@ -942,7 +4436,7 @@ class SistemaTorneioCommander:
             torneio = torneios_abertos[torneio_idx - 1]
 
             email = input("Email do jogador: ").strip()
-            jogador = next((j for j in self.gerenciador_cadastros.jogadores if j.email == email), None)
+            jogador = self.gerenciador_cadastros.buscar_jogador(email)
             if not jogador:
                 raise ValueError(self.erros["jogador_nao_encontrado"])
                 
@@ -953,7 +4447,7 @@ class SistemaTorneioCommander:
                 raise ValueError(f"{jogador.nome} não possui decks cadastrados. Cadastre um deck (opção 4).")
                 
             # Filtrar apenas decks ativos e não associados a torneios
-            decks_disponiveis = [d for d in jogador.decks if d.ativo and d.torneio is None]
+            decks_disponiveis = self.gerenciador_cadastros.buscar_decks(jogador, "DISPONIVEL")
             if not decks_disponiveis:
                 raise ValueError(f"{jogador.nome} não possui decks disponíveis. Todos os decks já estão em uso em outros torneios.")
                 
@@ -965,7 +4459,8 @@ class SistemaTorneioCommander:
             deck = decks_disponiveis[deck_idx - 1]
 
             if self.gerenciador_cadastros.validar_deck(deck, torneio):
-                torneio.jogadores.append(jogador)
+                torneio.adicionar_jogador(jogador)
+                self._registrar_operacao("inscricao", {"torneio_id": torneio.id, "jogador_id": jogador.id, "deck_id": deck.id})
                 print(Fore.GREEN + f"{jogador.nome} inscrito no torneio {torneio.nome} com o deck {deck.comandante}!" + Style.RESET_ALL)
             else:
                 raise ValueError("Deck inválido ou já associado a outro torneio.")
@@ -991,6 +4486,7 @@ class SistemaTorneioCommander:
             num_rodadas = self.gerenciador_torneio.calcular_rodadas(len(torneio.jogadores))
             torneio.rodadas = num_rodadas
             torneio.inscricoes_abertas = False
+            self._registrar_operacao("torneio", Persistencia._serializar_torneio(torneio))
             
             num_mesas = len(torneio.jogadores) // 4 + (1 if len(torneio.jogadores) % 4 == 3 else 0)
             print(Fore.GREEN + f"Inscrições do torneio {torneio.nome} finalizadas com sucesso!" + Style.RESET_ALL)
@@ -1001,27 +4497,18 @@ class SistemaTorneioCommander:
     def iniciar_rodada(self):
         try:
             torneio = self._validar_torneio_existe()
-            if torneio.inscricoes_abertas:
-                raise ValueError(f"Inscrições do torneio {torneio.nome} ainda abertas. Finalize as inscrições primeiro (opção 6).")
-                
-            if not torneio.jogadores:
-                raise ValueError(f"Nenhum jogador inscrito no torneio {torneio.nome}. Inscreva jogadores e finalize as inscrições (opções 5 e 6).")
-                
-            if torneio.rodada_atual >= torneio.rodadas:
-                raise ValueError(f"Torneio {torneio.nome} já concluído.")
-            
-            torneio.rodada_atual += 1
-            mesas = self.gerenciador_torneio.emparelhamento.distribuir_jogadores(torneio)
-            if not mesas:
-                raise ValueError("Nenhuma mesa formada. Verifique o número de jogadores.")
-                
-            torneio.mesas = mesas
-            self.partidas_ativas = [Partida(mesa) for mesa in mesas if mesa]
-            
-            for partida in self.partidas_ativas:
-                self.gerenciador_torneio.tempo.iniciar_temporizador(partida, torneio.tempo_rodada)
+            partidas = self.gerenciador_torneio.iniciar_rodada(torneio)
+            mesas = torneio.mesas
+            self._registrar_operacao("rodada", {
+                "torneio_id": torneio.id,
+                "rodada_atual": torneio.rodada_atual,
+                "partidas": [Persistencia._serializar_partida(p) for p in partidas],
+                "historico_oponentes": Persistencia._serializar_historico(torneio.historico_oponentes)
+            })
             
             print(Fore.GREEN + f"Rodada {torneio.rodada_atual} do torneio {torneio.nome} iniciada com {len(mesas)} mesas:" + Style.RESET_ALL)
+            resultado = self.gerenciador_torneio.emparelhamento.ultimo_resultado
+            print(f"Custo do emparelhamento: {resultado['custo']:.4f} (oponentes repetidos: {resultado['repeticoes']}, mesas fora da tolerância de desvio: {resultado['mesas_fora_tolerancia']})")
             for i, mesa in enumerate(mesas, 1):
                 nomes = [j.nome for j in mesa]
                 print(f"Mesa {i}: {', '.join(nomes)}")
@@ -1031,16 +4518,16 @@ class SistemaTorneioCommander:
     def registrar_eliminacao_parcial(self):
         try:
             torneio = self._validar_torneio_existe()
-            if not self.partidas_ativas:
+            if not torneio.partidas_ativas:
                 raise ValueError(f"{self.erros['sem_partidas_ativas']} no torneio {torneio.nome}.")
             
-            print("Partidas ativas:")
-            for i, partida in enumerate(self.partidas_ativas, 1):
+            print(f"Partidas ativas do torneio {torneio.nome}:")
+            for i, partida in enumerate(torneio.partidas_ativas, 1):
                 nomes = [j.nome for j in partida.jogadores]
                 print(f"{i}. Mesa com {', '.join(nomes)}")
             
-            idx = Utilitarios.validar_indice_numerico(input("Selecione a partida (número): ").strip(), 1, len(self.partidas_ativas))
-            partida = self.partidas_ativas[idx - 1]
+            idx = Utilitarios.validar_indice_numerico(input("Selecione a partida (número): ").strip(), 1, len(torneio.partidas_ativas))
+            partida = torneio.partidas_ativas[idx - 1]
             
             print("Jogadores na partida:")
             for i, jogador in enumerate(partida.jogadores, 1):
@@ -1089,16 +4576,10 @@ class SistemaTorneioCommander:
                 print(Fore.YELLOW + f"Aviso: Vida final de {vida_final} é muito alta. Verifique se está correto." + Style.RESET_ALL)
             
             jogador_causador = partida.jogadores[causador_idx] if causador_idx is not None else None
-            eliminacao = Eliminacao(jogador_eliminado, jogador_causador, turno, desistiu)
-            partida.eliminacoes.append(eliminacao)
+            eliminacao = self.gerenciador_torneio.registrar_eliminacao(torneio, partida, jogador_eliminado, jogador_causador, turno, desistiu)
+            self._registrar_operacao("eliminacao", {"partida_id": partida.id, **Persistencia._serializar_eliminacao(eliminacao)})
             
-            rp = CalculadorIndiceDesempenho.calcular_rp("DERROTA")
-            tv = CalculadorIndiceDesempenho.calcular_tv("DERROTA", turno)
-            er = 0
-            pv = CalculadorIndiceDesempenho.calcular_pv("DERROTA", vida_final)
-            pa = 0
-            mesa_tres = len(partida.jogadores) == 3
-            id_parcial = CalculadorIndiceDesempenho.calcular_id(rp, tv, er, pv, pa, mesa_tres)
+            id_parcial, _ = CalculadorIndiceDesempenho.consultar_pontuacao("DERROTA", turno, 0, vida_final, 0, len(partida.jogadores))
             
             print(Fore.GREEN + f"{jogador_eliminado.nome} {'desistiu' if desistiu else 'eliminado por ' + (jogador_causador.nome if jogador_causador else 'auto-eliminação')} no turno {turno}." + Style.RESET_ALL)
             print(f"Pontuação parcial: {id_parcial:.2f}%")
@@ -1108,18 +4589,18 @@ class SistemaTorneioCommander:
     def registrar_resultados_partida(self):
         try:
             torneio = self._validar_torneio_existe()
-            if not self.partidas_ativas:
+            if not torneio.partidas_ativas:
                 raise ValueError(f"{self.erros['sem_partidas_ativas']} no torneio {torneio.nome}.")
             
-            print("Partidas ativas:")
-            for i, partida in enumerate(self.partidas_ativas, 1):
+            print(f"Partidas ativas do torneio {torneio.nome}:")
+            for i, partida in enumerate(torneio.partidas_ativas, 1):
                 nomes = [j.nome for j in partida.jogadores]
                 print(f"{i}. Mesa com {', '.join(nomes)}")
             
-            idx = Utilitarios.validar_indice_numerico(input("Selecione a partida (número): ").strip(), 1, len(self.partidas_ativas))
-            partida = self.partidas_ativas[idx - 1]
+            idx = Utilitarios.validar_indice_numerico(input("Selecione a partida (número): ").strip(), 1, len(torneio.partidas_ativas))
+            partida = torneio.partidas_ativas[idx - 1]
             
-            if self.gerenciador_torneio.tempo.verificar_tempo(partida, torneio):
+            if torneio.tempo.verificar_tempo(partida, torneio):
                 print(Fore.YELLOW + "Tempo da rodada esgotado. Forçando empate para jogadores ativos." + Style.RESET_ALL)
                 resultados = {}
                 jogadores_ativos = [j for j in partida.jogadores if j not in [e.jogador_eliminado for e in partida.eliminacoes]]
@@ -1222,7 +4703,7 @@ class SistemaTorneioCommander:
                 if "VITORIA" in resultados_por_tipo and "EMPATE" in resultados_por_tipo:
                     raise ValueError("Não pode haver VITORIA e EMPATE na mesma mesa.")
             
-            self.gerenciador_torneio.processar_resultados(partida, resultados, self.anti_colusao)
+            self.gerenciador_torneio.registrar_resultados_mesa(torneio, partida, resultados)
             
             # Gerar ranking da partida
             print(Fore.GREEN + "\n=== Ranking da Partida ===" + Style.RESET_ALL)
@@ -1231,7 +4712,7 @@ class SistemaTorneioCommander:
                 jogadores_com_pontuacao,
                 key=lambda x: (
                     x[1],  # Índice de Desempenho da partida
-                    self.gerenciador_torneio.desempate.calcular_forca_oponentes(x[0], self.partidas_ativas),
+                    self.gerenciador_torneio.desempate.calcular_forca_oponentes(x[0]),
                     x[0].vitorias_isoladas
                 ),
                 reverse=True
@@ -1240,13 +4721,14 @@ class SistemaTorneioCommander:
                 resultado = resultados[jogador.id]["resultado"]
                 print(f"{i}. {jogador.nome}: {id_partida:.2f} pontos ({resultado})")
             
-            self.partidas_ativas.pop(idx - 1)
+            self._registrar_operacao("resultado", self._dados_resultado(partida))
             print(Fore.GREEN + "Resultados registrados com sucesso!" + Style.RESET_ALL)
         except ValueError as e:
             print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
 
     def registrar_denuncia(self):
         try:
+            torneio = self._validar_torneio_existe()
             email = input("Email do jogador denunciado: ").strip()
             
             # Validação de email
@@ -1254,7 +4736,7 @@ class SistemaTorneioCommander:
                 print(Fore.RED + "Email inválido. Por favor, forneça um email válido." + Style.RESET_ALL)
                 return
                 
-            jogador = next((j for j in self.gerenciador_cadastros.jogadores if j.email == email), None)
+            jogador = self.gerenciador_cadastros.buscar_jogador(email)
             if not jogador:
                 raise ValueError(self.erros["jogador_nao_encontrado"])
                 
@@ -1262,7 +4744,13 @@ class SistemaTorneioCommander:
             if not descricao:
                 raise ValueError("A descrição da denúncia não pode ser vazia.")
                 
-            self.anti_colusao.registrar_denuncia(jogador, descricao)
+            denuncia = torneio.anti_colusao.registrar_denuncia(jogador, descricao)
+            self._registrar_operacao("denuncia", {
+                "torneio_id": torneio.id,
+                "jogador_id": jogador.id,
+                "descricao": descricao,
+                "data": denuncia["data"].isoformat()
+            })
             print(Fore.GREEN + "Denúncia registrada com sucesso." + Style.RESET_ALL)
         except ValueError as e:
             print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
@@ -1275,7 +4763,7 @@ class SistemaTorneioCommander:
             email_juiz = input("Email do juiz: ").strip()
             senha_juiz = input("Senha do juiz: ").strip()
             
-            juiz = next((j for j in self.gerenciador_cadastros.juizes if j.email == email_juiz), None)
+            juiz = self.gerenciador_cadastros.buscar_juiz(email_juiz)
             if not juiz:
                 raise ValueError("Juiz não encontrado.")
                 
@@ -1289,7 +4777,7 @@ class SistemaTorneioCommander:
                 print(Fore.RED + "Email inválido. Por favor, forneça um email válido." + Style.RESET_ALL)
                 return
                 
-            jogador = next((j for j in self.gerenciador_cadastros.jogadores if j.email == email), None)
+            jogador = self.gerenciador_cadastros.buscar_jogador(email)
             if not jogador:
                 raise ValueError(self.erros["jogador_nao_encontrado"])
             
@@ -1301,150 +4789,169 @@ class SistemaTorneioCommander:
             tipo_idx = Utilitarios.validar_indice_numerico(input("Selecione o tipo (1-3): ").strip(), 1, 3)
             tipo = ["ADVERTENCIA", "REDUCAO_ID", "DESCLASSIFICACAO"][tipo_idx - 1]
             
-            self.anti_colusao.aplicar_penalidade(jogador, tipo, torneio)
+            with self.gerenciador_torneio.travar_jogadores([jogador]):
+                torneio.anti_colusao.aplicar_penalidade(jogador, tipo, torneio)
+            self._registrar_operacao("penalidade", {
+                "jogador_id": jogador.id,
+                "torneio_id": torneio.id,
+                "tipo": tipo,
+                "data": jogador.penalidades[-1]["data"].isoformat(),
+                "indice_desempenho": jogador.indice_desempenho
+            })
             print(Fore.GREEN + "Penalidade aplicada com sucesso." + Style.RESET_ALL)
         except ValueError as e:
             print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL) 
 
+    def importar_cadastros(self, caminho: str, torneio_padrao: Optional[str] = None) -> Optional[Dict]:
+        """Importa jogadores, decks e inscrições em lote e persiste o estado uma única vez"""
+        try:
+            relatorio = ImportadorLote(self).importar(caminho, torneio_padrao)
+        except (ValueError, OSError) as e:
+            print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
+            # Linhas aplicadas antes de uma falha de leitura no meio do arquivo também são persistidas
+            self._persistir_apos_operacao()
+            return None
+        self._persistir_apos_operacao()
+        print(Fore.GREEN + f"Importação concluída: {relatorio['linhas']} linha(s) processada(s)." + Style.RESET_ALL)
+        print(f"  Jogadores criados: {relatorio['jogadores_criados']} (já cadastrados: {relatorio['jogadores_existentes']})")
+        print(f"  Decks criados: {relatorio['decks_criados']}")
+        print(f"  Inscrições: {relatorio['inscricoes']}")
+        if relatorio["erros"]:
+            print(Fore.RED + f"  {len(relatorio['erros'])} linha(s) com erro:" + Style.RESET_ALL)
+            for erro in relatorio["erros"]:
+                print(f"    Linha {erro['linha']} ({erro['email'] or 'sem email'}): {erro['erro']}")
+        return relatorio
+
+    def registrar_resultados_lote(self, caminho: str, torneio: Optional[str] = None) -> Optional[Dict]:
+        """Registra os resultados de uma rodada de um torneio (id ou nome) a partir de um arquivo e persiste o estado uma única vez"""
+        try:
+            relatorio = RegistroResultadosLote(self, self._localizar_torneio(torneio)).registrar(caminho)
+        except (ValueError, OSError) as e:
+            print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
+            return None
+        self._persistir_apos_operacao()
+        print(Fore.GREEN + f"Resultados registrados no torneio {relatorio['torneio']}: {relatorio['mesas']} mesa(s), {relatorio['jogadores']} jogador(es)." + Style.RESET_ALL)
+        print(f"  Partidas ainda ativas: {relatorio['pendentes']}")
+        if relatorio["suspeitas"]:
+            print(Fore.YELLOW + f"  {len(relatorio['suspeitas'])} padrão(ões) suspeito(s) registrado(s)." + Style.RESET_ALL)
+        return relatorio
+
+    def analisar_colusao(self, torneio: Optional[str] = None, limite: int = 20, saida: Optional[str] = None) -> Optional[Dict]:
+        """Analisa as eliminações e mesas da temporada (ou de um torneio) e imprime a lista de revisão para os juízes"""
+        try:
+            torneios = [self._localizar_torneio(torneio)] if torneio else list(self.gerenciador_torneio.torneios)
+            if not torneios:
+                raise ValueError(self.erros["torneio_nao_existe"])
+            relatorio = AnaliseGrafoColusao(torneios, self.gerenciador_torneio.historico).analisar(limite)
+        except ValueError as e:
+            print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
+            return None
+        tempos = relatorio["tempos"]
+        print(Fore.GREEN + f"Análise de colusão: {relatorio['partidas']} partida(s), {relatorio['eliminacoes']} eliminação(ões), "
+              f"{relatorio['jogadores']} jogador(es) e {relatorio['pares']} par(es) em {len(torneios)} torneio(s)." + Style.RESET_ALL)
+        print(f"  Leitura: {tempos['extracao']:.2f} s; análise: {tempos['analise']:.2f} s; limiar dos pares: {relatorio['limiar']:.2f}")
+        print(f"  Pares suspeitos: {len(relatorio['pares_suspeitos'])} em {len(relatorio['grupos'])} grupo(s); jogadores atípicos: {len(relatorio['atipicos'])}")
+        if not relatorio["revisao"]:
+            print("  Nenhum padrão suspeito encontrado.")
+        for posicao, item in enumerate(relatorio["revisao"], 1):
+            grupo = f", grupo {item['grupo']}" if item["grupo"] else ""
+            print(Fore.YELLOW + f"  {posicao}. {item['nome']} ({item['email']}) - torneio {item['torneio']}{grupo}, prioridade {item['prioridade']:.1f}" + Style.RESET_ALL)
+            print(f"     {item['descricao']}")
+        if relatorio["revisao"]:
+            print("  Para registrar uma denúncia, selecione o torneio (opção 14) e use a opção 12 com o email e a descrição indicados.")
+        if saida:
+            with open(saida, 'w', encoding='utf-8', newline='') as f:
+                campos = ["prioridade", "tipo", "grupo", "nome", "email", "jogador_id", "relacionado", "torneio", "torneio_id", "descricao"]
+                escritor = csv.DictWriter(f, fieldnames=campos, extrasaction="ignore")
+                escritor.writeheader()
+                for item in relatorio["revisao"]:
+                    escritor.writerow(dict(item, prioridade=f"{item['prioridade']:.2f}"))
+            print(Fore.GREEN + f"Lista de revisão gravada em {saida}." + Style.RESET_ALL)
+        return relatorio
+
+    def exportar_historico(self, saida: Optional[str] = None) -> Optional[Dict]:
+        """Resume o histórico colunar da temporada e, opcionalmente, grava as colunas em um arquivo .npz"""
+        historico = self.gerenciador_torneio.historico
+        resumo = {
+            "partidas": len(historico),
+            "participacoes": len(historico.participacoes),
+            "eliminacoes": len(historico.eliminacoes),
+            "jogadores": len(historico.jogadores),
+            "torneios": len(historico.ids_torneios)
+        }
+        print(Fore.GREEN + f"Histórico colunar: {resumo['partidas']} partida(s), {resumo['participacoes']} participação(ões) e "
+              f"{resumo['eliminacoes']} eliminação(ões) de {resumo['jogadores']} jogador(es) em {resumo['torneios']} torneio(s)." + Style.RESET_ALL)
+        if saida:
+            try:
+                historico.exportar(saida)
+            except OSError as e:
+                print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
+                return None
+            print(Fore.GREEN + f"Colunas gravadas em {saida} (leia com numpy.load)." + Style.RESET_ALL)
+        return resumo
+
     def gerar_ranking(self):
         try:
             torneio = self._validar_torneio_existe()
             if not torneio.jogadores:
                 raise ValueError(f"Nenhum jogador inscrito no torneio {torneio.nome}. Inscreva jogadores primeiro (opção 5).")
             
-            ranking = sorted(
-                torneio.jogadores, 
-                key=lambda x: (
-                    x.indice_desempenho, 
-                    self.gerenciador_torneio.desempate.calcular_forca_oponentes(x, self.partidas_ativas), 
-                    x.vitorias_isoladas
-                ), 
-                reverse=True
-            )
+            ranking = torneio.classificacao.top(len(torneio.classificacao))
             
             print(Fore.GREEN + f"\n=== Ranking do Torneio {torneio.nome} ===" + Style.RESET_ALL)
             if not ranking:
                 print("Nenhum jogador com pontuação registrada.")
             else:
                 for i, jogador in enumerate(ranking, 1):
-                    forca_oponentes = self.gerenciador_torneio.desempate.calcular_forca_oponentes(jogador, self.partidas_ativas)
+                    forca_oponentes = self.gerenciador_torneio.desempate.calcular_forca_oponentes(jogador)
                     winrate = (jogador.vitorias_isoladas / len(jogador.historico_partidas)) * 100 if jogador.historico_partidas else 0
                     print(f"{i}. {jogador.nome}: {jogador.indice_desempenho:.2f} pontos | Vitórias: {jogador.vitorias_isoladas} | Winrate: {winrate:.2f}% | Força dos Oponentes: {forca_oponentes:.2f}")
         except ValueError as e:
             print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
 
+    def escrever_relatorio(self, filtro_torneio: str = "", filtro_status: str = "TODOS", formato: str = "texto",
+                           saida: Optional[str] = None, tamanho_pagina: Optional[int] = None, pausar: bool = False) -> Optional[int]:
+        """Gera o relatório em fluxo na tela ou em um arquivo e retorna o número de páginas escritas"""
+        try:
+            gerador = GeradorRelatorio(self, filtro_torneio, filtro_status, cores=saida is None and formato == "texto")
+            anteriores = self.gerenciador_torneio.visoes.contadores()
+            if saida:
+                paginas = gerador.exportar(saida, formato, 100 if tamanho_pagina is None else tamanho_pagina)
+                print(Fore.GREEN + f"Relatório ({formato}) gravado em {saida}." + Style.RESET_ALL)
+            else:
+                def continuar(pagina: int) -> bool:
+                    return input(f"-- Página {pagina}: Enter para continuar, S para sair -- ").strip().upper() != "S"
+
+                if tamanho_pagina is None:
+                    tamanho_pagina = GeradorRelatorio.TAMANHO_PAGINA
+                paginas = gerador.escrever(sys.stdout, formato, tamanho_pagina, continuar if pausar else None)
+            # Na tela, CSV e JSON saem sem linhas extras para poderem ser redirecionados
+            if saida or formato == "texto":
+                contadores = self.gerenciador_torneio.visoes.contadores()
+                print(f"\nVisões do relatório: {contadores['acertos'] - anteriores['acertos']} acerto(s) e "
+                      f"{contadores['faltas'] - anteriores['faltas']} falta(s) neste relatório; "
+                      f"{contadores['invalidacoes']} invalidação(ões) desde o carregamento.")
+            return paginas
+        except (ValueError, OSError) as e:
+            print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
+            return None
+
     def gerar_relatorio(self):
         try:
             filtro_torneio = input("Filtrar por torneio (deixe em branco para mostrar todos): ").strip()
             filtro_status = input("Filtrar por status [ATIVO/INATIVO/TODOS] (padrão: TODOS): ").strip().upper()
-            if filtro_status not in ["ATIVO", "INATIVO", "TODOS", ""]:
-                filtro_status = "TODOS"
-            
-            print(Fore.GREEN + "\n=== Relatório do Sistema de Torneios Commander ===" + Style.RESET_ALL)
-            
-            print(Fore.CYAN + "\nJuízes Cadastrados:" + Style.RESET_ALL)
-            if not self.gerenciador_cadastros.juizes:
-                print("  Nenhum juiz cadastrado.")
-            else:
-                for juiz in self.gerenciador_cadastros.juizes:
-                    print(f"  - {juiz.nome} ({juiz.email})")
-            
-            print(Fore.CYAN + "\nTorneios:" + Style.RESET_ALL)
-            torneios_filtrados = self.gerenciador_torneio.torneios
-            if filtro_torneio:
-                torneios_filtrados = [t for t in torneios_filtrados if filtro_torneio.lower() in t.nome.lower()]
-            
-            if not torneios_filtrados:
-                print("  Nenhum torneio encontrado com o filtro aplicado.")
-            else:
-                for torneio in torneios_filtrados:
-                    status = "Inscrições Abertas" if torneio.inscricoes_abertas else "Inscrições Finalizadas"
-                    if not torneio.inscricoes_abertas:
-                        status += f" ({'Concluído' if torneio.rodada_atual >= torneio.rodadas else 'Em Andamento, Rodada ' + str(torneio.rodada_atual)})"
-                    
-                    ativo = torneio.inscricoes_abertas or torneio.rodada_atual < torneio.rodadas
-                    if filtro_status == "ATIVO" and not ativo:
-                        continue
-                    if filtro_status == "INATIVO" and ativo:
-                        continue
-                    
-                    num_mesas = len(torneio.jogadores) // 4 + (1 if len(torneio.jogadores) % 4 == 3 else 0) if torneio.jogadores else 0
-                    print(Fore.YELLOW + f"\n  Torneio: {torneio.nome}" + Style.RESET_ALL)
-                    print(f"    Data de Criação: {torneio.data.strftime('%d/%m/%Y %H:%M')}")
-                    print(f"    Status: {status}")
-                    print(f"    Mínimo de Jogadores: {torneio.min_jogadores}")
-                    print(f"    Jogadores Inscritos: {len(torneio.jogadores)}")
-                    print(f"    Rodadas: {torneio.rodadas}")
-                    print(f"    Mesas: {num_mesas}")
-                    print("    Jogadores e Decks:")
-                    if not torneio.jogadores:
-                        print("      Nenhum jogador inscrito.")
-                    else:
-                        for jogador in torneio.jogadores:
-                            deck = next((d for d in jogador.decks if d.torneio == torneio), None)
-                            deck_info = deck.comandante if deck else "Sem deck associado"
-                            print(f"      - {jogador.nome} ({jogador.email}): Deck {deck_info}")
-                    print("    Estatísticas do Torneio:")
-                    if torneio.jogadores:
-                        media_id = Utilitarios.calcular_media_ids(torneio.jogadores)
-                        comandantes = [d.comandante for j in torneio.jogadores for d in j.decks if d.torneio == torneio]
-                        print(f"      Média de ID: {media_id:.2f}")
-                        print(f"      Comandantes utilizados: {', '.join(set(comandantes)) if comandantes else 'Nenhum'}")
-            
-            print(Fore.CYAN + "\nJogadores Cadastrados:" + Style.RESET_ALL)
-            if not self.gerenciador_cadastros.jogadores:
-                print("  Nenhum jogador cadastrado.")
-            else:
-                for jogador in self.gerenciador_cadastros.jogadores:
-                    print(Fore.YELLOW + f"\n  Jogador: {jogador.nome} ({jogador.email})" + Style.RESET_ALL)
-                    print("    Decks:")
-                    if not jogador.decks:
-                        print("      Nenhum deck cadastrado.")
-                    else:
-                        for deck in jogador.decks:
-                            status = "Ativo" if deck.ativo else "Inativo"
-                            torneio_info = deck.torneio.nome if deck.torneio else "Não associado a torneio"
-                            print(f"      - {deck.comandante} (Torneio: {torneio_info}, Status: {status})")
-                    print("    Torneios Participados/Participando:")
-                    torneios_jogador = [t for t in self.gerenciador_torneio.torneios if jogador in t.jogadores]
-                    if not torneios_jogador:
-                        print("      Nenhum torneio.")
-                    else:
-                        for t in torneios_jogador:
-                            status = "Inscrições Abertas" if t.inscricoes_abertas else ("Concluído" if t.rodada_atual >= t.rodadas else f"Em Andamento, Rodada {t.rodada_atual}")
-                            print(f"      - {t.nome} ({status})")
-                    print("    Visão Individual:")
-                    if not jogador.historico_partidas:
-                        print("      Nenhuma partida registrada.")
-                    else:
-                        winrate = (jogador.vitorias_isoladas / len(jogador.historico_partidas)) * 100 if jogador.historico_partidas else 0
-                        print(f"      Vitórias Isoladas: {jogador.vitorias_isoladas}")
-                        print(f"      Winrate: {winrate:.2f}%")
-                        print(f"      Índice de Desempenho Total: {jogador.indice_desempenho:.2f}")
-                        print("      Histórico de Partidas:")
-                        for partida in jogador.historico_partidas:
-                            id_partida = partida.pontuacoes.get(jogador.id, 0)
-                            resultado = "Desconhecido"
-                            for jid, dados in partida.pontuacoes.items():
-                                if jid == jogador.id:
-                                    resultado = dados["resultado"] if isinstance(dados, dict) and "resultado" in dados else "Desconhecido"
-                            print(f"        - Mesa com {', '.join(j.nome for j in partida.jogadores)}: ID {id_partida:.2f} ({resultado})")
-                            print("          Eliminações:")
-                            for e in partida.eliminacoes:
-                                if e.jogador_causador == jogador:
-                                    print(f"            Eliminou {e.jogador_eliminado.nome} no turno {e.turno}")
-                                elif e.jogador_eliminado == jogador:
-                                    causador = e.jogador_causador.nome if e.jogador_causador else "Auto-eliminação"
-                                    tipo = "Desistência" if e.desistiu else "Eliminação"
-                                    print(f"            {tipo} por {causador} no turno {e.turno}")
-        except ValueError as e:
-            print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
+            formato = input("Formato [TEXTO/CSV/JSON] (padrão: TEXTO): ").strip().lower() or "texto"
+            if formato not in GeradorRelatorio.FORMATOS:
+                formato = "texto"
+            saida = input("Arquivo de saída (deixe em branco para exibir na tela): ").strip() or None
+            # Pausa entre páginas apenas em um terminal; com a entrada redirecionada, o relatório sai inteiro
+            self.escrever_relatorio(filtro_torneio, filtro_status, formato, saida, pausar=sys.stdin.isatty() and sys.stdout.isatty())
         except Exception as e:
             print(Fore.RED + f"Erro inesperado ao gerar relatório: {e}" + Style.RESET_ALL)
 
     def executar(self):
         # Tenta carregar dados salvos anteriormente
-        dados_carregados = Persistencia.carregar_estado(self)
+        dados_carregados = self._carregar_estado()
         if dados_carregados:
             print(Fore.GREEN + "Dados do sistema carregados com sucesso!" + Style.RESET_ALL)
         
@@ -1478,24 +4985,76 @@ class SistemaTorneioCommander:
                 elif opcao == "13":
                     self.aplicar_penalidade()
                 elif opcao == "14":
-                    # Salva os dados antes de sair
-                    Persistencia.salvar_estado(self)
+                    self.selecionar_torneio()
+                elif opcao == "15":
+                    # Salva os dados antes de sair, incorporando o journal ao snapshot
+                    if self.banco:
+                        self.banco.fechar()
+                    else:
+                        Persistencia.compactar(self)
                     print(Fore.GREEN + "Dados do sistema salvos. Saindo do sistema. Até logo!" + Style.RESET_ALL)
                     break
                 else:
-                    print(Fore.RED + "Opção inválida. Escolha entre 1 e 14." + Style.RESET_ALL)
+                    print(Fore.RED + "Opção inválida. Escolha entre 1 e 15." + Style.RESET_ALL)
             except ValueError as e:
                 print(Fore.RED + f"Erro: {e}" + Style.RESET_ALL)
             except Exception as e:
                 print(Fore.RED + f"Erro inesperado: {e}" + Style.RESET_ALL)
             
-            # Salva os dados após cada operação
+            # Persiste os dados após cada operação
             try:
-                Persistencia.salvar_estado(self)
+                self._persistir_apos_operacao()
             except Exception as e:
                 print(Fore.YELLOW + f"Aviso: Não foi possível salvar o estado: {e}" + Style.RESET_ALL)
 
 
 if __name__ == "__main__":
-    sistema = SistemaTorneioCommander()
-    sistema.executar() 
+    parser = argparse.ArgumentParser(description="Sistema de Gerenciamento de Torneios Commander")
+    parser.add_argument(
+        "--persistencia", choices=["journal", "json", "sqlite"], default="journal",
+        help="formato de armazenamento do estado (padrão: journal)"
+    )
+    parser.add_argument("--processos", type=int, default=1, help="processos usados na busca de emparelhamento (padrão: 1)")
+    parser.add_argument("--semente", type=int, help="semente fixa para emparelhamentos reproduzíveis")
+    comandos = parser.add_subparsers(dest="comando")
+    importar = comandos.add_parser("importar", help="importa jogadores, decks e inscrições de um arquivo CSV ou JSONL")
+    importar.add_argument("arquivo", help="arquivo .csv (com cabeçalho) ou .jsonl com os campos nome, email, senha, comandante e torneio")
+    importar.add_argument("--torneio", help="torneio usado nas linhas sem o campo torneio")
+    resultados = comandos.add_parser("resultados", help="registra os resultados de uma rodada a partir de um arquivo JSON ou JSONL")
+    resultados.add_argument("arquivo", help="arquivo .json (lista de mesas) ou .jsonl (uma mesa por linha) com os resultados por email")
+    resultados.add_argument("--torneio", help="id ou nome do torneio (padrão: último torneio criado)")
+    colusao = comandos.add_parser("colusao", help="analisa eliminações e mesas de todos os torneios e gera a lista de revisão de colusão")
+    colusao.add_argument("--torneio", help="id ou nome de um torneio (padrão: todos os torneios)")
+    colusao.add_argument("--limite", type=int, default=20, help="itens da lista de revisão (padrão: 20)")
+    colusao.add_argument("--saida", help="arquivo .csv para gravar a lista de revisão")
+    relatorio = comandos.add_parser("relatorio", help="gera o relatório completo em texto, CSV ou JSON, na tela ou em um arquivo")
+    relatorio.add_argument("--formato", choices=GeradorRelatorio.FORMATOS, help="formato do relatório (padrão: extensão de --saida ou texto)")
+    relatorio.add_argument("--saida", help="arquivo de saída (padrão: tela)")
+    relatorio.add_argument("--torneio", default="", help="mostra apenas torneios cujo nome contém o texto")
+    relatorio.add_argument("--status", choices=["ATIVO", "INATIVO", "TODOS"], default="TODOS", help="filtra os torneios pelo status (padrão: TODOS)")
+    relatorio.add_argument("--tamanho-pagina", type=int, help="registros escritos por vez (padrão: 20 na tela, 100 em arquivo)")
+    historico = comandos.add_parser("historico", help="resume o histórico de partidas em colunas e o exporta para um arquivo .npz")
+    historico.add_argument("--saida", help="arquivo .npz para gravar as colunas (partidas, participações e eliminações)")
+    args = parser.parse_args()
+    sistema = SistemaTorneioCommander(modo_persistencia=args.persistencia)
+    sistema.gerenciador_torneio.emparelhamento = SistemaEmparelhamento(processos=args.processos, semente=args.semente)
+    if args.comando == "importar":
+        sistema._carregar_estado()
+        sistema.importar_cadastros(args.arquivo, args.torneio)
+    elif args.comando == "resultados":
+        sistema._carregar_estado()
+        sistema.registrar_resultados_lote(args.arquivo, args.torneio)
+    elif args.comando == "colusao":
+        sistema._carregar_estado()
+        sistema.analisar_colusao(args.torneio, args.limite, args.saida)
+    elif args.comando == "relatorio":
+        sistema._carregar_estado()
+        formato = args.formato or (GeradorRelatorio.formato_do_arquivo(args.saida) if args.saida else "texto")
+        sistema.escrever_relatorio(args.torneio, args.status, formato, args.saida, args.tamanho_pagina)
+    elif args.comando == "historico":
+        sistema._carregar_estado()
+        sistema.exportar_historico(args.saida)
+    else:
+        sistema.executar()
+    sistema.gerenciador_torneio.emparelhamento.fechar()
+
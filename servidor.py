@@ -0,0 +1,379 @@
+"""Serviço HTTP/JSON do Sistema de Torneios Commander.
+
+Expõe o GerenciadorTorneio e o GerenciadorCadastros para que os dispositivos
+dos juízes registrem eliminações e resultados ao mesmo tempo, em vez de
+esperarem na fila de um único terminal com o menu interativo. O servidor usa
+asyncio com conexões keep-alive; cada mesa tem sua própria trava, então
+envios de mesas diferentes não esperam uns pelos outros, e o início de rodada
+é serializado por torneio. O emparelhamento roda em uma thread separada para
+não bloquear o atendimento de outros torneios, e o registro de eliminações e
+resultados, que espera as travas de threads do núcleo, roda em um grupo de
+threads de mesas para que o laço de eventos nunca fique bloqueado.
+
+A persistência fica fora do caminho da requisição: as operações aplicadas em
+memória entram em uma fila e uma thread de gravação as registra em lotes no
+journal ou no banco SQLite. Uma resposta de sucesso indica que a operação foi
+aplicada ao estado; em uma queda, apenas as operações ainda na fila se perdem.
+Ao encerrar (Ctrl+C ou SIGTERM), a fila é esvaziada e o journal compactado.
+
+Rotas:
+    GET  /saude
+    GET  /torneios
+    POST /torneios/{torneio_id}/rodadas
+    GET  /torneios/{torneio_id}/partidas
+    POST /torneios/{torneio_id}/partidas/{partida_id}/eliminacoes
+         {"eliminado": email, "causador": email ou null, "turno": n, "desistiu": false}
+    POST /torneios/{torneio_id}/partidas/{partida_id}/resultados
+         {"resultados": [{"email", "resultado", "turno", "vida_final", "oponentes_danificados"}]}
+    GET  /torneios/{torneio_id}/classificacao?pagina=1&tamanho=20
+
+Uso:
+    python servidor.py [--host 127.0.0.1] [--porta 8080] [--persistencia journal|sqlite]
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import re
+import signal
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from colorama import Fore, Style
+
+from prototipo import (
+    Jogador, Partida, Persistencia, RegistroResultadosLote, SistemaEmparelhamento, SistemaTorneioCommander, Torneio, Utilitarios
+)
+
+
+class ErroHTTP(Exception):
+    """Erro de requisição com o código de status HTTP a devolver"""
+
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+
+class ServidorTorneios:
+    """Servidor HTTP/JSON assíncrono sobre o estado de um SistemaTorneioCommander"""
+
+    FRASES = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+    TAMANHO_MAXIMO_CORPO = 1 << 20
+    # Operações gravadas por escrita e limite da fila antes de as requisições esperarem a gravação
+    LOTE_PERSISTENCIA = 1000
+    FILA_MAXIMA = 10_000
+    # Threads que aplicam eliminações e resultados ao núcleo, uma mesa por vez cada
+    TRABALHADORES_MESAS = 8
+
+    ROTAS = [
+        ("GET", re.compile(r"^/saude$"), "_saude"),
+        ("GET", re.compile(r"^/torneios$"), "_listar_torneios"),
+        ("POST", re.compile(r"^/torneios/(?P<torneio_id>[^/]+)/rodadas$"), "_iniciar_rodada"),
+        ("GET", re.compile(r"^/torneios/(?P<torneio_id>[^/]+)/partidas$"), "_listar_partidas"),
+        ("POST", re.compile(r"^/torneios/(?P<torneio_id>[^/]+)/partidas/(?P<partida_id>[^/]+)/eliminacoes$"), "_registrar_eliminacao"),
+        ("POST", re.compile(r"^/torneios/(?P<torneio_id>[^/]+)/partidas/(?P<partida_id>[^/]+)/resultados$"), "_registrar_resultados"),
+        ("GET", re.compile(r"^/torneios/(?P<torneio_id>[^/]+)/classificacao$"), "_classificacao"),
+    ]
+
+    def __init__(self, sistema: SistemaTorneioCommander, host: str = "127.0.0.1", porta: int = 8080):
+        if sistema.modo_persistencia == "json":
+            raise ValueError("O servidor grava operações incrementais; use a persistência journal ou sqlite.")
+        self.sistema = sistema
+        self.host = host
+        self.porta = porta
+        self.travas_torneios: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.travas_partidas: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Uma thread de emparelhamento: SistemaEmparelhamento guarda o último resultado e não é reentrante
+        self.executor_emparelhamento = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="emparelhamento")
+        self.executor_persistencia = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="persistencia")
+        self.executor_mesas = concurrent.futures.ThreadPoolExecutor(self.TRABALHADORES_MESAS, thread_name_prefix="mesas")
+        self.fila_persistencia: Optional[asyncio.Queue] = None
+        self.requisicoes = 0
+        self.operacoes_gravadas = 0
+        self.falhas_gravacao = 0
+
+    # --- Ciclo de vida ---
+
+    async def servir(self, pronto: Optional[asyncio.Event] = None):
+        """Atende requisições até ser cancelado; ao sair, grava as operações pendentes"""
+        self.fila_persistencia = asyncio.Queue(self.FILA_MAXIMA)
+        gravador = asyncio.create_task(self._gravador())
+        servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = servidor.sockets[0].getsockname()[1]
+        print(f"Servidor ouvindo em http://{self.host}:{self.porta}", flush=True)
+        if pronto:
+            pronto.set()
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self._encerrar(gravador)
+
+    async def _encerrar(self, gravador: asyncio.Task):
+        await self.fila_persistencia.join()
+        gravador.cancel()
+        self.executor_emparelhamento.shutdown()
+        self.executor_mesas.shutdown()
+        self.executor_persistencia.shutdown()
+        if self.sistema.banco:
+            self.sistema.banco.fechar()
+        else:
+            Persistencia.compactar(self.sistema)
+        print(f"Servidor encerrado: {self.requisicoes} requisição(ões), {self.operacoes_gravadas} operação(ões) gravada(s).", flush=True)
+
+    # --- Persistência fora do caminho da requisição ---
+
+    async def _persistir(self, operacoes: List[Tuple[str, dict]]):
+        """Enfileira operações já aplicadas em memória para a thread de gravação"""
+        await self.fila_persistencia.put(operacoes)
+
+    async def _gravador(self):
+        """Junta as operações enfileiradas em lotes e as grava na thread de persistência"""
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = list(await self.fila_persistencia.get())
+            retirados = 1
+            while len(lote) < self.LOTE_PERSISTENCIA and not self.fila_persistencia.empty():
+                lote.extend(self.fila_persistencia.get_nowait())
+                retirados += 1
+            try:
+                await loop.run_in_executor(self.executor_persistencia, self.sistema._registrar_operacoes, lote)
+                self.operacoes_gravadas += len(lote)
+            except Exception as e:
+                self.falhas_gravacao += len(lote)
+                print(Fore.RED + f"Erro ao gravar {len(lote)} operação(ões): {e}" + Style.RESET_ALL, flush=True)
+            for _ in range(retirados):
+                self.fila_persistencia.task_done()
+
+    # --- HTTP ---
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atende as requisições de uma conexão, mantendo-a aberta entre elas (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                partes = linha.decode("latin-1").split()
+                cabecalhos = {}
+                while True:
+                    linha_cabecalho = await reader.readline()
+                    if linha_cabecalho in (b"\r\n", b"\n", b""):
+                        break
+                    nome, _, valor = linha_cabecalho.decode("latin-1").partition(":")
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+                manter = len(partes) == 3 and partes[2] == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+                tamanho = cabecalhos.get("content-length", "0")
+                if len(partes) != 3 or not tamanho.isdigit():
+                    status, resposta, manter = 400, {"erro": "Requisição malformada."}, False
+                elif int(tamanho) > self.TAMANHO_MAXIMO_CORPO:
+                    status, resposta, manter = 413, {"erro": "Corpo da requisição grande demais."}, False
+                else:
+                    corpo = await reader.readexactly(int(tamanho)) if int(tamanho) else b""
+                    status, resposta = await self._despachar(partes[0], partes[1], corpo)
+                self._responder(writer, status, resposta, manter)
+                await writer.drain()
+                if not manter:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _responder(self, writer: asyncio.StreamWriter, status: int, resposta: dict, manter: bool):
+        dados = json.dumps(resposta, ensure_ascii=False).encode("utf-8")
+        cabecalho = (
+            f"HTTP/1.1 {status} {self.FRASES[status]}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(dados)}\r\n"
+        )
+        if not manter:
+            cabecalho += "Connection: close\r\n"
+        writer.write((cabecalho + "\r\n").encode("latin-1") + dados)
+
+    async def _despachar(self, metodo: str, alvo: str, corpo: bytes) -> Tuple[int, dict]:
+        """Encaminha a requisição para a rota e converte erros em respostas JSON"""
+        self.requisicoes += 1
+        url = urlsplit(alvo)
+        caminho_encontrado = False
+        for metodo_rota, padrao, nome in self.ROTAS:
+            encontrado = padrao.match(url.path)
+            if not encontrado:
+                continue
+            caminho_encontrado = True
+            if metodo_rota != metodo:
+                continue
+            try:
+                dados = json.loads(corpo) if corpo else {}
+                if not isinstance(dados, dict):
+                    raise ValueError("O corpo deve ser um objeto JSON.")
+                parametros = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                return await getattr(self, nome)(dados=dados, parametros=parametros, **encontrado.groupdict())
+            except ErroHTTP as e:
+                return e.status, {"erro": str(e)}
+            except json.JSONDecodeError as e:
+                return 400, {"erro": f"JSON inválido: {e}"}
+            except ValueError as e:
+                return 400, {"erro": str(e)}
+            except Exception as e:
+                print(Fore.RED + f"Erro inesperado em {metodo} {url.path}: {e}" + Style.RESET_ALL, flush=True)
+                return 500, {"erro": "Erro interno do servidor."}
+        if caminho_encontrado:
+            return 405, {"erro": f"Método {metodo} não permitido em {url.path}."}
+        return 404, {"erro": f"Rota {url.path} não encontrada."}
+
+    # --- Rotas ---
+
+    def _torneio(self, torneio_id: str) -> Torneio:
+        torneio = self.sistema.gerenciador_torneio.buscar_torneio_por_id(torneio_id)
+        if not torneio:
+            raise ErroHTTP(404, f"Torneio {torneio_id} não encontrado.")
+        return torneio
+
+    def _partida(self, torneio: Torneio, partida_id: str) -> Partida:
+        try:
+            return self.sistema.gerenciador_torneio.buscar_partida(torneio, partida_id)
+        except ValueError as e:
+            raise ErroHTTP(404, str(e)) from None
+
+    def _jogador(self, email) -> Jogador:
+        jogador = self.sistema.gerenciador_cadastros.buscar_jogador(str(email or "").strip())
+        if not jogador:
+            raise ValueError(f"Jogador {email or 'sem email'} não encontrado.")
+        return jogador
+
+    @staticmethod
+    def _dados_partida(partida: Partida) -> dict:
+        return {
+            "id": partida.id,
+            "turno_atual": partida.turno_atual,
+            "jogadores": [{"id": j.id, "nome": j.nome, "email": j.email} for j in partida.jogadores],
+            "eliminados": [e.jogador_eliminado.email for e in partida.eliminacoes]
+        }
+
+    async def _saude(self, dados: dict, parametros: dict) -> Tuple[int, dict]:
+        return 200, {
+            "requisicoes": self.requisicoes,
+            "persistencia_pendente": self.fila_persistencia.qsize(),
+            "operacoes_gravadas": self.operacoes_gravadas,
+            "falhas_gravacao": self.falhas_gravacao
+        }
+
+    async def _listar_torneios(self, dados: dict, parametros: dict) -> Tuple[int, dict]:
+        return 200, {"torneios": [
+            {
+                "id": t.id,
+                "nome": t.nome,
+                "inscricoes_abertas": t.inscricoes_abertas,
+                "rodada_atual": t.rodada_atual,
+                "rodadas": t.rodadas,
+                "jogadores": len(t.jogadores),
+                "partidas_ativas": len(t.partidas_ativas)
+            }
+            for t in self.sistema.gerenciador_torneio.torneios
+        ]}
+
+    async def _iniciar_rodada(self, dados: dict, parametros: dict, torneio_id: str) -> Tuple[int, dict]:
+        torneio = self._torneio(torneio_id)
+        async with self.travas_torneios[torneio.id]:
+            def iniciar() -> Tuple[List[Partida], dict]:
+                partidas = self.sistema.gerenciador_torneio.iniciar_rodada(torneio)
+                # Serializado na mesma thread, antes que outra requisição altere o histórico
+                return partidas, {
+                    "torneio_id": torneio.id,
+                    "rodada_atual": torneio.rodada_atual,
+                    "partidas": [Persistencia._serializar_partida(p) for p in partidas],
+                    "historico_oponentes": Persistencia._serializar_historico(torneio.historico_oponentes)
+                }
+
+            loop = asyncio.get_running_loop()
+            partidas, operacao = await loop.run_in_executor(self.executor_emparelhamento, iniciar)
+            await self._persistir([("rodada", operacao)])
+        return 201, {"rodada": torneio.rodada_atual, "partidas": [self._dados_partida(p) for p in partidas]}
+
+    async def _listar_partidas(self, dados: dict, parametros: dict, torneio_id: str) -> Tuple[int, dict]:
+        torneio = self._torneio(torneio_id)
+        return 200, {"rodada": torneio.rodada_atual, "partidas": [self._dados_partida(p) for p in torneio.partidas_ativas]}
+
+    async def _registrar_eliminacao(self, dados: dict, parametros: dict, torneio_id: str, partida_id: str) -> Tuple[int, dict]:
+        torneio = self._torneio(torneio_id)
+        async with self.travas_partidas[partida_id]:
+            def registrar():
+                partida = self._partida(torneio, partida_id)
+                eliminado = self._jogador(dados.get("eliminado"))
+                causador = self._jogador(dados["causador"]) if dados.get("causador") else None
+                turno = RegistroResultadosLote._inteiro(dados.get("turno"), "turno", 1)
+                return partida, self.sistema.gerenciador_torneio.registrar_eliminacao(
+                    torneio, partida, eliminado, causador, turno, bool(dados.get("desistiu", False))
+                )
+
+            partida, eliminacao = await asyncio.get_running_loop().run_in_executor(self.executor_mesas, registrar)
+            await self._persistir([("eliminacao", {"partida_id": partida.id, **Persistencia._serializar_eliminacao(eliminacao)})])
+        return 201, self._dados_partida(partida)
+
+    async def _registrar_resultados(self, dados: dict, parametros: dict, torneio_id: str, partida_id: str) -> Tuple[int, dict]:
+        torneio = self._torneio(torneio_id)
+        gerenciador = self.sistema.gerenciador_torneio
+        async with self.travas_partidas[partida_id]:
+            def registrar():
+                partida = self._partida(torneio, partida_id)
+                partida, resultados = RegistroResultadosLote(self.sistema, torneio, [partida])._montar_resultados(1, dados, torneio)
+                return partida, gerenciador.registrar_resultados_mesa(torneio, partida, resultados), self.sistema._dados_resultado(partida)
+
+            partida, suspeitas, operacao = await asyncio.get_running_loop().run_in_executor(self.executor_mesas, registrar)
+            await self._persistir([("resultado", operacao)])
+        self.travas_partidas.pop(partida_id, None)
+        return 201, {
+            "partida_id": partida.id,
+            "pontuacoes": {j.email: partida.pontuacoes[j.id] for j in partida.jogadores},
+            "suspeitas": suspeitas,
+            "partidas_pendentes": len(torneio.partidas_ativas)
+        }
+
+    async def _classificacao(self, dados: dict, parametros: dict, torneio_id: str) -> Tuple[int, dict]:
+        torneio = self._torneio(torneio_id)
+        pagina = Utilitarios.validar_indice_numerico(parametros.get("pagina", "1"), 1, 10**9)
+        tamanho = Utilitarios.validar_indice_numerico(parametros.get("tamanho", "20"), 1, 1000)
+        inicio = (pagina - 1) * tamanho
+        desempate = self.sistema.gerenciador_torneio.desempate
+        return 200, {
+            "torneio": torneio.nome,
+            "rodada": torneio.rodada_atual,
+            "total": len(torneio.classificacao),
+            "jogadores": [
+                {
+                    "posicao": inicio + i,
+                    "nome": j.nome,
+                    "email": j.email,
+                    "indice_desempenho": j.indice_desempenho,
+                    "forca_oponentes": desempate.calcular_forca_oponentes(j),
+                    "vitorias_isoladas": j.vitorias_isoladas
+                }
+                for i, j in enumerate(torneio.classificacao.pagina(pagina, tamanho), 1)
+            ]
+        }
+
+
+async def _executar(servidor: ServidorTorneios):
+    tarefa = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, tarefa.cancel)
+    await servidor.servir()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviço HTTP/JSON para registro concorrente de resultados")
+    parser.add_argument("--host", default="127.0.0.1", help="endereço de escuta (padrão: 127.0.0.1)")
+    parser.add_argument("--porta", type=int, default=8080, help="porta de escuta; 0 escolhe uma porta livre (padrão: 8080)")
+    parser.add_argument("--persistencia", choices=["journal", "sqlite"], default="journal", help="formato de armazenamento do estado (padrão: journal)")
+    parser.add_argument("--semente", type=int, help="semente fixa para emparelhamentos reproduzíveis")
+    args = parser.parse_args()
+    sistema = SistemaTorneioCommander(modo_persistencia=args.persistencia)
+    sistema.gerenciador_torneio.emparelhamento = SistemaEmparelhamento(semente=args.semente)
+    sistema._carregar_estado()
+    try:
+        asyncio.run(_executar(ServidorTorneios(sistema, args.host, args.porta)))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,225 @@
+"""Simulador de torneios do Sistema de Torneios Commander.
+
+Cria jogadores e decks sintéticos, finaliza as inscrições e joga todas as
+rodadas com resultados e eliminações aleatórios, porém válidos, passando pelo
+emparelhamento, pelo processamento de resultados, pelo ranking e pela
+persistência. Cada fase é cronometrada e, opcionalmente, tem o pico de
+memória medido com tracemalloc. Com a mesma semente, a simulação é
+determinística: a assinatura do ranking final muda apenas se o comportamento
+de emparelhamento ou pontuação mudar.
+
+Uso:
+    python simulador.py
+    python simulador.py --jogadores 16 256 10000 --semente 7 --sem-memoria
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from prototipo import (
+    CalculadorIndiceDesempenho, Eliminacao, Jogador, Partida, Persistencia, SistemaEmparelhamento, SistemaTorneioCommander, Torneio
+)
+
+
+class SimuladorTorneio:
+    """Executa um torneio sintético completo e mede cada fase
+
+    Os resultados respeitam as mesmas regras da entrada interativa: o turno final
+    fica dentro dos turnos extras, o vencedor elimina ao menos um oponente e os
+    demais jogadores recebem DERROTA; nos empates, no máximo um jogador é
+    eliminado. A vida final das derrotas é no mínimo 1, pois derrotas com vida 0
+    em mesas de 3 ficam abaixo do limite mínimo de pontuação.
+    """
+
+    FASES = ("cadastro", "finalizacao", "emparelhamento", "resultados", "ranking", "salvar", "carregar")
+    PROBABILIDADE_VITORIA = 0.85
+
+    def __init__(self, num_jogadores: int, semente: int = 42, medir_memoria: bool = True, max_iteracoes: int = 20000):
+        self.num_jogadores = num_jogadores
+        self.semente = semente
+        self.medir_memoria = medir_memoria
+        self.rng = random.Random(semente)
+        self.sistema = SistemaTorneioCommander(modo_persistencia="json")
+        # Sem limite de tempo efetivo: a busca termina pelo número de iterações, o que a torna reproduzível
+        self.sistema.gerenciador_torneio.emparelhamento = SistemaEmparelhamento(
+            tempo_limite=float("inf"), max_iteracoes=max_iteracoes, semente=semente
+        )
+        self.tempos: Dict[str, float] = {fase: 0.0 for fase in self.FASES}
+        self.memoria: Dict[str, int] = {fase: 0 for fase in self.FASES}
+
+    @contextlib.contextmanager
+    def _fase(self, nome: str):
+        """Acumula o tempo da fase e o maior pico de memória alocado durante ela"""
+        if self.medir_memoria:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+        self.tempos[nome] += time.perf_counter() - inicio
+        if self.medir_memoria:
+            self.memoria[nome] = max(self.memoria[nome], tracemalloc.get_traced_memory()[1] - base)
+
+    def executar(self) -> Dict:
+        """Executa a simulação e retorna tempos, memória, assinatura e contagens"""
+        # A tabela de pontuação é construída uma vez por processo; fora da medição
+        # para que o primeiro tamanho simulado não pague esse custo
+        CalculadorIndiceDesempenho.tabela_pontuacao()
+        if self.medir_memoria:
+            tracemalloc.start()
+        try:
+            with self._fase("cadastro"):
+                torneio = self._cadastrar()
+            with self._fase("finalizacao"):
+                self._finalizar_inscricoes(torneio)
+            partidas = 0
+            while torneio.rodada_atual < torneio.rodadas:
+                with self._fase("emparelhamento"):
+                    self._iniciar_rodada(torneio)
+                with self._fase("resultados"):
+                    partidas += self._jogar_rodada(torneio)
+                with self._fase("ranking"):
+                    self.sistema.gerar_ranking()
+            ranking = torneio.classificacao.top(len(torneio.classificacao))
+            with tempfile.TemporaryDirectory() as diretorio:
+                caminho = os.path.join(diretorio, "dados_sistema.json")
+                with self._fase("salvar"):
+                    Persistencia.salvar_estado(self.sistema, caminho)
+                recarregado = SistemaTorneioCommander(modo_persistencia="json")
+                with self._fase("carregar"):
+                    Persistencia.carregar_estado(recarregado, caminho)
+            torneio_recarregado = recarregado.gerenciador_torneio.torneios[-1]
+            ranking_recarregado = torneio_recarregado.classificacao.top(len(torneio_recarregado.classificacao))
+        finally:
+            if self.medir_memoria:
+                tracemalloc.stop()
+        return {
+            "jogadores": self.num_jogadores,
+            "rodadas": torneio.rodadas,
+            "partidas": partidas,
+            "tempos": dict(self.tempos),
+            "memoria": dict(self.memoria) if self.medir_memoria else None,
+            "assinatura": self.assinatura(ranking),
+            "recarga_confere": [j.id for j in ranking] == [j.id for j in ranking_recarregado]
+        }
+
+    @staticmethod
+    def assinatura(ranking: List[Jogador]) -> str:
+        """Resumo do ranking final (nomes e IDs) usado para comparar versões"""
+        texto = "\n".join(f"{j.nome}:{j.indice_desempenho:.6f}:{j.vitorias_isoladas}" for j in ranking)
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()[:16]
+
+    def _cadastrar(self) -> Torneio:
+        cadastros = self.sistema.gerenciador_cadastros
+        gerenciador = self.sistema.gerenciador_torneio
+        torneio = gerenciador.configurar_torneio(f"Simulação {self.num_jogadores}", 4)
+        for i in range(self.num_jogadores):
+            jogador = Jogador(f"Jogador-{i}", f"jogador{i}@simulacao.com")
+            jogador.id = f"{self.semente}-{i}"
+            jogador.definir_senha("Senha123")
+            cadastros.adicionar_jogador(jogador)
+            deck = cadastros.cadastrar_deck(jogador, f"Comandante-{self.rng.randrange(500)}")
+            cadastros.validar_deck(deck, torneio)
+            gerenciador.inscrever_jogador(torneio, jogador, deck)
+            torneio.adicionar_jogador(jogador)
+        return torneio
+
+    def _finalizar_inscricoes(self, torneio: Torneio):
+        gerenciador = self.sistema.gerenciador_torneio
+        valido, mensagem = gerenciador.validar_distribuicao_mesas(len(torneio.jogadores))
+        if not valido:
+            raise ValueError(mensagem)
+        torneio.rodadas = gerenciador.calcular_rodadas(len(torneio.jogadores))
+        torneio.inscricoes_abertas = False
+
+    def _iniciar_rodada(self, torneio: Torneio):
+        self.sistema.gerenciador_torneio.iniciar_rodada(torneio)
+
+    def _jogar_rodada(self, torneio: Torneio) -> int:
+        gerenciador = self.sistema.gerenciador_torneio
+        partidas = list(torneio.partidas_ativas)
+        for partida in partidas:
+            resultados = self._sortear_resultados(partida, torneio)
+            gerenciador.processar_resultados(partida, resultados, torneio.anti_colusao, torneio)
+        return len(partidas)
+
+    def _sortear_resultados(self, partida: Partida, torneio: Torneio) -> Dict[str, dict]:
+        """Sorteia eliminações e resultados válidos para uma mesa e acrescenta as eliminações à partida"""
+        eliminacoes, resultados = self.sortear_mesa(partida, torneio, self.rng)
+        partida.eliminacoes.extend(eliminacoes)
+        return resultados
+
+    @staticmethod
+    def sortear_mesa(partida: Partida, torneio: Torneio, rng: random.Random) -> Tuple[List[Eliminacao], Dict[str, dict]]:
+        """Sorteia as eliminações e os resultados de uma mesa sem alterar a partida"""
+        jogadores = partida.jogadores
+        oponentes = len(jogadores) - 1
+        turno_maximo = partida.turno_atual + torneio.turnos_extras
+        turno_final = rng.randint(2, turno_maximo)
+        eliminacoes = []
+        resultados = {}
+
+        def derrota(jogador: Jogador, turno: int) -> dict:
+            return {"resultado": "DERROTA", "turno": turno, "eliminacoes": 0, "vida_final": rng.randint(1, 40), "oponentes_danificados": rng.randint(0, oponentes)}
+
+        if rng.random() < SimuladorTorneio.PROBABILIDADE_VITORIA:
+            vencedor = rng.choice(jogadores)
+            outros = [j for j in jogadores if j is not vencedor]
+            for eliminado in rng.sample(outros, rng.randint(1, oponentes)):
+                turno = rng.randint(1, turno_final)
+                eliminacoes.append(Eliminacao(eliminado, vencedor, turno))
+                resultados[eliminado.id] = derrota(eliminado, turno)
+            for jogador in outros:
+                resultados.setdefault(jogador.id, derrota(jogador, turno_final))
+            resultados[vencedor.id] = {
+                "resultado": "VITORIA", "turno": turno_final, "eliminacoes": 0,
+                "vida_final": rng.randint(1, 40), "oponentes_danificados": rng.randint(1, oponentes)
+            }
+        else:
+            ativos = list(jogadores)
+            if rng.random() < 0.5:
+                eliminado, causador = rng.sample(jogadores, 2)
+                turno = rng.randint(1, turno_final)
+                eliminacoes.append(Eliminacao(eliminado, causador, turno))
+                resultados[eliminado.id] = derrota(eliminado, turno)
+                ativos.remove(eliminado)
+            for jogador in ativos:
+                resultados[jogador.id] = {
+                    "resultado": "EMPATE", "turno": turno_final, "eliminacoes": 0,
+                    "vida_final": rng.randint(0, 40), "oponentes_danificados": rng.randint(0, oponentes)
+                }
+        return eliminacoes, resultados
+
+def simular(tamanhos: Optional[List[int]] = None, semente: int = 42, medir_memoria: bool = True) -> List[Dict]:
+    """Simula torneios de 16 a 10.000 jogadores e imprime tempos (s) e picos de memória (MB) por fase"""
+    tamanhos = tamanhos or [16, 64, 256, 1000, 4000, 10_000]
+    resultados = []
+    cabecalho = f"{'jogadores':>10} {'rodadas':>8} " + " ".join(f"{fase:>14}" for fase in SimuladorTorneio.FASES)
+    print(cabecalho + f" {'assinatura':>17} {'recarga':>8}")
+    for num_jogadores in tamanhos:
+        r = SimuladorTorneio(num_jogadores, semente, medir_memoria).executar()
+        colunas = []
+        for fase in SimuladorTorneio.FASES:
+            celula = f"{r['tempos'][fase]:.3f}"
+            if r["memoria"] is not None:
+                celula += f"/{r['memoria'][fase] / 2**20:.1f}"
+            colunas.append(f"{celula:>14}")
+        print(f"{num_jogadores:>10} {r['rodadas']:>8} " + " ".join(colunas) + f" {r['assinatura']:>17} {'ok' if r['recarga_confere'] else 'DIVERGE':>8}")
+        resultados.append(r)
+    return resultados
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulação de torneios completos com tempos e memória por fase")
+    parser.add_argument("--jogadores", type=int, nargs="+", help="tamanhos de torneio (padrão: 16 64 256 1000 4000 10000)")
+    parser.add_argument("--semente", type=int, default=42, help="semente dos dados sintéticos e do emparelhamento (padrão: 42)")
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede memória (tracemalloc deixa a execução mais lenta)")
+    args = parser.parse_args()
+    simular(args.jogadores, args.semente, not args.sem_memoria)
@@ -0,0 +1,36 @@
+"""Testes dos índices do cadastro (python -m pytest)"""
+from prototipo import GerenciadorCadastros, Inscricao, Torneio
+
+
+def _cadastro_com_deck():
+    cadastros = GerenciadorCadastros()
+    jogador = cadastros.cadastrar_jogador("Ana", "ana@teste.com")
+    deck = cadastros.cadastrar_deck(jogador, "Atraxa")
+    torneio = Torneio("Etapa", 4)
+    assert cadastros.validar_deck(deck, torneio)
+    torneio.adicionar_jogador(jogador)
+    return cadastros, jogador, deck, torneio
+
+
+def _status(cadastros, jogador):
+    return {status: [d.comandante for d in cadastros.buscar_decks(jogador, status)] for status in GerenciadorCadastros.STATUS_DECK}
+
+
+def test_cancelar_inscricao_devolve_o_deck_aos_disponiveis():
+    cadastros, jogador, deck, torneio = _cadastro_com_deck()
+    assert _status(cadastros, jogador)["EM_USO"] == ["Atraxa"]
+    Inscricao(torneio, jogador, deck).cancelar()
+    assert _status(cadastros, jogador) == {"DISPONIVEL": ["Atraxa"], "EM_USO": [], "INATIVO": []}
+
+
+def test_concluir_inscricao_e_finalizar_torneio_desativam_o_deck():
+    cadastros, jogador, deck, torneio = _cadastro_com_deck()
+    Inscricao(torneio, jogador, deck).concluir()
+    assert _status(cadastros, jogador) == {"DISPONIVEL": [], "EM_USO": [], "INATIVO": ["Atraxa"]}
+
+    cadastros, jogador, deck, torneio = _cadastro_com_deck()
+    torneio.finalizar()
+    assert _status(cadastros, jogador) == {"DISPONIVEL": [], "EM_USO": [], "INATIVO": ["Atraxa"]}
+    # O índice mantido a cada alteração é o mesmo que a reconstrução completa produz
+    cadastros.reindexar()
+    assert _status(cadastros, jogador) == {"DISPONIVEL": [], "EM_USO": [], "INATIVO": ["Atraxa"]}
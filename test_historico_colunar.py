@@ -0,0 +1,99 @@
+"""Testes do registro de resultados com o histórico colunar (python -m pytest)"""
+import contextlib
+import io
+
+import pytest
+
+from prototipo import GerenciadorTorneio, Jogador, Partida, Torneio
+
+
+def _mesa():
+    gerenciador = GerenciadorTorneio()
+    torneio = Torneio("Etapa", 4)
+    jogadores = []
+    for i in range(4):
+        jogador = Jogador(f"Jogador-{i}", f"jogador{i}@teste.com")
+        torneio.adicionar_jogador(jogador)
+        jogadores.append(jogador)
+    partida = Partida(jogadores, torneio_id=torneio.id, rodada=1)
+    torneio.partidas_ativas.append(partida)
+    return gerenciador, torneio, partida
+
+
+def _empates(partida: Partida, **campos) -> dict:
+    dados = {"resultado": "EMPATE", "turno": 8, "eliminacoes": 0, "vida_final": 20, "oponentes_danificados": 1}
+    dados.update(campos)
+    return {j.id: dict(dados) for j in partida.jogadores}
+
+
+@pytest.mark.parametrize("campos", [{"turno": 40000}, {"vida_final": 40000}, {"oponentes_danificados": 300}, {"oponentes_danificados": 4}])
+def test_resultado_fora_do_intervalo_nao_altera_o_estado(campos):
+    gerenciador, torneio, partida = _mesa()
+    with pytest.raises(ValueError):
+        gerenciador.registrar_resultados_mesa(torneio, partida, _empates(partida, **campos))
+
+    assert not partida.concluida and partida in torneio.partidas_ativas
+    assert not partida.resultados and not partida.pontuacoes
+    assert all(j.indice_desempenho == 0 and not j.historico_partidas for j in partida.jogadores)
+    assert len(gerenciador.historico) == 0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        gerenciador.registrar_resultados_mesa(torneio, partida, _empates(partida))
+    assert partida.concluida and len(gerenciador.historico) == 1
+    assert all(j.historico_partidas == [partida] for j in partida.jogadores)
+
+
+def test_preparar_recusa_valor_que_nao_cabe_na_coluna():
+    gerenciador, _, partida = _mesa()
+    resultados = _empates(partida, turno=70000)
+    with pytest.raises(ValueError):
+        gerenciador.historico.preparar(partida, resultados, {j.id: 40.0 for j in partida.jogadores})
+    assert len(gerenciador.historico) == 0
+
+
+def test_partida_concluida_libera_a_trava_e_recusa_novo_envio():
+    gerenciador, torneio, partida = _mesa()
+    with contextlib.redirect_stdout(io.StringIO()):
+        gerenciador.registrar_resultados_mesa(torneio, partida, _empates(partida))
+    assert partida.trava is Partida.TRAVA_CONCLUIDA
+    with pytest.raises(ValueError):
+        gerenciador.registrar_resultados_mesa(torneio, partida, _empates(partida))
+    with pytest.raises(ValueError):
+        gerenciador.registrar_eliminacao(torneio, partida, partida.jogadores[0], None, 1)
+    assert len(gerenciador.historico) == 1
+
+
+def test_processar_rodada_recusa_partida_concluida_ou_de_outro_torneio():
+    gerenciador, torneio, partida = _mesa()
+    with contextlib.redirect_stdout(io.StringIO()):
+        gerenciador.registrar_resultados_mesa(torneio, partida, _empates(partida))
+    with pytest.raises(ValueError):
+        gerenciador.processar_rodada([(partida, _empates(partida))], torneio.anti_colusao)
+    assert all(len(j.historico_partidas) == 1 and j.num_oponentes == 3 for j in partida.jogadores)
+    assert len(gerenciador.historico) == 1
+
+    _, outro, estrangeira = _mesa()
+    with pytest.raises(ValueError):
+        gerenciador.processar_rodada([(estrangeira, _empates(estrangeira))], torneio.anti_colusao, torneio)
+    assert not estrangeira.concluida and estrangeira in outro.partidas_ativas
+
+
+def test_lote_conclui_as_partidas_antes_de_soltar_as_travas():
+    gerenciador, torneio, partida = _mesa()
+    vistas = []
+    # Ao soltar a trava da partida, um envio concorrente já deve vê-la concluída e fora das ativas
+    original = partida.trava
+
+    class Observada:
+        def __enter__(self):
+            return original.__enter__()
+
+        def __exit__(self, *erro):
+            vistas.append((partida.concluida, partida in torneio.partidas_ativas))
+            return original.__exit__(*erro)
+
+    partida.trava = Observada()
+    with contextlib.redirect_stdout(io.StringIO()):
+        gerenciador.processar_rodada([(partida, _empates(partida))], torneio.anti_colusao, torneio)
+    assert vistas == [(True, False)]
+    assert partida in torneio.partidas_concluidas
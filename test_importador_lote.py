@@ -0,0 +1,86 @@
+"""Testes da importação em lote de jogadores, decks e inscrições (python -m pytest)"""
+import json
+
+from prototipo import ImportadorLote, SistemaTorneioCommander
+
+
+def _importar(tmp_path, linhas):
+    sistema = SistemaTorneioCommander(modo_persistencia="json")
+    sistema.gerenciador_torneio.configurar_torneio("Etapa", 4)
+    gravadas = []
+    sistema._registrar_operacoes = gravadas.extend
+    caminho = tmp_path / "cadastros.csv"
+    caminho.write_text("nome,email,senha,comandante,torneio\n" + "".join(f"{linha}\n" for linha in linhas), encoding="utf-8")
+    relatorio = ImportadorLote(sistema).importar(str(caminho))
+    return sistema, relatorio, gravadas
+
+
+def test_linha_recusada_nao_cria_jogador_nem_deck(tmp_path):
+    sistema, relatorio, gravadas = _importar(tmp_path, [
+        "Ana,ana@x.com,Senha123,,Etapa",
+        "Bia,bia@x.com,Senha123,Atraxa,Etapa",
+        "Bia,bia@x.com,,Atraxa,Etapa",
+        "Caio,caio@x.com,Senha123,Atraxa,Outro",
+    ])
+    cadastros = sistema.gerenciador_cadastros
+
+    assert [e["linha"] for e in relatorio["erros"]] == [2, 4, 5]
+    assert cadastros.buscar_jogador("ana@x.com") is None
+    assert cadastros.buscar_jogador("caio@x.com") is None
+    assert [j.email for j in cadastros.jogadores] == ["bia@x.com"]
+    assert len(cadastros.decks) == 1
+    assert [tipo for tipo, _ in gravadas] == ["jogador", "deck", "inscricao"]
+    assert relatorio["jogadores_criados"] == 1 and relatorio["inscricoes"] == 1
+
+
+def test_senha_invalida_so_recusa_jogador_novo(tmp_path):
+    sistema, relatorio, _ = _importar(tmp_path, [
+        "Davi,davi@x.com,Senha123,Atraxa,",
+        "Davi,davi@x.com,,Kenrith,Etapa",
+        "Eva,eva@x.com,curta,Kenrith,Etapa",
+    ])
+
+    assert [e["linha"] for e in relatorio["erros"]] == [4]
+    assert sistema.gerenciador_cadastros.buscar_jogador("eva@x.com") is None
+    assert relatorio["jogadores_existentes"] == 1 and relatorio["inscricoes"] == 1
+
+
+def _importar_arquivo(tmp_path, nome, conteudo):
+    sistema = SistemaTorneioCommander(modo_persistencia="json")
+    sistema.gerenciador_torneio.configurar_torneio("Etapa", 4)
+    gravadas = []
+    sistema._registrar_operacoes = gravadas.extend
+    caminho = tmp_path / nome
+    caminho.write_text(conteudo, encoding="utf-8")
+    return sistema, ImportadorLote(sistema).importar(str(caminho)), gravadas
+
+
+def test_jsonl_com_linha_que_nao_e_objeto_recusa_so_a_linha(tmp_path):
+    sistema, relatorio, gravadas = _importar_arquivo(tmp_path, "cadastros.jsonl", "\n".join([
+        '{"nome": "Ana", "email": "ana@x.com", "senha": "Senha123"}',
+        '42',
+        '["x"]',
+        '{"nome": "Bia", "email": "bia@x.com", "senha": "Senha123", "comandante": "Atraxa", "torneio": "Etapa"}',
+    ]))
+
+    assert [(e["linha"], e["erro"]) for e in relatorio["erros"]] == [(2, "Linha não é um objeto JSON."), (3, "Linha não é um objeto JSON.")]
+    assert [j.email for j in sistema.gerenciador_cadastros.jogadores] == ["ana@x.com", "bia@x.com"]
+    assert [tipo for tipo, _ in gravadas] == ["jogador", "jogador", "deck", "inscricao"]
+
+
+def test_json_e_lido_como_lista_de_registros(tmp_path):
+    sistema, relatorio, _ = _importar_arquivo(tmp_path, "cadastros.json", json.dumps([
+        {"nome": "Ana", "email": "ana@x.com", "senha": "Senha123", "comandante": "Atraxa", "torneio": "Etapa"},
+        "texto",
+        {"nome": "Bia", "email": "bia@x.com", "senha": "Senha123"},
+    ]))
+
+    assert [e["linha"] for e in relatorio["erros"]] == [2]
+    assert relatorio["linhas"] == 3 and relatorio["jogadores_criados"] == 2 and relatorio["inscricoes"] == 1
+
+
+def test_arquivo_inexistente_exibe_erro_sem_excecao(tmp_path, capsys):
+    sistema = SistemaTorneioCommander(modo_persistencia="json")
+    sistema._persistir_apos_operacao = lambda: None
+    assert sistema.importar_cadastros(str(tmp_path / "nao_existe.csv")) is None
+    assert "Erro:" in capsys.readouterr().out
@@ -0,0 +1,30 @@
+"""Testes da persistência em SQLite (python -m pytest)"""
+import contextlib
+import io
+
+from prototipo import Jogador, PersistenciaSQLite, SistemaTorneioCommander
+
+
+def test_penalidade_fica_no_torneio_certo_com_nomes_repetidos(tmp_path):
+    sistema = SistemaTorneioCommander(modo_persistencia="json")
+    primeiro = sistema.gerenciador_torneio.configurar_torneio("Etapa", 4)
+    segundo = sistema.gerenciador_torneio.configurar_torneio("Etapa", 4)
+    jogador = Jogador("Ana", "ana@teste.com")
+    sistema.gerenciador_cadastros.adicionar_jogador(jogador)
+    for torneio in (primeiro, segundo):
+        torneio.adicionar_jogador(jogador)
+    segundo.anti_colusao.aplicar_penalidade(jogador, "ADVERTENCIA", segundo)
+    assert jogador.penalidades[-1]["torneio_id"] == segundo.id
+
+    banco = PersistenciaSQLite(str(tmp_path / "dados.db"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        banco.salvar_estado(sistema)
+    linhas = banco.conexao.execute("SELECT torneio_id, tipo FROM penalidades").fetchall()
+    assert [tuple(linha) for linha in linhas] == [(segundo.id, "ADVERTENCIA")]
+
+    recarregado = SistemaTorneioCommander(modo_persistencia="json")
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert banco.carregar_estado(recarregado)
+    banco.fechar()
+    penalidades = recarregado.gerenciador_cadastros.buscar_jogador("ana@teste.com").penalidades
+    assert [(p["torneio_id"], p["tipo"]) for p in penalidades] == [(segundo.id, "ADVERTENCIA")]
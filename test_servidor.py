@@ -0,0 +1,60 @@
+"""Testes do serviço HTTP/JSON sem abrir conexões (python -m pytest)"""
+import asyncio
+import contextlib
+import io
+import threading
+
+from prototipo import Jogador, SistemaTorneioCommander
+from servidor import ServidorTorneios
+
+
+def test_registro_de_resultados_nao_bloqueia_o_laco_de_eventos():
+    sistema = SistemaTorneioCommander(modo_persistencia="journal")
+    torneio = sistema.gerenciador_torneio.configurar_torneio("Etapa", 4)
+    for i in range(4):
+        jogador = Jogador(f"Jogador-{i}", f"jogador{i}@teste.com")
+        sistema.gerenciador_cadastros.adicionar_jogador(jogador)
+        torneio.adicionar_jogador(jogador)
+    torneio.rodadas = sistema.gerenciador_torneio.calcular_rodadas(len(torneio.jogadores))
+    torneio.inscricoes_abertas = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        partida = sistema.gerenciador_torneio.iniciar_rodada(torneio)[0]
+    servidor = ServidorTorneios(sistema)
+    operacoes = []
+
+    async def persistir(novas):
+        operacoes.extend(novas)
+    servidor._persistir = persistir
+    dados = {"resultados": [
+        {"email": j.email, "resultado": "EMPATE", "turno": 5, "vida_final": 20, "oponentes_danificados": 1}
+        for j in partida.jogadores
+    ]}
+
+    async def cenario():
+        # Outra thread segura a trava do torneio, como faz o emparelhamento de uma rodada
+        liberar = threading.Event()
+        segurando = threading.Event()
+
+        def segurar():
+            with torneio.trava:
+                segurando.set()
+                liberar.wait(5)
+        threading.Thread(target=segurar, daemon=True).start()
+        segurando.wait(5)
+        registro = asyncio.ensure_future(servidor._registrar_resultados(dados, {}, torneio.id, partida.id))
+        inicio = asyncio.get_running_loop().time()
+        await asyncio.sleep(0.05)
+        # O laço continuou atendendo enquanto o registro esperava a trava
+        assert asyncio.get_running_loop().time() - inicio < 1 and not registro.done()
+        liberar.set()
+        return await asyncio.wait_for(registro, 5)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            status, corpo = asyncio.run(cenario())
+    finally:
+        servidor.executor_mesas.shutdown()
+        servidor.executor_emparelhamento.shutdown()
+        servidor.executor_persistencia.shutdown()
+    assert status == 201 and corpo["partidas_pendentes"] == 0
+    assert [tipo for tipo, _ in operacoes] == ["resultado"]
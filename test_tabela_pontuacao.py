@@ -0,0 +1,23 @@
+"""Testes da tabela de pontuação pré-calculada contra a fórmula (python -m pytest)"""
+import itertools
+
+from prototipo import CalculadorIndiceDesempenho as Calc
+
+
+def test_conferir_tabela_cobre_todo_o_dominio():
+    assert Calc.conferir_tabela() == 86592
+
+
+def test_tabela_igual_a_formula_chave_a_chave():
+    ids, validos = Calc.tabela_pontuacao()
+    assert ids.size == validos.size == 86592
+    for resultado, turno, eliminacoes, vida, danificados, mesa in Calc.chaves_tabela():
+        indice = (Calc.CODIGOS_RESULTADO[resultado], turno, eliminacoes, vida, danificados, mesa - Calc.MESA_MINIMA_TABELA)
+        esperado = Calc.calcular_pontuacao(resultado, turno, eliminacoes, vida, danificados, mesa)
+        assert (ids.item(indice), validos.item(indice)) == esperado, (resultado, turno, eliminacoes, vida, danificados, mesa)
+
+
+def test_consulta_fora_do_dominio_usa_a_formula():
+    entradas = itertools.product(Calc.CODIGOS_RESULTADO, (21, 22, 35, 500), (0, 3, 4), (40, 41, 120), (0, 3, 5), (3, 4))
+    for entrada in entradas:
+        assert Calc.consultar_pontuacao(*entrada) == Calc.calcular_pontuacao(*entrada), entrada